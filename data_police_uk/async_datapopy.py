@@ -0,0 +1,253 @@
+
+import asyncio, functools, inspect, weakref
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from .datapopy import DataPoliceUK, DataForForce, CrimesData, Neighborhoods, StopAndSearches
+
+from typing import Optional,List,Union,Dict,Any,Callable,Iterable,AsyncIterator,Tuple
+
+_DONE = object()
+
+
+class _AsyncCall:
+    """
+    A pending client call: `await` it for the result, or `async for` over it when the
+    method returns a generator (`iter_months`, `stream=True`, ...).
+    """
+    def __init__(self, owner:"AsyncDataPoliceUK", name:str, args:tuple, kwargs:dict):
+        self._owner = owner
+        self._name = name
+        self._args = args
+        self._kwargs = kwargs
+
+    async def _result(self):
+        func = getattr(await self._owner.get_client(), self._name)
+        return await self._owner._call(func, *self._args, **self._kwargs)
+
+    def __await__(self):
+        return self._result().__await__()
+
+    async def __aiter__(self):
+        result = await self._result()
+        if not hasattr(result, "__aiter__"):
+            raise TypeError(f"{self._name}() does not return an iterator; await it instead")
+        async for item in result:
+            yield item
+
+
+class AsyncDataPoliceUK:
+    """
+    Asyncio wrapper around `DataPoliceUK`.
+
+    Every public method and property of the wrapped client is exposed under the same
+    name but returns an awaitable. Calls run on a bounded worker pool over the shared
+    pooled transport, so at most `max_concurrency` requests are in flight at once.
+
+    Methods that return generators (`iter_months`, `iter_*_for_months`,
+    `iter_neighborhood_boundaries`, `iter_response`, anything called with `stream=True`)
+    become async iterators: each item is pulled on the worker pool, so the blocking
+    requests behind it never run on the event loop.
+
+    The synchronous client is built lazily on the worker pool, so creating the wrapper
+    inside a running event loop never blocks it.
+
+    params
+    max_concurrency : Maximum number of requests in flight. Defaults to 32, the pool size
+                      of the default transport; raise both together.
+    *args, **kwargs : Passed on to the wrapped synchronous client.
+
+    Example
+        async with AsyncCrimesData(max_concurrency=32) as crimes:
+            results = await crimes.map("get_all_street_level_crimes",
+                                       [dict(lat=lat, lng=lng, year="2024", month="01") for lat, lng in points])
+    """
+    _client_class = DataPoliceUK
+
+    def __init__(self, *args, max_concurrency:int=32, **kwargs):
+        self.max_concurrency = max_concurrency
+        self._client_args = (args, kwargs)
+        self._client = None
+        self._client_future = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix=self.__class__.__name__)
+        # One semaphore per event loop, dropped with the loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @classmethod
+    async def create(cls, *args, **kwargs)->"AsyncDataPoliceUK":
+        """
+        Build the wrapper and its synchronous client without blocking the event loop
+        (the client's constructor makes requests, e.g. to validate the force ID).
+        """
+        self = cls(*args, **kwargs)
+        await self.get_client()
+        return self
+
+    def _build_client(self)->DataPoliceUK:
+        args, kwargs = self._client_args
+        client = self._client_class(*args, **kwargs)
+        pool_maxsize = getattr(client._transport, "pool_maxsize", None)
+        if pool_maxsize and pool_maxsize < self.max_concurrency:
+            client._logger.warning(
+                f"max_concurrency ({self.max_concurrency}) exceeds the transport pool size ({pool_maxsize}); "
+                "extra connections will not be kept alive"
+            )
+        self._client = client
+        return client
+
+    async def get_client(self)->DataPoliceUK:
+        """The wrapped synchronous client, built on the worker pool on first use."""
+        if self._client is not None:
+            return self._client
+        if self._client_future is None:
+            self._client_future = self._executor.submit(self._build_client)
+        future = self._client_future
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception:
+            # Let the next call try again instead of re-raising a stale failure
+            if self._client_future is future:
+                self._client_future = None
+            raise
+
+    @property
+    def client(self)->DataPoliceUK:
+        """
+        The wrapped synchronous client. Building it blocks, so inside a running loop
+        prefer `await get_client()`, `create()` or `async with`.
+        """
+        if self._client is None:
+            if self._client_future is None:
+                self._client_future = self._executor.submit(self._build_client)
+            self._client_future.result()
+        return self._client
+
+    def _get_semaphore(self)->asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def _run(self, func:Callable, *args, **kwargs):
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _iterate(self, iterator:Iterator)->AsyncIterator[Any]:
+        """Pull the items of a blocking iterator one at a time on the worker pool."""
+        try:
+            while True:
+                item = await self._run(next, iterator, _DONE)
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await asyncio.get_running_loop().run_in_executor(self._executor, close)
+
+    async def _call(self, func:Callable, *args, **kwargs):
+        """Run `func` on the worker pool; a returned iterator is handed back as an async iterator."""
+        result = await self._run(func, *args, **kwargs)
+        return self._iterate(result) if isinstance(result, Iterator) else result
+
+    def __getattr__(self, name:str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = inspect.getattr_static(self._client_class, name, None)
+        if isinstance(attr, property):
+            async def get_property():
+                return await self._run(getattr, await self.get_client(), name)
+            return get_property()
+        if callable(attr):
+            @functools.wraps(attr)
+            def method(*args, **kwargs):
+                return _AsyncCall(self, name, args, kwargs)
+            return method
+        if self._client is None:
+            raise AttributeError(f"{name!r} is an attribute of the client instance; "
+                                 "await get_client() (or use `async with`) before reading it")
+        return getattr(self._client, name)
+
+    async def _resolve(self, method:Union[str,Callable])->Callable:
+        return getattr(await self.get_client(), method) if isinstance(method, str) else method
+
+    @staticmethod
+    def _call_args(item:Any)->Tuple[tuple,dict]:
+        if isinstance(item, dict):
+            return (), item
+        if isinstance(item, (tuple, list)):
+            return tuple(item), {}
+        return (item,), {}
+
+    async def gather(self, *calls, return_exceptions:bool=False)->List[Any]:
+        """
+        Await several calls at once, e.g.
+            await client.gather(client.get_data_for_force(), client.get_all_senior_officers())
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def map(self,
+                  method:Union[str,Callable],
+                  items:Iterable[Any],
+                  return_exceptions:bool=False)->List[Any]:
+        """
+        Call `method` once per item concurrently and return results in input order.
+
+        params
+        method : Name of a client method (e.g. "get_neighborhood_boundary") or a callable.
+        items : Per-call arguments; a dict is passed as keyword arguments,
+                a tuple/list as positional arguments, anything else as a single argument.
+        return_exceptions : Return exceptions in place of results instead of raising.
+        """
+        func = await self._resolve(method)
+        calls = []
+        for item in items:
+            args, kwargs = self._call_args(item)
+            calls.append(self._call(func, *args, **kwargs))
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def iter_map(self,
+                       method:Union[str,Callable],
+                       items:Iterable[Any])->AsyncIterator[Tuple[Any,Any,Optional[BaseException]]]:
+        """
+        Like `map`, but yields `(item, result, error)` tuples as each call completes.
+        """
+        func = await self._resolve(method)
+
+        async def call(item):
+            args, kwargs = self._call_args(item)
+            try:
+                return item, await self._call(func, *args, **kwargs), None
+            except Exception as e:
+                return item, None, e
+
+        for future in asyncio.as_completed([call(item) for item in items]):
+            yield await future
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        await self.get_client()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+class AsyncDataForForce(AsyncDataPoliceUK):
+    _client_class = DataForForce
+
+
+class AsyncCrimesData(AsyncDataPoliceUK):
+    _client_class = CrimesData
+
+
+class AsyncNeighborhoods(AsyncDataPoliceUK):
+    _client_class = Neighborhoods
+
+
+class AsyncStopAndSearches(AsyncDataPoliceUK):
+    _client_class = StopAndSearches
@@ -1,50 +1,404 @@
 
-import json, re, datetime, shapely, geopandas as gpd
+import json, re, datetime, threading, itertools, time, requests, shapely, numpy as np, geopandas as gpd
 from pathlib import Path
-import sys
-pardir = Path(__file__).resolve().parent
-if str(pardir) not in sys.path:
-    sys.path.insert(0, str(pardir))
-from utils.response import Response
-from utils.strings_and_lists import ListOperations
-from utils.log_helper import BasicLogger
+from .utils.response import Response, Transport, get_transport
+from .utils.retry import RetryPolicy, RequestFailed, HTTPStatusError, RetriesExhausted, DeadlineExceeded
+from .utils.cache import ResponseCache, REFERENCE_CACHE
+from .utils.concurrency import map_concurrently
+from .utils.json_stream import iter_json_array
+from .utils.records import ColumnarRecords, CrimeRecords, OutcomeRecords, StopSearchRecords
+from .utils.locator import NeighborhoodLocator
+from .utils.strings_and_lists import ListOperations
+from .utils.log_helper import BasicLogger
 
-from typing import Optional,List,Union,Dict,Any
+from typing import Optional,List,Union,Dict,Any,Callable,Iterable,Iterator,Tuple
 
 class NeighborhoodNotFound(Exception):
     pass
 
+def _poly_coordinates(bounding_box:Union[str, List[str], List[float], shapely.geometry.Polygon])->List[Tuple[float,float]]:
+    """
+    Coordinates of a custom area as (lat, lng) pairs. Accepts a `lat,lng:lat,lng` string, a list
+    of "lat,lng" strings, a list of (lat, lng) pairs or a shapely Polygon in lng/lat order.
+    """
+    if isinstance(bounding_box, shapely.geometry.Polygon):
+        return [(y, x) for x, y in bounding_box.exterior.coords]
+    if isinstance(bounding_box, str):
+        bounding_box = bounding_box.split(":")
+    coordinates = []
+    for point in bounding_box:
+        if isinstance(point, str):
+            point = point.split(",")
+        lat, lng = point
+        coordinates.append((float(lat), float(lng)))
+    return coordinates
+
+def format_poly(bounding_box:Union[str, List[str], List[float], shapely.geometry.Polygon])->str:
+    """
+    Render a custom area as the `lat,lng:lat,lng:...` string the API's `poly` parameter expects.
+    """
+    if isinstance(bounding_box, str):
+        return bounding_box
+    return ":".join(f"{round(lat, 6)},{round(lng, 6)}" for lat, lng in _poly_coordinates(bounding_box))
+
+def _parse_month(month:Union[str,datetime.date,Tuple[Union[str,int],Union[str,int]]])->Tuple[int,int]:
+    if isinstance(month, (datetime.date, datetime.datetime)):
+        return month.year, month.month
+    if isinstance(month, str):
+        year, month = month.split("-")[:2]
+    else:
+        year, month = month
+    return int(year), int(month)
+
+def month_range(start:Union[str,datetime.date,Tuple[Union[str,int],Union[str,int]]],
+                end:Union[str,datetime.date,Tuple[Union[str,int],Union[str,int]]])->List[str]:
+    """
+    Every month from `start` to `end` inclusive as "YYYY-MM" strings.
+    Months may be given as "YYYY-MM", (year, month) or a date.
+    """
+    year, month = _parse_month(start)
+    end_year, end_month = _parse_month(end)
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+def poly_to_polygon(bounding_box:Union[str, List[str], List[float], shapely.geometry.Polygon])->shapely.geometry.Polygon:
+    """
+    Convert a custom area to a shapely Polygon in lng/lat order.
+    """
+    if isinstance(bounding_box, shapely.geometry.Polygon):
+        return bounding_box
+    return shapely.geometry.Polygon([(lng, lat) for lat, lng in _poly_coordinates(bounding_box)])
+
+def boundary_to_coordinates(boundary:Optional[List[Dict[str,Any]]])->np.ndarray:
+    """
+    Decode a neighbourhood boundary payload (`[{"latitude": ..., "longitude": ...}, ...]`)
+    into a contiguous `(n, 2)` float64 array of `(lng, lat)` vertices in a single pass.
+    """
+    boundary = boundary or []
+    coordinates = np.fromiter(itertools.chain.from_iterable((x["longitude"], x["latitude"]) for x in boundary),
+                              dtype=np.float64, count=2 * len(boundary))
+    return coordinates.reshape(-1, 2)
+
+def coordinates_to_polygon(coordinates:np.ndarray,
+                           simplify_tolerance:Optional[float]=None)->Optional[shapely.geometry.Polygon]:
+    """
+    Build a polygon from an `(n, 2)` vertex array, optionally simplified with a
+    topology-preserving tolerance in degrees (0.0001 is roughly 10 metres).
+    Returns None when there are too few vertices for a ring.
+    """
+    if len(coordinates) < 3:
+        return None
+    polygon = shapely.polygons(coordinates)
+    if simplify_tolerance:
+        polygon = shapely.simplify(polygon, simplify_tolerance, preserve_topology=True)
+    return polygon
+
+class AvailabilityPlanner:
+    """
+    Index of the `/crimes-street-dates` availability matrix: for each month, the forces
+    that published stop-and-search data.
+
+    Used to drop (force, month) requests that are guaranteed to come back empty before
+    any network traffic. `avoided` counts the requests pruned so far.
+
+    params
+    available_datasets : The `ALL_AVAILABLE_DATASETS` payload.
+    """
+    def __init__(self, available_datasets:Optional[List[Dict[str,Any]]]):
+        self._forces_by_month = {
+            x.get("date") : frozenset(x.get("stop-and-search") or []) for x in (available_datasets or []) if x.get("date")
+        }
+        self._months_by_force = {}
+        for month, forces in self._forces_by_month.items():
+            for force_id in forces:
+                self._months_by_force.setdefault(force_id, set()).add(month)
+        self._lock = threading.Lock()
+        self.avoided = 0
+        self.allowed = 0
+
+    @property
+    def KNOWN(self)->bool:
+        """False when the availability matrix is empty, e.g. because it could not be fetched."""
+        return bool(self._forces_by_month)
+
+    @property
+    def MONTHS(self)->List[str]:
+        return sorted(self._forces_by_month)
+
+    @property
+    def FORCES(self)->List[str]:
+        return sorted(self._months_by_force)
+
+    def months_for_force(self, force_id:str)->List[str]:
+        """Months in which `force_id` published stop-and-search data."""
+        return sorted(self._months_by_force.get(force_id, ()))
+
+    def forces_for_month(self, month:str)->List[str]:
+        """Forces that published stop-and-search data for `month` ("YYYY-MM")."""
+        return sorted(self._forces_by_month.get(month, ()))
+
+    def has_stop_searches(self, force_id:str, month:str)->bool:
+        return force_id in self._forces_by_month.get(month, ())
+
+    def check(self, force_id:str, month:str)->bool:
+        """Like `has_stop_searches`, but counts the outcome towards `avoided`/`allowed`."""
+        available = self.has_stop_searches(force_id, month)
+        with self._lock:
+            if available:
+                self.allowed += 1
+            else:
+                self.avoided += 1
+        return available
+
+    def plan(self,
+             force_ids:Iterable[str],
+             months:Iterable[str])->List[Tuple[str,str]]:
+        """
+        The (force_id, month) pairs worth requesting out of every combination of
+        `force_ids` and `months`.
+        """
+        return [(force_id, month) for force_id in force_ids for month in months if self.check(force_id, month)]
+
+    def stats(self)->Dict[str,int]:
+        with self._lock:
+            return {"allowed" : self.allowed, "avoided" : self.avoided}
+
+
 class DataPoliceUK:
-    def __init__(self,**kwargs):
+    def __init__(self,
+                 transport:Optional[Transport]=None,
+                 retry:Optional[RetryPolicy]=None,
+                 deadline:Optional[float]=None,
+                 raise_errors:bool=True,
+                 cache:Union[ResponseCache,bool,str,Path,None]=None,
+                 **kwargs):
+        """
+        params
+        transport : Optional. A custom `Transport` to send requests through.
+                    Defaults to the process-wide pooled transport shared by all clients,
+                    looked up on every request so `set_transport` reaches existing clients.
+        retry : Optional. `RetryPolicy` for API calls. Defaults to the transport's policy.
+        deadline : Optional. Seconds allowed per call, including retries and backoff.
+        raise_errors : Raise `RequestFailed` subclasses when a call ultimately fails.
+                       Set to False to log the failure and return None instead.
+        cache : Optional. Persist month-partitioned results (calls with a `date`) on disk.
+                Pass a `ResponseCache`, a cache directory, or True for the default location.
+                Entries are dropped once the API publishes a new release.
+        """
         self.base_url = "https://data.police.uk/api"
-        self._forces = None
+        self._own_transport = transport
+        self._retry = retry
+        self._deadline = deadline
+        self._raise_errors = raise_errors
+        if cache is True:
+            cache = ResponseCache()
+        elif isinstance(cache, (str, Path)):
+            cache = ResponseCache(cache)
+        self._cache = cache or None
+        self._planner = None
+        self._planner_source = None
         self._logger = BasicLogger(log_directory=None, logger_name="DataPoliceUK", verbose=False)
         super().__init__(**kwargs)
+
+    @property
+    def _transport(self)->Transport:
+        """The client's own transport, or the current process-wide default."""
+        return self._own_transport or get_transport()
     
     @property
     def ALL_AVAILABLE_DATASETS(self)->List[Dict[str,Any]]:
         """
         Return a list of available data sets.
         """
-        return self.get_response(url=f"{self.base_url}/crimes-street-dates")
+        return self._get_reference(f"{self.base_url}/crimes-street-dates", ttl=self._data_version_ttl)
     
-    def get_response(self, url, **kwargs):
+    @property
+    def AVAILABILITY_PLANNER(self)->AvailabilityPlanner:
+        """
+        `AvailabilityPlanner` over `ALL_AVAILABLE_DATASETS`, rebuilt when that list is refreshed.
+        """
+        datasets = self.ALL_AVAILABLE_DATASETS
+        if self._planner is None or self._planner_source is not datasets:
+            self._planner = AvailabilityPlanner(datasets)
+            self._planner_source = datasets
+        return self._planner
+
+    @property
+    def AVAILABLE_MONTHS(self)->List[str]:
+        """
+        Months ("YYYY-MM") for which street-level data is available, oldest first.
+        """
+        return sorted(x.get("date") for x in (self.ALL_AVAILABLE_DATASETS or []) if x.get("date"))
+
+    def iter_months(self,
+                    method:Union[str,Callable],
+                    start:Union[str,datetime.date,Tuple[Union[str,int],Union[str,int]]],
+                    end:Union[str,datetime.date,Tuple[Union[str,int],Union[str,int]]],
+                    *args,
+                    max_workers:int=4,
+                    skip_unavailable:bool=True,
+                    **kwargs)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        Call a single-month method for every month from `start` to `end` concurrently,
+        yielding `(month, result, error)` as each month completes.
+
+        params
+        method : Name of a method taking `year` and `month` (e.g. "get_all_street_level_crimes") or a callable.
+        start, end : First and last month, as "YYYY-MM", (year, month) or a date.
+        max_workers : Number of months fetched concurrently; the rate limiter still applies.
+        skip_unavailable : Skip months missing from `AVAILABLE_MONTHS` without a request.
+        *args, **kwargs : Passed on to `method` for every month.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        months = month_range(start, end)
+        if skip_unavailable:
+            available = set(self.AVAILABLE_MONTHS)
+            skipped = [x for x in months if x not in available]
+            if skipped:
+                self._logger.info(f"Skipping {len(skipped)} unavailable months: {', '.join(skipped)}")
+            months = [x for x in months if x in available]
+
+        def fetch(month):
+            year, month = month.split("-")
+            return func(*args, year=year, month=month, **kwargs)
+
+        yield from map_concurrently(fetch, months, max_workers=max_workers)
+
+    def get_response(self, url, raise_errors:Optional[bool]=None, **kwargs):
+        """
+        GET `url` and decode the JSON body; empty results are returned as None.
+
+        Transient failures are retried according to the retry policy. A call that still
+        fails raises `RequestFailed` (`HTTPStatusError`, `RetriesExhausted` or
+        `DeadlineExceeded`), or returns None when the client was built with `raise_errors=False`.
+        Pass `raise_errors` to override the client setting for one call.
+        """
+        raise_errors = self._raise_errors if raise_errors is None else raise_errors
+        kwargs.setdefault("retry", self._retry)
+        kwargs.setdefault("deadline", self._deadline)
+        content, cache_key, version = None, None, None
+        if self._cache is not None and self._is_cacheable(kwargs.get("params")):
+            version = self._get_data_version()
+            if version:
+                cache_key = self._cache.make_key(url, kwargs.get("params"))
+                content = self._cache.get(cache_key, version)
         try:
-            res= json.loads(Response(url=url, **kwargs).assert_response().content)
-        except Exception as e:
-            self._logger.error(f"Error retrieving data from {url}", str(e))
+            if content is None:
+                content = Response(url=url, transport=self._transport, **kwargs).assert_response().content
+                res = json.loads(content)
+                if cache_key:
+                    self._cache.set(cache_key, content, version, url=url)
+            else:
+                res = json.loads(content)
+        except (RequestFailed, requests.RequestException, ValueError) as e:
+            self._logger.error(f"Error retrieving data from {url}: {e}")
+            if raise_errors:
+                if not isinstance(e, RequestFailed):
+                    raise RequestFailed(f"Error retrieving data from {url}: {e}", url=url) from e
+                raise
             return None
         if res:
             return res
         else:
             return None
 
+    def iter_response(self, url, raise_errors:Optional[bool]=None, chunk_size:int=1 << 16, **kwargs)->Iterator[Any]:
+        """
+        GET `url` and yield the records of its JSON array one at a time while the body is
+        still downloading, so only a single chunk and record are held in memory at once.
+
+        Errors are handled as in `get_response`; a failure part-way through the body ends the
+        iteration (or raises) after the records already yielded. A month-partitioned result
+        already in the response cache is read from it, but streamed bodies are not added to it.
+
+        params
+        chunk_size : Number of bytes read from the socket at a time.
+        """
+        raise_errors = self._raise_errors if raise_errors is None else raise_errors
+        kwargs.setdefault("retry", self._retry)
+        kwargs.setdefault("deadline", self._deadline)
+        content = None
+        if self._cache is not None and self._is_cacheable(kwargs.get("params")):
+            version = self._get_data_version()
+            if version:
+                content = self._cache.get(self._cache.make_key(url, kwargs.get("params")), version)
+        response = None
+        try:
+            if content is not None:
+                yield from iter_json_array((content,))
+                return
+            response = Response(url=url, transport=self._transport, stream=True, **kwargs).assert_response()
+            yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+        except (RequestFailed, requests.RequestException, ValueError) as e:
+            self._logger.error(f"Error retrieving data from {url}: {e}")
+            if raise_errors:
+                if not isinstance(e, RequestFailed):
+                    raise RequestFailed(f"Error retrieving data from {url}: {e}", url=url) from e
+                raise
+        finally:
+            if response is not None:
+                response.close()
+
+    def _fetch(self, url:str, params:Optional[Dict[str,Any]]=None, stream:bool=False):
+        """`get_response`, or `iter_response` when `stream` is set."""
+        if stream:
+            return self.iter_response(url=url, params=params)
+        return self.get_response(url=url, params=params)
+
+    _data_version_ttl = 3600
+    _reference_ttl = None
+
+    def _get_reference(self, url:str, ttl:Optional[float]=None):
+        """
+        Fetch a reference dataset through the process-wide `REFERENCE_CACHE`, so every
+        client instance shares one copy until it expires. `ttl` defaults to the cache's own.
+        """
+        return REFERENCE_CACHE.get_or_set(url, lambda: self.get_response(url=url),
+                                          ttl=ttl if ttl is not None else self._reference_ttl)
+
+    @staticmethod
+    def _is_cacheable(params:Optional[Dict[str,Any]])->bool:
+        """Only results pinned to a month are cached; without a `date` the API serves the latest month."""
+        return bool(params) and bool(params.get("date"))
+
+    def _get_data_version(self)->Optional[str]:
+        """The raw `/crime-last-updated` date, re-checked at most once an hour."""
+        res = self._get_reference(f"{self.base_url}/crime-last-updated", ttl=self._data_version_ttl)
+        return (res or {}).get("date")
+
+    @staticmethod
+    def _as_records(result:Optional[List[Dict[str,Any]]],
+                    records_class:type,
+                    as_columnar:bool=False,
+                    as_geodataframe:bool=False)->Union[None,List[Dict[str,Any]],ColumnarRecords,gpd.GeoDataFrame]:
+        """
+        Optionally convert a list of records into the column store `records_class`, or
+        further into a point GeoDataFrame. A None result (failed or pruned request) is passed through.
+        """
+        if not (as_columnar or as_geodataframe) or result is None:
+            return result
+        records = records_class.from_records(result)
+        return records.to_geopandas() if as_geodataframe else records
+
+    @property
+    def CACHE_STATS(self)->Optional[Dict[str,Any]]:
+        """Hit/miss counts and size of the persistent response cache, if one is used."""
+        return self._cache.stats() if self._cache is not None else None
+
+    @property
+    def RATE_LIMIT_STATS(self)->Optional[Dict[str,Any]]:
+        """
+        How many requests were sent through the transport's rate limiter
+        and how long callers spent waiting for it.
+        """
+        return self._transport.rate_limit_stats
+
     @property
     def LIST_OF_FORCES(self)->Optional[List[str]]:
-        if self._forces is None:
-            url=f"{self.base_url}/forces"
-            self._forces=self.get_response(url)
-        return self._forces
+        return self._get_reference(f"{self.base_url}/forces")
         
     @property
     def ALL_NAMES(self)->Optional[List[str]]:
@@ -71,6 +425,9 @@ class DataPoliceUK:
     def find_force_for_neighborhood_coords(self, lat:Union[str,float], lng:Union[str,float]):
         """
         Find the neighbourhood policing team responsible for a particular area.
+        This costs one request per point; for batches of coordinates use a
+        `NeighborhoodLocator` (`Neighborhoods.NEIGHBORHOOD_LOCATOR` or
+        `Boundaries.get_neighborhood_locator`), which resolves them offline.
         params
         lat, lng : A Latitude & Longitude, e.g. 51.500617,-0.124629
         """
@@ -84,7 +441,7 @@ class DataPoliceUK:
         Crime data in the API is updated once a month. 
         Find out when it was last updated.
         """
-        date = self.get_response(url=f"{self.base_url}/crime-last-updated").get("date")
+        date = self._get_data_version()
         date = datetime.datetime.strftime(datetime.datetime.strptime(date, "%Y-%m-%d"),"%d %B %Y"
                                          )
         self._logger.info(f"The data were last updated on {date}")
@@ -115,8 +472,7 @@ class CrimesData(DataPoliceUK):
     
     @property
     def ALL_CRIME_CATEGORIES(self):
-        url = f"{self.base_url}/crime-categories"
-        return self.get_response(url)
+        return self._get_reference(f"{self.base_url}/crime-categories")
         
     @property
     def ALL_CRIME_NAMES(self)->Optional[List[str]]:
@@ -153,7 +509,13 @@ class CrimesData(DataPoliceUK):
                                    year:Union[str,int]=None,
                                    month:Union[str,int]=None,
                                   location_id:Union[str,int]=None,
-                                  bounding_box:Union[List[str], List[float]]=None):
+                                  bounding_box:Union[List[str], List[float]]=None,
+                                  split_large_areas:bool=False,
+                                  max_split_depth:int=6,
+                                  max_workers:int=4,
+                                  as_columnar:bool=False,
+                                  stream:bool=False,
+                                  as_geodataframe:bool=False):
         """
         Crimes at street-level; 
         either within a 1 mile radius of a single point, or within a custom area.
@@ -169,8 +531,28 @@ class CrimesData(DataPoliceUK):
             
         date : Optional. (YYYY-MM) Limit results to a specific month.
         The latest month will be shown by default
+
+        split_large_areas : For custom areas, split the polygon into quadrants whenever the API
+                            refuses it for holding more than 10,000 crimes, fetch the pieces
+                            concurrently and merge the results de-duplicated by crime id.
+        max_split_depth : Maximum number of times an area is halved in each direction.
+        max_workers : Number of sub-areas fetched concurrently.
+        as_columnar : Return a `CrimeRecords` column store instead of a list of dicts.
+        stream : Return a generator yielding crimes as the response is decoded (see `iter_response`).
+                 With `as_columnar` the column store is built from the stream without holding the dicts.
+        as_geodataframe : Return a GeoDataFrame of crime points (EPSG:4326), with geometry built
+                          in one vectorized call from the parsed coordinate columns.
         """
         url = self.get_crime_url(crime_id)
+
+        if bounding_box and not location_id and split_large_areas:
+            date = f"{year}-{month}" if month and year else None
+            crimes = self._get_crimes_for_large_area(url, bounding_box, date,
+                                                     max_split_depth=max_split_depth,
+                                                     max_workers=max_workers)
+            if stream and not (as_columnar or as_geodataframe):
+                return iter(crimes or [])
+            return self._as_records(crimes, CrimeRecords, as_columnar, as_geodataframe)
         
         params = {}
         
@@ -182,7 +564,7 @@ class CrimesData(DataPoliceUK):
         elif bounding_box:
             params.update({
                 
-                "poly" : bounding_box
+                "poly" : format_poly(bounding_box)
             })
         else:
             
@@ -197,8 +579,7 @@ class CrimesData(DataPoliceUK):
         if month and year:
             params.update({"date" : f"{year}-{month}"})
         self._logger.info(params)
-        return self.get_response(url=url,
-                               params=params)
+        return self._as_records(self._fetch(url, params, stream), CrimeRecords, as_columnar, as_geodataframe)
         
     def get_all_street_level_crimes(self,
                                 lat:Union[str,float]=None,
@@ -206,7 +587,13 @@ class CrimesData(DataPoliceUK):
                                    year:Union[str,int]=None,
                                    month:Union[str,int]=None,
                                   location_id:Union[str,int]=None,
-                                  bounding_box:Union[List[str], List[float]]=None):
+                                  bounding_box:Union[List[str], List[float]]=None,
+                                  split_large_areas:bool=False,
+                                  max_split_depth:int=6,
+                                  max_workers:int=4,
+                                  as_columnar:bool=False,
+                                  stream:bool=False,
+                                  as_geodataframe:bool=False):
         """
         All Crimes at street-level; 
         either within a 1 mile radius of a single point, or within a custom area.
@@ -218,9 +605,121 @@ class CrimesData(DataPoliceUK):
             
         date : Optional. (YYYY-MM) Limit results to a specific month.
         The latest month will be shown by default
+
+        split_large_areas, max_split_depth, max_workers, as_columnar, stream, as_geodataframe :
+            See `get_street_level_crimes_by_type`.
         """
         #url = f"{self.base_url}/crimes-street/all-crime"
-        return self.get_street_level_crimes_by_type("all-crime",lat,lng,year,month,location_id,bounding_box)
+        return self.get_street_level_crimes_by_type("all-crime",lat,lng,year,month,location_id,bounding_box,
+                                                    split_large_areas=split_large_areas,
+                                                    max_split_depth=max_split_depth,
+                                                    max_workers=max_workers,
+                                                    as_columnar=as_columnar,
+                                                    stream=stream,
+                                                    as_geodataframe=as_geodataframe)
+
+    @staticmethod
+    def _split_polygon(polygon:shapely.geometry.Polygon)->List[shapely.geometry.Polygon]:
+        """
+        Cut a polygon along the centre of its bounding box into up to four pieces.
+        """
+        minx, miny, maxx, maxy = polygon.bounds
+        midx, midy = (minx + maxx) / 2, (miny + maxy) / 2
+        pieces = []
+        for quadrant in (shapely.geometry.box(minx, miny, midx, midy),
+                         shapely.geometry.box(midx, miny, maxx, midy),
+                         shapely.geometry.box(minx, midy, midx, maxy),
+                         shapely.geometry.box(midx, midy, maxx, maxy)):
+            piece = polygon.intersection(quadrant)
+            pieces.extend(x for x in getattr(piece, "geoms", [piece])
+                          if isinstance(x, shapely.geometry.Polygon) and not x.is_empty)
+        return pieces
+
+    # Half-width in degrees of the probe area, about 50 m: far too small for 10,000 crimes
+    _PROBE_SIZE = 0.0005
+
+    def _get_crimes_for_large_area(self,
+                                   url:str,
+                                   bounding_box:Union[List[str], List[float]],
+                                   date:Optional[str]=None,
+                                   max_split_depth:int=6,
+                                   max_workers:int=4)->Optional[List[Dict[str,Any]]]:
+        """
+        Quadtree fetch of a custom area. The API answers 503 when an area holds more than
+        10,000 crimes; such areas are split into quadrants and retried level by level.
+
+        An outage also answers 503, so every 503 is confirmed once after a backoff. When a
+        whole level gets nothing but 503s, a tiny area inside the first one is requested
+        as a probe: it cannot hold 10,000 crimes, so a 503 there means the service is down
+        and the split stops with an error instead of fanning out further. Dense areas keep
+        being split however many levels that takes, up to `max_split_depth`.
+        """
+        # 503s are handled below, where they are told apart from "too many crimes"
+        policy = self._retry or self._transport.retry
+        overflow_policy = RetryPolicy(max_retries=policy.max_retries,
+                                      backoff_factor=policy.backoff_factor,
+                                      max_backoff=policy.max_backoff,
+                                      status_forcelist=policy.status_forcelist - {503},
+                                      jitter=policy.jitter,
+                                      respect_retry_after=policy.respect_retry_after)
+
+        def fetch(polygon):
+            params = {"poly" : format_poly(polygon)}
+            if date:
+                params.update({"date" : date})
+            for attempt in range(2):
+                try:
+                    return self.get_response(url=url, params=params, retry=overflow_policy, raise_errors=True) or []
+                except HTTPStatusError as e:
+                    if e.status_code != 503:
+                        raise
+                    if attempt == 0:
+                        time.sleep(policy.get_backoff(0, e.response))
+            return None
+
+        def service_available(polygon)->bool:
+            point = polygon.representative_point()
+            probe = shapely.geometry.box(point.x - self._PROBE_SIZE, point.y - self._PROBE_SIZE,
+                                         point.x + self._PROBE_SIZE, point.y + self._PROBE_SIZE)
+            try:
+                return fetch(probe) is not None
+            except RequestFailed:
+                return False
+
+        crimes = {}
+        frontier = [poly_to_polygon(bounding_box)]
+        depth = 0
+        while frontier:
+            overflowed = []
+            succeeded = False
+            for polygon, result, error in map_concurrently(fetch, frontier, max_workers=max_workers):
+                if error is not None:
+                    if self._raise_errors:
+                        raise error
+                    continue
+                if result is None:
+                    overflowed.append(polygon)
+                    continue
+                succeeded = True
+                for crime in result:
+                    crimes.setdefault(crime.get("id"), crime)
+            if overflowed and not succeeded and not service_available(overflowed[0]):
+                message = "Every request returned 503, as did a probe of a tiny area; the service looks unavailable"
+                self._logger.error(message)
+                if self._raise_errors:
+                    raise RequestFailed(message, url=url)
+                return list(crimes.values()) or None
+            if overflowed and depth >= max_split_depth:
+                message = f"{len(overflowed)} areas still exceed the 10,000 crime limit after {depth} splits"
+                self._logger.error(message)
+                if self._raise_errors:
+                    raise RequestFailed(message, url=url)
+                break
+            frontier = [piece for polygon in overflowed for piece in self._split_polygon(polygon)]
+            if frontier:
+                self._logger.info(f"Splitting {len(overflowed)} areas into {len(frontier)} pieces")
+            depth += 1
+        return list(crimes.values()) or None
     
 
     def get_street_level_outcomes(self,
@@ -229,7 +728,10 @@ class CrimesData(DataPoliceUK):
                                 year:Union[str,int]=None,
                                 month:Union[str,int]=None,
                                 location_id:Union[str,int]=None,
-                                bounding_box:Union[List[str], List[float]]=None
+                                bounding_box:Union[List[str], List[float]]=None,
+                                as_columnar:bool=False,
+                                stream:bool=False,
+                                as_geodataframe:bool=False
                               ):
         """
         Outcomes at street-level; either at a specific location, within a 1 mile radius of a single point, or within a custom area.
@@ -252,6 +754,10 @@ class CrimesData(DataPoliceUK):
             poly	The lat/lng pairs which define the boundary of the custom area
             date	Optional. (YYYY-MM) Limit results to a specific month.
             The latest month will be shown by default
+
+        as_columnar : Return an `OutcomeRecords` column store instead of a list of dicts.
+        stream : Return a generator yielding outcomes as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of outcome points (EPSG:4326).
         """
         params = {}
         
@@ -263,7 +769,7 @@ class CrimesData(DataPoliceUK):
         elif bounding_box:
             params.update({
                 
-                "poly" : bounding_box
+                "poly" : format_poly(bounding_box)
             })
         else:
             
@@ -277,8 +783,45 @@ class CrimesData(DataPoliceUK):
             params.update({"date" : f"{year}-{month}"})
         
         url = f"{self.base_url}/outcomes-at-location"
-        return self.get_response(url=url,
-                               params=params)
+        return self._as_records(self._fetch(url, params, stream), OutcomeRecords, as_columnar, as_geodataframe)
+
+    def iter_street_level_crimes_by_type_for_months(self,
+                                                    crime_id:str,
+                                                    start:Union[str,datetime.date],
+                                                    end:Union[str,datetime.date],
+                                                    max_workers:int=4,
+                                                    **kwargs)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_street_level_crimes_by_type` for every available month from `start` to `end`
+        ("YYYY-MM"), fetched concurrently and yielded as `(month, crimes, error)` on completion.
+        Other keyword arguments (lat/lng, location_id, bounding_box, ...) apply to every month.
+        """
+        return self.iter_months(self.get_street_level_crimes_by_type, start, end, crime_id,
+                                max_workers=max_workers, **kwargs)
+
+    def iter_all_street_level_crimes_for_months(self,
+                                                start:Union[str,datetime.date],
+                                                end:Union[str,datetime.date],
+                                                max_workers:int=4,
+                                                **kwargs)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_all_street_level_crimes` for every available month from `start` to `end`;
+        see `iter_street_level_crimes_by_type_for_months`.
+        """
+        return self.iter_street_level_crimes_by_type_for_months("all-crime", start, end,
+                                                                max_workers=max_workers, **kwargs)
+
+    def iter_street_level_outcomes_for_months(self,
+                                              start:Union[str,datetime.date],
+                                              end:Union[str,datetime.date],
+                                              max_workers:int=4,
+                                              **kwargs)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_street_level_outcomes` for every available month from `start` to `end`,
+        yielded as `(month, outcomes, error)` on completion.
+        """
+        return self.iter_months(self.get_street_level_outcomes, start, end,
+                                max_workers=max_workers, **kwargs)
 
 class Neighborhoods(DataPoliceUK):
     def __init__(self, force_id, **kwargs):
@@ -286,20 +829,65 @@ class Neighborhoods(DataPoliceUK):
         self.force_id = force_id
         assert self.force_id in self.ALL_FORCE_IDS, "Force ID mismatch"
         self.force_url = f"{self.base_url}/{self.force_id}"
-        self.neighborhoods = None
+        self._neighborhood_index = None
+        self._neighborhood_name_index = None
+        self._indexed_neighborhoods = None
+        self._force_boundary = None
+        self._force_boundary_tolerance = None
+        self._locator = None
+        self._locator_source = None
+        self.boundary_errors = {}
 
     
     @property
     def ALL_NEIGHBORHOOD_IDS_AND_NAMES(self):
         """
-        List of neighbourhoods for a force
+        List of neighbourhoods for a force, read through `REFERENCE_CACHE` on every access
+        so it is refreshed when the cached copy expires
+        """
+        #self._logger.info(self.force_url)
+        url =f"{self.force_url}/neighbourhoods"
+        #self._logger.info(url)
+        return self._get_reference(url)
+
+    def _build_neighborhood_index(self)->None:
+        """
+        Index the force's neighbourhoods by ID and by lower-cased name.
+        Rebuilt only when the underlying neighbourhood list is refreshed.
+        """
+        neighborhoods = self.ALL_NEIGHBORHOOD_IDS_AND_NAMES or []
+        if self._neighborhood_index is not None and self._indexed_neighborhoods is neighborhoods:
+            return
+        index = {}
+        name_index = {}
+        for x in neighborhoods:
+            index[str(x.get("id"))] = x
+            name_index.setdefault(str(x.get("name")).strip().lower(), []).append(str(x.get("id")))
+        self._neighborhood_index = index
+        self._neighborhood_name_index = name_index
+        self._indexed_neighborhoods = neighborhoods
+
+    @property
+    def NEIGHBORHOOD_INDEX(self)->Dict[str,Dict[str,Any]]:
+        """
+        Neighbourhoods of the force keyed by ID.
         """
-        if self.neighborhoods is None:
-            #self._logger.info(self.force_url)
-            url =f"{self.force_url}/neighbourhoods"
-            #self._logger.info(url)
-            self.neighborhoods = self.get_response(url=url)
-        return self.neighborhoods
+        self._build_neighborhood_index()
+        return self._neighborhood_index
+
+    def get_neighborhood(self, neighborhood_id:Union[str,int])->Optional[Dict[str,Any]]:
+        """
+        The `id`/`name` record of a neighbourhood, or None if the force has no such ID.
+        """
+        return self.NEIGHBORHOOD_INDEX.get(str(neighborhood_id))
+
+    def get_neighborhood_ids_for_name(self, neighborhood_name:str)->List[str]:
+        """
+        IDs of the neighbourhoods whose name matches exactly (case-insensitive).
+        Use `filter_neighborhood_id_for_name` for fuzzy matching.
+        """
+        self._build_neighborhood_index()
+        return list(self._neighborhood_name_index.get(neighborhood_name.strip().lower(), []))
 
     @property
     def ALL_NEIGHBORHOOD_NAMES(self)->Optional[List[str]]:
@@ -315,6 +903,7 @@ class Neighborhoods(DataPoliceUK):
         filtered_names = ListOperations(self.ALL_NEIGHBORHOOD_NAMES, search_string = neighborhood_name).search_list_by_snowball()
         if not filtered_names:
             return None
+        filtered_names = set(filtered_names)
         return [x for x in self.ALL_NEIGHBORHOOD_IDS_AND_NAMES if x.get("name") in filtered_names]
 
     #def get_neighborhood_id_for_force(self, neighborhood_name:str)->Optional[List[str]]:
@@ -328,51 +917,146 @@ class Neighborhoods(DataPoliceUK):
         #else:
         #    return matching_ids
         #return ListOperations()
-    def assert_neighborhood_id(self, neighborhood_id:Union[str,int]):
-        neighborhood_ids = self.ALL_NEIGHBORHOOD_IDS
+    def assert_neighborhood_id(self, neighborhood_id:Union[str,int])->str:
+        """
+        Check in constant time that the force has this neighbourhood; returns the ID as a string.
+        """
+        neighborhood_id = str(neighborhood_id)
+        neighborhood_ids = self.NEIGHBORHOOD_INDEX
         assert neighborhood_id in neighborhood_ids, f"Neighborhood ID not found for force\nAvailable IDs: {', ' .join(neighborhood_ids)}"
+        return neighborhood_id
+
+    def _neighborhood_url(self, neighborhood_id:str)->str:
+        # Callers validate the ID once before building URLs
+        return f"{self.base_url}/{self.force_id}/{neighborhood_id}"
+
     #@property
     def get_neighborhood_url(self,neighborhood_id:Union[str,int])->Optional[str]:
-        self.assert_neighborhood_id(neighborhood_id)
-        return f"{self.base_url}/{self.force_id}/{neighborhood_id}"
+        return self._neighborhood_url(self.assert_neighborhood_id(neighborhood_id))
     
     def get_specific_neighborhood_info(self, neighborhood_id:Union[str,int]):
-        self.assert_neighborhood_id(neighborhood_id)
         url = self.get_neighborhood_url(neighborhood_id)
         return self.get_response(url=url)
+
+    def _get_neighborhood_boundary(self, neighborhood_id:str):
+        return self.get_response(url=f"{self._neighborhood_url(neighborhood_id)}/boundary")
     
     def get_neighborhood_boundary(self, neighborhood_id:Union[str,int]):
-        self.assert_neighborhood_id(neighborhood_id)
         """
         A list of latitude/longitude pairs that make up the boundary of a neighbourhood.
         """
-        url = f"{self.get_neighborhood_url(neighborhood_id)}/boundary"
-        return self.get_response(url=url)
+        return self._get_neighborhood_boundary(self.assert_neighborhood_id(neighborhood_id))
     
     
-    def get_neighborhood_boundary_polygon(self, neighborhood_id:Union[str,int]):
-        self.assert_neighborhood_id(neighborhood_id)
-        return shapely.geometry.Polygon([[float(x.get("longitude")), float(x.get("latitude"))] for x in self.get_neighborhood_boundary(neighborhood_id)])
+    def get_neighborhood_boundary_polygon(self,
+                                          neighborhood_id:Union[str,int],
+                                          simplify_tolerance:Optional[float]=None)->Optional[shapely.geometry.Polygon]:
+        """
+        Boundary of a neighbourhood as a shapely Polygon, built from a NumPy vertex array.
+
+        params
+        simplify_tolerance : Optional. Simplify the outline with this tolerance in degrees.
+        """
+        boundary = self._get_neighborhood_boundary(self.assert_neighborhood_id(neighborhood_id))
+        return coordinates_to_polygon(boundary_to_coordinates(boundary), simplify_tolerance)
     
     @property
     def POLICE_FORCE_BOUNDARY(self)->Optional[gpd.GeoDataFrame]:
+        """
+        GeoDataFrame of every neighbourhood boundary of the force.
+        Built concurrently on first access and memoized; see `build_police_force_boundary`.
+        """
+        if self._force_boundary is None:
+            self.build_police_force_boundary()
+        return self._force_boundary
+
+    def iter_neighborhood_boundaries(self,
+                                     neighborhood_ids:Optional[Iterable[Union[str,int]]]=None,
+                                     max_workers:int=8,
+                                     progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                                     simplify_tolerance:Optional[float]=None,
+                                     )->Iterator[Tuple[str,Optional[shapely.geometry.Polygon],Optional[BaseException]]]:
+        """
+        Fetch neighbourhood boundary polygons concurrently, yielding
+        `(neighborhood_id, polygon, error)` as each one completes.
+
+        params
+        neighborhood_ids : Optional. Neighbourhoods to fetch; all of the force's by default.
+        max_workers : Number of concurrent requests; the transport's rate limiter still applies.
+        progress : Optional. Called as `progress(done, total, neighborhood_id, error)`.
+        simplify_tolerance : Optional. Simplify each outline with this tolerance in degrees.
+        """
+        if neighborhood_ids is None:
+            neighborhood_ids = self.ALL_NEIGHBORHOOD_IDS
+        def fetch(neighborhood_id):
+            return self.get_neighborhood_boundary_polygon(neighborhood_id, simplify_tolerance=simplify_tolerance)
+        yield from map_concurrently(fetch, neighborhood_ids, max_workers=max_workers, progress=progress)
+
+    def build_police_force_boundary(self,
+                                    max_workers:int=8,
+                                    progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                                    refresh:bool=False,
+                                    simplify_tolerance:Optional[float]=None)->Optional[gpd.GeoDataFrame]:
+        """
+        Build (or return the memoized) GeoDataFrame of all neighbourhood boundaries.
+
+        Boundaries are fetched concurrently. Neighbourhoods that fail are left out of the
+        frame and recorded in `self.boundary_errors` so the rest are kept.
+
+        params
+        max_workers : Number of concurrent requests; the transport's rate limiter still applies.
+        progress : Optional. Called as `progress(done, total, neighborhood_id, error)`.
+        refresh : Rebuild even if a boundary was already memoized.
+        simplify_tolerance : Optional. Simplify each outline with this tolerance in degrees;
+                             a different tolerance from the memoized build triggers a rebuild.
+        """
+        if (self._force_boundary is not None and not refresh
+                and simplify_tolerance == self._force_boundary_tolerance):
+            return self._force_boundary
+        names = {x.get("id") : x.get("name") for x in self.ALL_NEIGHBORHOOD_IDS_AND_NAMES}
+        polygons = {}
+        self.boundary_errors = {}
+        for neighborhood_id, polygon, error in self.iter_neighborhood_boundaries(list(names),
+                                                                                max_workers=max_workers,
+                                                                                progress=progress,
+                                                                                simplify_tolerance=simplify_tolerance):
+            if error is not None:
+                self.boundary_errors[neighborhood_id] = error
+            else:
+                polygons[neighborhood_id] = polygon
+        if self.boundary_errors:
+            self._logger.warning(f"Boundaries could not be fetched for {len(self.boundary_errors)} of "
+                                 f"{len(names)} neighbourhoods: {', '.join(map(str, self.boundary_errors))}")
         dat = [
             {
-                "location" : x.get("name"),
-                "neighborhood_id" : x.get("id"),
-                "geometry" : self.get_neighborhood_boundary_polygon(x.get("id"))
-            } for x in self.ALL_NEIGHBORHOOD_IDS_AND_NAMES
+                "location" : name,
+                "neighborhood_id" : neighborhood_id,
+                "geometry" : polygons[neighborhood_id]
+            } for neighborhood_id, name in names.items() if neighborhood_id in polygons
         ]
 
-        gdf=gpd.GeoDataFrame(dat).set_geometry("geometry").set_crs("EPSG:4326")
+        gdf=gpd.GeoDataFrame(dat, columns=["location", "neighborhood_id", "geometry"]).set_geometry("geometry").set_crs("EPSG:4326")
+        self._force_boundary = gdf
+        self._force_boundary_tolerance = simplify_tolerance
         return gdf
     
+    @property
+    def NEIGHBORHOOD_LOCATOR(self)->NeighborhoodLocator:
+        """
+        Offline point-in-polygon locator over `POLICE_FORCE_BOUNDARY`, rebuilt when the
+        boundary is. `locate(lats, lngs)` maps coordinate batches to this force's
+        neighbourhoods without any request.
+        """
+        boundary = self.POLICE_FORCE_BOUNDARY
+        if self._locator is None or self._locator_source is not boundary:
+            self._locator = NeighborhoodLocator.from_geodataframe(boundary, force_id=self.force_id)
+            self._locator_source = boundary
+        return self._locator
+
     def get_neighborhood_police_team(self, neighborhood_id:Union[str,int]):
-        self.assert_neighborhood_id(neighborhood_id)
         return self.get_response(url=f"{self.get_neighborhood_url(neighborhood_id)}/people")
     
     def get_neighborhood_events(self, neighborhood_id):
-        self.assert_neighborhood_id(neighborhood_id)
         events=self.get_response(url=f"{self.get_neighborhood_url(neighborhood_id)}/events")
         if not events:
             self._logger.info("No events were found")
@@ -380,11 +1064,102 @@ class Neighborhoods(DataPoliceUK):
             return events
         
     def get_neighborhood_priorities(self, neighborhood_id:Union[str,int]):
-        self.assert_neighborhood_id(neighborhood_id)
         return self.get_response(url=f"{self.get_neighborhood_url(neighborhood_id)}/priorities")
+
+    # Sub-resources of a neighbourhood and the path appended to its URL
+    NEIGHBORHOOD_RESOURCES = {
+        "info" : "",
+        "boundary" : "/boundary",
+        "people" : "/people",
+        "events" : "/events",
+        "priorities" : "/priorities",
+    }
+
+    def iter_neighborhood_resources(self,
+                                    neighborhood_ids:Optional[Iterable[Union[str,int]]]=None,
+                                    resources:Iterable[str]=("info", "boundary", "people", "events", "priorities"),
+                                    max_workers:int=8,
+                                    progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                                    )->Iterator[Tuple[Tuple[str,str],Any,Optional[BaseException]]]:
+        """
+        Fetch several sub-resources of several neighbourhoods concurrently, yielding
+        `((neighborhood_id, resource), result, error)` as each request completes.
+
+        params
+        neighborhood_ids : Optional. Neighbourhoods to fetch; all of the force's by default.
+        resources : Any of "info", "boundary", "people", "events" and "priorities".
+        max_workers : Number of concurrent requests; the transport's rate limiter still applies.
+        progress : Optional. Called as `progress(done, total, (neighborhood_id, resource), error)`.
+        """
+        neighborhood_ids, resources = self._checked_profile_request(neighborhood_ids, resources)
+        return self._iter_neighborhood_resources(neighborhood_ids, resources, max_workers, progress)
+
+    def _checked_profile_request(self,
+                                 neighborhood_ids:Optional[Iterable[Union[str,int]]],
+                                 resources:Iterable[str])->Tuple[List[str],List[str]]:
+        """Validate the IDs and resource names of a batch once, up front."""
+        resources = list(resources)
+        unknown = [x for x in resources if x not in self.NEIGHBORHOOD_RESOURCES]
+        if unknown:
+            raise ValueError(f"Unknown neighbourhood resources {unknown}; choose from {list(self.NEIGHBORHOOD_RESOURCES)}")
+        if neighborhood_ids is None:
+            neighborhood_ids = self.ALL_NEIGHBORHOOD_IDS
+        return [self.assert_neighborhood_id(x) for x in neighborhood_ids], resources
+
+    def _iter_neighborhood_resources(self,
+                                     neighborhood_ids:List[str],
+                                     resources:List[str],
+                                     max_workers:int=8,
+                                     progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                                     )->Iterator[Tuple[Tuple[str,str],Any,Optional[BaseException]]]:
+        """`iter_neighborhood_resources` for IDs and resources that were already checked."""
+        def fetch(task):
+            neighborhood_id, resource = task
+            return self.get_response(url=f"{self._neighborhood_url(neighborhood_id)}{self.NEIGHBORHOOD_RESOURCES[resource]}")
+
+        tasks = [(neighborhood_id, resource) for neighborhood_id in neighborhood_ids for resource in resources]
+        yield from map_concurrently(fetch, tasks, max_workers=max_workers, progress=progress)
+
+    def get_neighborhood_profiles(self,
+                                  neighborhood_ids:Optional[Iterable[Union[str,int]]]=None,
+                                  resources:Iterable[str]=("info", "boundary", "people", "events", "priorities"),
+                                  max_workers:int=8,
+                                  progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                                  )->Dict[str,Dict[str,Any]]:
+        """
+        One consolidated profile per neighbourhood, with every requested sub-resource
+        fetched concurrently instead of one round trip after another.
+
+        Returns `{neighborhood_id: {"info": ..., "boundary": ..., ..., "errors": {...}}}`.
+        A failed sub-resource is None in the profile and its exception is kept under
+        "errors", so one failure does not lose the rest of the batch.
+
+        params
+        See `iter_neighborhood_resources`.
+        """
+        neighborhood_ids, resources = self._checked_profile_request(neighborhood_ids, resources)
+        profiles = {}
+        for (neighborhood_id, resource), result, error in self._iter_neighborhood_resources(neighborhood_ids,
+                                                                                           resources,
+                                                                                           max_workers=max_workers,
+                                                                                           progress=progress):
+            profile = profiles.setdefault(neighborhood_id, {"errors" : {}})
+            profile[resource] = result
+            if error is not None:
+                profile["errors"][resource] = error
+        failed = sum(len(x["errors"]) for x in profiles.values())
+        if failed:
+            self._logger.warning(f"{failed} of {len(profiles) * len(resources)} neighbourhood requests failed")
+        # Keep the order the neighbourhoods were asked for
+        return {x : profiles[x] for x in dict.fromkeys(neighborhood_ids) if x in profiles}
     
 class StopAndSearches(DataPoliceUK):
-    def __init__(self,**kwargs):
+    """
+    params
+    prune_unavailable : Skip force/month requests that the availability matrix shows
+                        to be empty. Defaults to True.
+    """
+    def __init__(self, prune_unavailable:bool=True, **kwargs):
         super().__init__(**kwargs)
         #self.lat = lat
         #self.lng = lng
@@ -392,6 +1167,7 @@ class StopAndSearches(DataPoliceUK):
         #self.year = year
         #self.bbox = bbox
         self.stop_search_url=f"{self.base_url}/stops-street"
+        self.prune_unavailable = prune_unavailable
     
     def params(self,
                lat:Union[str,float]=None,
@@ -410,7 +1186,7 @@ class StopAndSearches(DataPoliceUK):
         elif bounding_box:
             params.update({
                 
-                "poly" : bounding_box
+                "poly" : format_poly(bounding_box)
             })
         else:
             
@@ -430,7 +1206,10 @@ class StopAndSearches(DataPoliceUK):
                                      lat:Union[str,float],
                                     lng:Union[str,float],
                                     year:Union[str,int]=None,
-                                    month:Union[str,int]=None,):
+                                    month:Union[str,int]=None,
+                                    as_columnar:bool=False,
+                                    stream:bool=False,
+                                    as_geodataframe:bool=False):
         """
         Stop and searches at street-level; 
         either within a 1 mile radius of a single point, or within a custom area
@@ -440,14 +1219,21 @@ class StopAndSearches(DataPoliceUK):
         lng : Longitude of the centre of the desired area
         date : Optional. (YYYY-MM) Limit results to a specific month.
                 The latest month will be shown by default
+        as_columnar : Return a `StopSearchRecords` column store instead of a list of dicts.
+        stream      : Return a generator yielding stop and searches as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of points (EPSG:4326).
         """
         params = self.params(lat,lng,year,month)
-        return self.get_response(url=self.stop_search_url, params=params)
+        return self._as_records(self._fetch(self.stop_search_url, params, stream),
+                                StopSearchRecords, as_columnar, as_geodataframe)
     
     def get_stop_searches_for_area(self,
                                bounding_box:Union[List[str], List[float]],
                                year:Union[str,int]=None,
                                 month:Union[str,int]=None,
+                                as_columnar:bool=False,
+                                stream:bool=False,
+                                as_geodataframe:bool=False,
                                 ):
         """
         Stop and searches at street-level; 
@@ -457,14 +1243,21 @@ class StopAndSearches(DataPoliceUK):
         bounding_box : The lat/lng pairs which define the boundary of the custom area
         date :       Optional. (YYYY-MM) Limit results to a specific month.
                      The latest month will be shown by default
+        as_columnar : Return a `StopSearchRecords` column store instead of a list of dicts.
+        stream      : Return a generator yielding stop and searches as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of points (EPSG:4326).
         """
         params=self.params(bounding_box=bounding_box,month=month,year=year)
-        return self.get_response(url=self.stop_search_url, params=params)
+        return self._as_records(self._fetch(self.stop_search_url, params, stream),
+                                StopSearchRecords, as_columnar, as_geodataframe)
     
     def get_stop_searches_for_location(self, 
                                        location_id:Union[str,int],
                                        year:Union[str,int]=None,
                                         month:Union[str,int]=None,
+                                        as_columnar:bool=False,
+                                        stream:bool=False,
+                                        as_geodataframe:bool=False,
                                         ):
         """
         Stop and searches at a particular location.
@@ -472,14 +1265,21 @@ class StopAndSearches(DataPoliceUK):
         location_id	 :   The ID of the location to get stop and searches for
         date	     :  Optional. (YYYY-MM) Limit results to a specific month.
                         The latest month will be shown by default.
+        as_columnar  :  Return a `StopSearchRecords` column store instead of a list of dicts.
+        stream       :  Return a generator yielding stop and searches as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of points (EPSG:4326).
         """
         params = self.params(location_id=location_id, month=month, year=year)
-        return self.get_response(url=self.stop_search_url, params=params)
+        return self._as_records(self._fetch(self.stop_search_url, params, stream),
+                                StopSearchRecords, as_columnar, as_geodataframe)
     
     def get_stop_searches_for_force(self, 
                                     force_id:Union[str,int],
                                     year:Union[str,int]=None,
                                     month:Union[str,int]=None,
+                                    as_columnar:bool=False,
+                                    stream:bool=False,
+                                    as_geodataframe:bool=False,
                                     ):
         """
         Stop and searches that could not be mapped to a location.
@@ -488,21 +1288,29 @@ class StopAndSearches(DataPoliceUK):
         force : The force that carried out the stop and searches
         date : Optional. (YYYY-MM) Limit results to a specific month.
         The latest month will be shown by default.
+        as_columnar : Return a `StopSearchRecords` column store instead of a list of dicts.
+        stream      : Return a generator yielding stop and searches as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of points (EPSG:4326).
         """
         
         url = f"{self.base_url}/stops-no-location"
         params = dict(force=force_id)
         if month and year:
+            if self.prune_unavailable and not self._is_available(force_id, year, month):
+                return iter(()) if stream else None
             params.update({"date":f"{year}-{month}"})
             
         
         #params = dict(force=force_id,date=f"{year}-{month}")
-        return self.get_response(url=url, params=params)
+        return self._as_records(self._fetch(url, params, stream), StopSearchRecords, as_columnar, as_geodataframe)
     
     def get_stop_searches_reported_by_force(self,
                                             force_id:Union[str,int],
                                             year:Union[str,int]=None,
-                                            month:Union[str,int]=None,):
+                                            month:Union[str,int]=None,
+                                            as_columnar:bool=False,
+                                            stream:bool=False,
+                                            as_geodataframe:bool=False):
         """
         Stop and searches reported by a particular force
         
@@ -511,13 +1319,141 @@ class StopAndSearches(DataPoliceUK):
         date :	Optional. (YYYY-MM) Limit results to a specific month.
         The latest month will be shown by default, even if no data is available for that force in that month; 
         use the availability API method to pick a date if this is significant for you
-        
+
+        When a month is given and the availability data shows the force published nothing
+        for it, None is returned without a request (see `prune_unavailable`).
+
+        as_columnar : Return a `StopSearchRecords` column store instead of a list of dicts.
+        stream      : Return a generator yielding stop and searches as the response is decoded.
+        as_geodataframe : Return a GeoDataFrame of points (EPSG:4326).
         """
         url = f"{self.base_url}/stops-force"
         params = dict(force=force_id)
         if month and year:
+            if self.prune_unavailable and not self._is_available(force_id, year, month):
+                return iter(()) if stream else None
             params.update({"date":f"{year}-{month}"})
-        return self.get_response(url=url, params=params)
+        return self._as_records(self._fetch(url, params, stream), StopSearchRecords, as_columnar, as_geodataframe)
+
+    def _known_planner(self)->AvailabilityPlanner:
+        """
+        The availability planner, refusing to plan without data: an empty matrix would
+        otherwise prune every request and return nothing without an error.
+        """
+        planner = self.AVAILABILITY_PLANNER
+        if not planner.KNOWN:
+            raise RequestFailed("Stop and search availability is unknown because ALL_AVAILABLE_DATASETS "
+                                "could not be fetched; retry later or build the client with prune_unavailable=False",
+                                url=f"{self.base_url}/crimes-street-dates")
+        return planner
+
+    def _is_available(self, force_id:Union[str,int], year:Union[str,int], month:Union[str,int])->bool:
+        month = f"{int(year):04d}-{int(month):02d}"
+        available = self._known_planner().check(str(force_id), month)
+        if not available:
+            self._logger.info(f"Skipping {force_id} for {month}: no stop and search data was published")
+        return available
+
+    def iter_stop_searches_reported_by_forces(self,
+                                              force_ids:Optional[Iterable[str]]=None,
+                                              start:Optional[Union[str,datetime.date]]=None,
+                                              end:Optional[Union[str,datetime.date]]=None,
+                                              max_workers:int=4,
+                                              as_columnar:bool=False,
+                                              as_geodataframe:bool=False)->Iterator[Tuple[Tuple[str,str],Any,Optional[BaseException]]]:
+        """
+        Stop and searches reported by several forces over a range of months.
+
+        The availability matrix is consulted first, so only (force, month) pairs with
+        published data are requested; the rest are counted in `AVAILABILITY_PLANNER.avoided`.
+        Yields `((force_id, month), stop_searches, error)` as each request completes.
+        Raises `RequestFailed` when the availability matrix could not be fetched.
+
+        params
+        force_ids : Optional. Forces to fetch; every force with data by default.
+        start, end : Optional. First and last month ("YYYY-MM"); all available months by default.
+                     Without pruning (`prune_unavailable=False`), `force_ids`, `start` and `end`
+                     are required and every pair is requested.
+        max_workers : Number of concurrent requests; the rate limiter still applies.
+        as_columnar : Yield `StopSearchRecords` column stores instead of lists of dicts.
+        as_geodataframe : Yield GeoDataFrames of points (EPSG:4326).
+        """
+        if self.prune_unavailable:
+            planner = self._known_planner()
+            months = planner.MONTHS
+            if start or end:
+                months = month_range(start or months[0], end or months[-1])
+            force_ids = list(force_ids) if force_ids is not None else planner.FORCES
+            avoided = planner.avoided
+            pairs = planner.plan(force_ids, months)
+            self._logger.info(f"Requesting {len(pairs)} force/month pairs; "
+                              f"{planner.avoided - avoided} without published data were skipped")
+        else:
+            if force_ids is None or not (start and end):
+                raise ValueError("force_ids, start and end are required when prune_unavailable is False")
+            pairs = [(force_id, month) for force_id in force_ids for month in month_range(start, end)]
 
+        def fetch(pair):
+            force_id, month = pair
+            return self._as_records(self.get_response(url=f"{self.base_url}/stops-force",
+                                                      params=dict(force=force_id, date=month)),
+                                    StopSearchRecords, as_columnar, as_geodataframe)
 
+        yield from map_concurrently(fetch, pairs, max_workers=max_workers)
+
+    def iter_stop_searches_for_coords_for_months(self,
+                                                 lat:Union[str,float],
+                                                 lng:Union[str,float],
+                                                 start:Union[str,datetime.date],
+                                                 end:Union[str,datetime.date],
+                                                 max_workers:int=4)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_stop_searches_for_coords` for every available month from `start` to `end`
+        ("YYYY-MM"), fetched concurrently and yielded as `(month, stop_searches, error)`.
+        """
+        return self.iter_months(self.get_stop_searches_for_coords, start, end, lat, lng,
+                                max_workers=max_workers)
 
+    def iter_stop_searches_for_area_for_months(self,
+                                               bounding_box:Union[List[str], List[float]],
+                                               start:Union[str,datetime.date],
+                                               end:Union[str,datetime.date],
+                                               max_workers:int=4)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_stop_searches_for_area` for every available month from `start` to `end`.
+        """
+        return self.iter_months(self.get_stop_searches_for_area, start, end, bounding_box,
+                                max_workers=max_workers)
+
+    def iter_stop_searches_for_location_for_months(self,
+                                                   location_id:Union[str,int],
+                                                   start:Union[str,datetime.date],
+                                                   end:Union[str,datetime.date],
+                                                   max_workers:int=4)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_stop_searches_for_location` for every available month from `start` to `end`.
+        """
+        return self.iter_months(self.get_stop_searches_for_location, start, end, location_id,
+                                max_workers=max_workers)
+
+    def iter_stop_searches_for_force_for_months(self,
+                                                force_id:Union[str,int],
+                                                start:Union[str,datetime.date],
+                                                end:Union[str,datetime.date],
+                                                max_workers:int=4)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_stop_searches_for_force` for every available month from `start` to `end`.
+        """
+        return self.iter_months(self.get_stop_searches_for_force, start, end, force_id,
+                                max_workers=max_workers)
+
+    def iter_stop_searches_reported_by_force_for_months(self,
+                                                        force_id:Union[str,int],
+                                                        start:Union[str,datetime.date],
+                                                        end:Union[str,datetime.date],
+                                                        max_workers:int=4)->Iterator[Tuple[str,Any,Optional[BaseException]]]:
+        """
+        `get_stop_searches_reported_by_force` for every available month from `start` to `end`.
+        """
+        return self.iter_months(self.get_stop_searches_reported_by_force, start, end, force_id,
+                                max_workers=max_workers)
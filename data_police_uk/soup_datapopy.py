@@ -1,73 +1,154 @@
 
-from utils.soup import Soup
-import re, time
-from utils.selenium_imports import Select, START, END, By, EC
-from urllib.parse import urljoin
-import pandas as pd, json
-from utils.extract_zip_file import ExtractZipFile
-from typing import Dict,Any,Optional,List,Set,Union
-from selenium import webdriver
 from pathlib import Path
+from .utils.soup import Soup
+from .utils.response import Transport, get_transport
+import re, time, datetime, os
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup as bs
+import pandas as pd, json, io
+from .utils.extract_zip_file import ExtractZipFile
+from .utils.concurrency import map_concurrently
+from .utils.locator import NeighborhoodLocator
+from .utils.cache import DEFAULT_CACHE_DIR, REFERENCE_CACHE
+from typing import Dict,Any,Optional,List,Set,Union,Tuple,Callable
 
 class ForceNotFound(Exception):
     pass
 class MoreThanOneForceFound(Exception):
     pass
+class DownloadUrlNotFound(Exception):
+    pass
 
 
 class CustomDownload:
-    def __init__(self):
+    MANIFEST_FILE = "manifest.json"
+    FORM_OPTIONS_FILE = DEFAULT_CACHE_DIR.joinpath("data_form_options.json")
+
+    def __init__(self, transport:Optional[Transport]=None, form_ttl:float=6 * 3600):
+        self._own_transport = transport
         self._url = "https://data.police.uk"
         self._data_url = f"{self._url}/data"
-        self._made_soup = None#Soup(self._data_url).make_soup()
+        self.form_ttl = form_ttl
+        self.manifest = []
         #print("Custom Download Crimes Data:\n\t",self._soup.find("div",{"id":"downloads"}).find("p").text)
+
+    @property
+    def _transport(self)->Transport:
+        """The instance's own transport, or the current process-wide default."""
+        return self._own_transport or get_transport()
+
     @property
     def _soup(self):
-        if self._made_soup is None:
-            self._made_soup = Soup(self._data_url).make_soup()
-        return self._made_soup
-    
+        # No per-instance copy: `refresh_form_options` on any instance must reach them all
+        return self._page_soup(self._data_url)
+
+    def _page_soup(self, url:str):
+        """
+        Parsed page at `url`, fetched on first use and shared by every instance in the
+        process (through `REFERENCE_CACHE`) until `form_ttl` expires.
+        """
+        return REFERENCE_CACHE.get_or_set(("page", url),
+                                          lambda: Soup(url, transport=self._transport).make_soup(),
+                                          ttl=self.form_ttl)
+
+    def _parse_form_options(self)->Dict[str,Any]:
+        """Walk the archive form once and keep its options as plain JSON-serializable data."""
+        return {"from_dates" : {x.attrs.get("value"):x.text for x in self._soup.find(name="select",attrs={"id":"id_date_from"}).find_all("option")},
+                "to_dates" : {x.attrs.get("value"):x.text for x in self._soup.find(name="select",attrs={"id":"id_date_to"}).find_all("option")},
+                "forces" : [{"force_name":re.sub("\n","",x.text).lstrip(" "),
+                             "force_id" : x.find("input").attrs.get("value"),
+                             "option_id" : x.find("input").attrs.get("id")} for x in self._soup.find("ul", {"id":"id_forces"}).find_all("li")]}
+
+    @staticmethod
+    def _index_form_options(raw:Dict[str,Any])->Dict[str,Any]:
+        """Precompute the sets and lookups the form properties and validation need."""
+        month = lambda x: re.findall(r"\w+[^ \d+]", x)[0]
+        year = lambda x: re.findall(r"\d+", x)[0]
+        from_texts, to_texts = list(raw["from_dates"].values()), list(raw["to_dates"].values())
+        exact = {}
+        for option in raw["forces"]:
+            exact[option.get("force_id").lower()] = option
+            exact[option.get("force_name").strip().lower()] = option
+        return {**raw,
+                "start_months" : set(month(x) for x in from_texts),
+                "start_years" : set(year(x) for x in from_texts),
+                "end_months" : set(month(x) for x in to_texts),
+                "end_years" : set(year(x) for x in to_texts),
+                "option_ids" : [x.get("option_id") for x in raw["forces"]],
+                "force_lookup" : exact,
+                "available_months" : sorted(CustomDownload._month_key(x) for x in set(from_texts) | set(to_texts))}
+
+    def _load_form_options(self)->Dict[str,Any]:
+        """
+        Read the form options from `FORM_OPTIONS_FILE` while it is younger than `form_ttl`,
+        otherwise parse the page and persist them for the next process.
+        """
+        path = self.FORM_OPTIONS_FILE
+        try:
+            if time.time() - path.stat().st_mtime < self.form_ttl:
+                with open(path) as f:
+                    raw = json.load(f)
+                if raw.get("url") == self._data_url:
+                    return self._index_form_options(raw)
+        except (OSError, ValueError):
+            pass
+        raw = {"url" : self._data_url, **self._parse_form_options()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(path.suffix + ".part")
+            with open(partial, "w") as f:
+                json.dump(raw, f)
+            os.replace(partial, path)
+        except OSError as e:
+            print(f"The form options could not be saved to {path}: {e}")
+        return self._index_form_options(raw)
+
+    @property
+    def _form_options(self)->Dict[str,Any]:
+        return REFERENCE_CACHE.get_or_set(("form-options", self._data_url), self._load_form_options, ttl=self.form_ttl)
+
+    def refresh_form_options(self)->None:
+        """Forget the cached and persisted form options (and page) so they are parsed again."""
+        REFERENCE_CACHE.invalidate(("form-options", self._data_url))
+        REFERENCE_CACHE.invalidate(("page", self._data_url))
+        try:
+            self.FORM_OPTIONS_FILE.unlink()
+        except OSError:
+            pass
 
     @property
     def DATE_OPTIONS(self)->Dict[str,Dict[str,Any]]:
-        
-        return {"from_dates":{
-    x.attrs.get("value"):x.text for x in self._soup.find(name="select",attrs={"id":"id_date_from"}).find_all("option")
-},
-"to_dates":{
-    x.attrs.get("value"):x.text for x in self._soup.find(name="select",attrs={"id":"id_date_to"}).find_all("option")
-}}
+        return {"from_dates" : self._form_options["from_dates"],
+                "to_dates" : self._form_options["to_dates"]}
 
     @property
     def FORCE_OPTIONS(self)->List[Dict[str,Any]]:
-        return [{"force_name":re.sub("\n","",x.text).lstrip(" "),
- "force_id" : x.find("input").attrs.get("value"),
- "option_id" : x.find("input").attrs.get("id")} for x in self._soup.find("ul", {"id":"id_forces"}).find_all("li")]
+        return self._form_options["forces"]
     
     
     @property
     def START_DATE_OPTIONS(self)->List[Any]:
-        return self.DATE_OPTIONS.get("from_dates").values()
+        return self._form_options["from_dates"].values()
     
     @property
     def END_DATE_OPTIONS(self)->List[Any]:
-        return self.DATE_OPTIONS.get("to_dates").values()
+        return self._form_options["to_dates"].values()
     @property
     def START_MONTHS(self)->Set[str]:
-        return set([re.findall("\w+[^ \d+]", x)[0] for x in list(self.START_DATE_OPTIONS)])
+        return self._form_options["start_months"]
     @property
     def START_YEARS(self)->Set[str]:
-        return set([re.findall("\d+", x)[0] for x in list(self.START_DATE_OPTIONS)])
+        return self._form_options["start_years"]
     @property
     def END_MONTHS(self)->Set[str]:
-        return set([re.findall("\w+[^ \d+]", x)[0] for x in list(self.END_DATE_OPTIONS)])
+        return self._form_options["end_months"]
     @property
     def END_YEARS(self)->Set[str]:
-        return set([re.findall("\d+", x)[0] for x in list(self.END_DATE_OPTIONS)])
+        return self._form_options["end_years"]
 
     @property
     def FORCE_ID_OPTIONS(self)->List[str]:
-        return [x.get("option_id") for x in self.FORCE_OPTIONS]
+        return self._form_options["option_ids"]
     
     
     def filter_forces_for_name(self, force:str)->Optional[List[str]]:
@@ -108,11 +189,29 @@ class CustomDownload:
                                start_year:Union[str,int], 
                                end_month:Union[str,int], 
                                end_year:Union[str,int], 
-                               force:str,
+                               force:Union[str,List[str]],
                               include_outcomes_data:bool=False,
-                              include_stop_search_data:bool=False):
-        force_option_id = self.get_option_id_for_force(force)
-        assert isinstance(force_option_id, str), "More than one force option Ids were found for given force"
+                              include_stop_search_data:bool=False,
+                              timeout:float=300,
+                              poll_interval:float=2,
+                              browser_fallback:bool=True)->Optional[str]:
+        """
+        Generate a custom archive on data.police.uk and return its download link.
+
+        The form is submitted with a plain HTTP POST through the shared transport and the
+        resulting page is polled until the archive link appears. If that fails, a headless
+        Chrome is used instead, unless `browser_fallback` is False.
+
+        params
+        start_month, start_year, end_month, end_year : Period as shown in the form, e.g. "January", "2024".
+        force : Name of the force, matched with `filter_forces_for_name`. A list of names, or
+                "all", packs several forces into one archive.
+        include_outcomes_data, include_stop_search_data : Add these datasets to the archive.
+        timeout : Seconds to wait for the archive to be generated.
+        poll_interval : Seconds between checks of the generation page.
+        browser_fallback : Fall back to Selenium when the HTTP submission fails.
+        """
+        force_option_ids = [x.get("option_id") for x in self.resolve_forces(force)]
         start = f"{start_month} {start_year}"
         end = f"{end_month} {end_year}"
         assert start_month in self.START_MONTHS, f"Start Months should be in {self.START_MONTHS}"
@@ -121,19 +220,154 @@ class CustomDownload:
         assert end_year in self.END_YEARS,f"End Months should be in {self.END_YEARS}"
         assert start in self.START_DATE_OPTIONS, f"Start should be in {self.START_DATE_OPTIONS}"
         assert end in self.END_DATE_OPTIONS, f"End should be in {self.END_DATE_OPTIONS}"
-        assert force_option_id in self.FORCE_ID_OPTIONS, f"Force option shoud be in {self.FORCE_ID_OPTIONS}"
+        assert all(x in self.FORCE_ID_OPTIONS for x in force_option_ids), f"Force option shoud be in {self.FORCE_ID_OPTIONS}"
         
         
+        try:
+            return self._get_download_url_over_http(start, end, force_option_ids,
+                                                    include_outcomes_data, include_stop_search_data,
+                                                    timeout=timeout, poll_interval=poll_interval)
+        except Exception as e:
+            print(f"Submitting the download form over HTTP failed: {e}")
+            if not browser_fallback:
+                raise
+        print("Falling back to a headless browser")
+        return self._get_download_url_with_browser(start, end, force_option_ids,
+                                                   include_outcomes_data, include_stop_search_data)
+
+    def resolve_forces(self, forces:Union[str,List[str]])->List[Dict[str,Any]]:
+        """
+        The `FORCE_OPTIONS` entries for a force name, a list of names, or "all".
+        Raises `MoreThanOneForceFound` when a name matches several forces.
+        """
+        if isinstance(forces, str) and forces.lower() == "all":
+            return list(self.FORCE_OPTIONS)
+        names = [forces] if isinstance(forces, str) else list(forces)
+        resolved = []
+        exact = self._form_options["force_lookup"]
+        for name in names:
+            option = exact.get(name.strip().lower()) or self.filter_forces_for_name(name)
+            if not isinstance(option, dict):
+                raise MoreThanOneForceFound(f"More than one force option Ids were found for {name!r}")
+            if option not in resolved:
+                resolved.append(option)
+        return resolved
+
+    def _get_download_form(self)->Tuple[Any, str]:
+        """
+        Fetch the download page through the shared session (which keeps the CSRF cookie)
+        and return the archive form with the URL it posts to.
+        """
+        response = self._transport.get(self._data_url)
+        response.raise_for_status()
+        soup = bs(response.content, features="html.parser")
+        downloads = soup.find("div", {"id":"downloads"}) or soup
+        form = downloads.find("form")
+        if form is None:
+            raise DownloadUrlNotFound(f"No download form was found at {self._data_url}")
+        return form, urljoin(response.url, form.attrs.get("action") or "")
+
+    @staticmethod
+    def _form_payload(form,
+                      start:str,
+                      end:str,
+                      force_ids:List[str],
+                      include_outcomes_data:bool=False,
+                      include_stop_search_data:bool=False)->List[Tuple[str,str]]:
+        """
+        Fill the archive form the way a browser would: keep hidden inputs (CSRF token) and
+        default-checked boxes, pick the date options by their visible text, tick the
+        requested forces and set the outcomes/stop-and-search boxes.
+        """
+        payload = []
+        optional = {"id_include_outcomes" : include_outcomes_data,
+                    "id_include_stop_and_search" : include_stop_search_data}
+        forces_name = None
+        for field in form.find_all("input"):
+            name = field.attrs.get("name")
+            if not name:
+                continue
+            input_type = (field.attrs.get("type") or "text").lower()
+            if field.attrs.get("id") in optional:
+                if optional[field.attrs.get("id")]:
+                    payload.append((name, field.attrs.get("value", "on")))
+            elif input_type == "checkbox" and field.find_parent("ul", {"id":"id_forces"}) is not None:
+                forces_name = name
+            elif input_type in ("checkbox", "radio"):
+                if field.has_attr("checked"):
+                    payload.append((name, field.attrs.get("value", "on")))
+            elif input_type not in ("submit", "button", "image", "reset"):
+                payload.append((name, field.attrs.get("value", "")))
+        for select_id, text in (("id_date_from", start), ("id_date_to", end)):
+            select = form.find("select", {"id":select_id})
+            option = next((x for x in select.find_all("option") if x.text.strip() == text), None) if select else None
+            if option is None:
+                raise DownloadUrlNotFound(f"'{text}' is not an option of {select_id}")
+            payload.append((select.attrs.get("name"), option.attrs.get("value", option.text)))
+        payload.extend((forces_name or "forces", x) for x in force_ids)
+        return payload
+
+    @staticmethod
+    def _find_archive_link(content:bytes, base_url:str)->Optional[str]:
+        soup = bs(content, features="html.parser")
+        container = soup.find(id="content") or soup
+        links = [x.attrs.get("href") for x in container.find_all("a", href=True)]
+        archive = next((x for x in links if re.search(r"\.zip($|\?)", x)), None)
+        return urljoin(base_url, archive) if archive else None
+
+    def _get_download_url_over_http(self,
+                                    start:str,
+                                    end:str,
+                                    force_ids:List[str],
+                                    include_outcomes_data:bool=False,
+                                    include_stop_search_data:bool=False,
+                                    timeout:float=300,
+                                    poll_interval:float=2)->str:
+        """
+        Submit the archive form with a plain POST and poll the page it redirects to until
+        the generated archive link appears.
+        """
+        form, action = self._get_download_form()
+        force_values = {x.get("option_id") : x.get("force_id") for x in self.FORCE_OPTIONS}
+        payload = self._form_payload(form, start, end, [force_values.get(x, x) for x in force_ids],
+                                     include_outcomes_data, include_stop_search_data)
+        response = self._transport.post(action, data=payload, headers={"Referer" : self._data_url})
+        response.raise_for_status()
+        started = time.monotonic()
+        while True:
+            link = self._find_archive_link(response.content, response.url)
+            if link:
+                return link
+            if time.monotonic() - started + poll_interval > timeout:
+                raise DownloadUrlNotFound(f"The archive was not ready after {timeout}s ({response.url})")
+            time.sleep(poll_interval)
+            response = self._transport.get(response.url, headers={"Referer" : self._data_url})
+            response.raise_for_status()
+
+    def _get_download_url_with_browser(self,
+                                       start:str,
+                                       end:str,
+                                       force_option_ids:Union[str,List[str]],
+                                       include_outcomes_data:bool=False,
+                                       include_stop_search_data:bool=False)->Optional[str]:
+        """
+        Submit the archive form in a headless Chrome. Only used as a fallback; Selenium is
+        imported on demand.
+        """
+        if isinstance(force_option_ids, str):
+            force_option_ids = [force_option_ids]
+        from .utils.selenium_imports import Select, START, END, By, EC
         driver, wait = START(self._data_url, headless=True, user_agent=True, verbose=True)
         try:
             from_date_select = Select(driver.find_element(By.ID, "id_date_from"))
             from_date_select.select_by_visible_text(start)
             to_date_select = Select(driver.find_element(By.ID, "id_date_to"))
             to_date_select.select_by_visible_text(end)
-            force=driver.find_element(By.CSS_SELECTOR, '#{}'.format(force_option_id))
-            
-            #print(force.get_attribute("value"))
-            force.click()
+            for force_option_id in force_option_ids:
+                force=driver.find_element(By.CSS_SELECTOR, '#{}'.format(force_option_id))
+                
+                #print(force.get_attribute("value"))
+                force.click()
             if include_outcomes_data:
                 print("="*127)
                 print("Including Outcomes Data....")
@@ -170,35 +404,382 @@ class CustomDownload:
                                force:str,
                               include_outcomes_data:bool=False,
                               include_stop_search_data:bool=False,
-                                        data_folder:str="data"):
-        download_url = {}
-        while not download_url:
-            download_url = self.get_download_url(start_month,
+                                        data_folder:str="data",
+                                        max_attempts:int=3,
+                                        progress:Optional[Callable[[int,Optional[int]],None]]=None,
+                                        kinds:Optional[List[str]]=None):
+        """
+        Generate, download and extract an archive into `<data_folder>/<force_id>`.
+        The list of extracted files is kept in `self.manifest`.
+
+        params
+        max_attempts : Attempts at obtaining the download link.
+        progress : Optional. Called as `progress(downloaded_bytes, total_bytes)` during the download.
+        kinds : Optional. Only extract these datasets ("street", "outcomes", "stop-and-search").
+        """
+        download_url = self._get_download_url_with_retries(start_month,
                                                            start_year,
                                                            end_month,
                                                            end_year,
                                                            force,
                                                            include_outcomes_data,
-                                                           include_stop_search_data)
-        try:
-            force_id = self.filter_forces_for_name(force).get("force_id")
-        except:
-            raise MoreThanOneForceFound("More than one force IDs were matched")
+                                                           include_stop_search_data,
+                                                           max_attempts=max_attempts)
+        force_id = self._get_force_id(force)
 
         extract_to_folder = Path(f"{data_folder}/{force_id}")
 
         extract_to_folder.mkdir(exist_ok=True, parents=True)
 
-        extract=ExtractZipFile(url=download_url,
-                      extract_to_folder=extract_to_folder).extract_zip_file_to_folder
+        with ExtractZipFile(url=download_url,
+                      extract_to_folder=extract_to_folder,
+                      transport=self._transport,
+                      progress=progress) as archive:
+            self.manifest = archive.extract(kinds=kinds)
+        self._update_folder_manifest(extract_to_folder, force_id, self.manifest,
+                                     self._months_between(f"{start_month} {start_year}", f"{end_month} {end_year}"),
+                                     self._requested_kinds(include_outcomes_data, include_stop_search_data, kinds))
         return extract_to_folder.absolute()
+
+    def _get_download_url_with_retries(self, *args, max_attempts:int=3, **kwargs)->str:
+        download_url = None
+        for attempt in range(max_attempts):
+            download_url = self.get_download_url(*args, **kwargs)
+            if download_url:
+                break
+            if attempt + 1 < max_attempts:
+                time.sleep(min(30, 2 ** attempt))
+        if not download_url:
+            raise DownloadUrlNotFound(f"No download link was obtained after {max_attempts} attempts")
+        return download_url
+
+    def _get_force_id(self, force:str)->str:
+        return self.resolve_forces(force)[0].get("force_id")
+
+    @staticmethod
+    def _month_key(text:str)->str:
+        """"January 2024" -> "2024-01"."""
+        return datetime.datetime.strptime(text.strip(), "%B %Y").strftime("%Y-%m")
+
+    @staticmethod
+    def _month_text(key:str)->Tuple[str,str]:
+        """"2024-01" -> ("January", "2024")."""
+        date = datetime.datetime.strptime(key, "%Y-%m")
+        return date.strftime("%B"), date.strftime("%Y")
+
+    def _months_between(self, start:str, end:str)->List[str]:
+        start, end = self._month_key(start), self._month_key(end)
+        return [x for x in self.AVAILABLE_MONTHS if start <= x <= end]
+
+    @staticmethod
+    def _requested_kinds(include_outcomes_data:bool=False,
+                         include_stop_search_data:bool=False,
+                         kinds:Optional[List[str]]=None)->List[str]:
+        requested = ["street"]
+        if include_outcomes_data:
+            requested.append("outcomes")
+        if include_stop_search_data:
+            requested.append("stop-and-search")
+        return [x for x in requested if kinds is None or x in kinds]
+
+    @property
+    def AVAILABLE_MONTHS(self)->List[str]:
+        """Months ("YYYY-MM") offered by the archive form, oldest first. The last one is the latest release."""
+        return self._form_options["available_months"]
+
+    @property
+    def LATEST_RELEASE(self)->Optional[str]:
+        """The newest month ("YYYY-MM") offered by the archive form, i.e. the latest release."""
+        return self.AVAILABLE_MONTHS[-1] if self.AVAILABLE_MONTHS else None
+
+    def read_folder_manifest(self, folder:Union[str,Path])->Dict[str,Any]:
+        """
+        The sync manifest of a force folder:
+        `{"force_id", "months": {"YYYY-MM": {"kinds", "files", "synced_at"}}, "unpublished": {"YYYY-MM": {"kinds", "checked_at", "release"}}}`.
+        Folders without one (extracted before manifests were kept) are indexed from the
+        `YYYY-MM/YYYY-MM-<force>-<kind>.csv` files they hold.
+        """
+        folder = Path(folder)
+        path = folder.joinpath(self.MANIFEST_FILE)
+        if path.exists():
+            with open(path) as f:
+                return json.load(f)
+        manifest = {"force_id" : folder.name, "months" : {}, "unpublished" : {}}
+        for file in sorted(folder.rglob("*.csv")):
+            parsed = ExtractZipFile.parse_member_name(file.relative_to(folder).as_posix())
+            if parsed.get("month") is None:
+                continue
+            month = manifest["months"].setdefault(parsed["month"], {"kinds" : [], "files" : [], "synced_at" : None})
+            if parsed["kind"] not in month["kinds"]:
+                month["kinds"].append(parsed["kind"])
+            month["files"].append(file.relative_to(folder).as_posix())
+        return manifest
+
+    def _update_folder_manifest(self,
+                                folder:Path,
+                                force_id:str,
+                                entries:List[Dict[str,Any]],
+                                months:List[str],
+                                kinds:List[str])->Dict[str,Any]:
+        """
+        Merge newly extracted files into `<folder>/manifest.json`, written atomically.
+
+        A month only holds the kinds it has a file for. Requested kinds the archive held
+        no file for are listed under `"unpublished"` with the time they were checked and
+        the latest release at the time; `get_missing_months` skips them until a newer
+        release is offered.
+        """
+        manifest = self.read_folder_manifest(folder)
+        manifest["force_id"] = force_id
+        unpublished = manifest.setdefault("unpublished", {})
+        synced_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        release = self.LATEST_RELEASE
+        for entry in entries:
+            if entry.get("month") is None or entry.get("path") is None:
+                continue
+            record = manifest["months"].setdefault(entry["month"], {"kinds" : [], "files" : [], "synced_at" : None})
+            file = Path(entry["path"]).relative_to(folder).as_posix()
+            if file not in record["files"]:
+                record["files"].append(file)
+            if entry.get("kind") and entry["kind"] not in record["kinds"]:
+                record["kinds"] = sorted(record["kinds"] + [entry["kind"]])
+            record["synced_at"] = synced_at
+        for month in months:
+            held = manifest["months"].get(month, {}).get("kinds", [])
+            absent = sorted(set(kinds) - set(held))
+            if absent:
+                unpublished[month] = {"kinds" : absent, "checked_at" : synced_at, "release" : release}
+            else:
+                unpublished.pop(month, None)
+        manifest["months"] = dict(sorted(manifest["months"].items()))
+        manifest["unpublished"] = dict(sorted(unpublished.items()))
+        folder.mkdir(parents=True, exist_ok=True)
+        partial = folder.joinpath(self.MANIFEST_FILE + ".part")
+        with open(partial, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(partial, folder.joinpath(self.MANIFEST_FILE))
+        return manifest
+
+    def get_missing_months(self,
+                           force:str,
+                           start:Optional[str]=None,
+                           end:Optional[str]=None,
+                           include_outcomes_data:bool=False,
+                           include_stop_search_data:bool=False,
+                           data_folder:str="data",
+                           kinds:Optional[List[str]]=None)->List[str]:
+        """
+        Months ("YYYY-MM") offered by the archive form that `<data_folder>/<force_id>` does
+        not hold yet with every requested dataset.
+
+        Datasets a force did not publish for a month (recorded under `"unpublished"` in the
+        manifest) are not reported again until the archive offers a newer release than the
+        one they were checked against, so forces that never publish e.g. stop and searches
+        do not cause the same months to be downloaded on every sync.
+
+        params
+        start, end : Optional. "YYYY-MM" bounds; every available month by default.
+        """
+        folder = Path(data_folder).joinpath(self._get_force_id(force))
+        manifest = self.read_folder_manifest(folder) if folder.exists() else {"months" : {}}
+        held, unpublished = manifest["months"], manifest.get("unpublished", {})
+        wanted = set(self._requested_kinds(include_outcomes_data, include_stop_search_data, kinds))
+        release = self.LATEST_RELEASE
+
+        def is_missing(month:str)->bool:
+            absent = wanted - set(held.get(month, {}).get("kinds", []))
+            if not absent:
+                return False
+            checked = unpublished.get(month, {})
+            # Checked against the current release: nothing new can have been published since
+            return not (checked.get("release") == release and absent <= set(checked.get("kinds", [])))
+
+        return [x for x in self.AVAILABLE_MONTHS
+                if (start is None or x >= start) and (end is None or x <= end) and is_missing(x)]
+
+    @staticmethod
+    def _contiguous_runs(months:List[str])->List[Tuple[str,str]]:
+        """Group sorted "YYYY-MM" months into `(first, last)` runs of consecutive months."""
+        runs = []
+        for month in months:
+            year, number = map(int, month.split("-"))
+            if runs:
+                last_year, last_number = map(int, runs[-1][1].split("-"))
+                if (year, number) == (last_year + last_number // 12, last_number % 12 + 1):
+                    runs[-1] = (runs[-1][0], month)
+                    continue
+            runs.append((month, month))
+        return runs
+
+    def sync_crimes_data(self,
+                         force:str,
+                         start:Optional[str]=None,
+                         end:Optional[str]=None,
+                         include_outcomes_data:bool=False,
+                         include_stop_search_data:bool=False,
+                         data_folder:str="data",
+                         max_attempts:int=3,
+                         progress:Optional[Callable[[int,Optional[int]],None]]=None,
+                         kinds:Optional[List[str]]=None)->Dict[str,Any]:
+        """
+        Bring `<data_folder>/<force_id>` up to date, downloading only the months it does not
+        hold yet. Holdings are read from the folder's `manifest.json`, compared with the
+        months offered by the archive form (which end at the latest release), and each run
+        of consecutive missing months is fetched as one archive and merged into the folder.
+
+        params
+        start, end : Optional. "YYYY-MM" bounds; every available month by default.
+        kinds : Optional. Only extract these datasets ("street", "outcomes", "stop-and-search").
+
+        Returns a summary: `{"force_id", "folder", "downloaded", "up_to_date", "files"}`.
+        """
+        force_id = self._get_force_id(force)
+        folder = Path(data_folder).joinpath(force_id)
+        missing = self.get_missing_months(force, start, end, include_outcomes_data,
+                                          include_stop_search_data, data_folder, kinds)
+        summary = {"force_id" : force_id,
+                   "folder" : folder.absolute(),
+                   "downloaded" : missing,
+                   "up_to_date" : [x for x in self.AVAILABLE_MONTHS
+                                   if (start is None or x >= start) and (end is None or x <= end) and x not in missing],
+                   "files" : []}
+        if not missing:
+            print(f"{force_id} is up to date")
+            return summary
+        folder.mkdir(parents=True, exist_ok=True)
+        requested_kinds = self._requested_kinds(include_outcomes_data, include_stop_search_data, kinds)
+        for first, last in self._contiguous_runs(missing):
+            print(f"Downloading {first} to {last} for {force_id}")
+            download_url = self._get_download_url_with_retries(*self._month_text(first),
+                                                               *self._month_text(last),
+                                                               force,
+                                                               include_outcomes_data,
+                                                               include_stop_search_data,
+                                                               max_attempts=max_attempts)
+            with ExtractZipFile(url=download_url,
+                                extract_to_folder=folder,
+                                transport=self._transport,
+                                progress=progress) as archive:
+                entries = archive.extract(kinds=kinds)
+            # Recorded after each run so an interrupted sync resumes where it stopped
+            run = [x for x in missing if first <= x <= last]
+            self._update_folder_manifest(folder, force_id, entries, run, requested_kinds)
+            summary["files"].extend(entries)
+        self.manifest = summary["files"]
+        return summary
+
+    def get_crimes_data_for_forces(self,
+                                   start_month:Union[str,int],
+                                   start_year:Union[str,int],
+                                   end_month:Union[str,int],
+                                   end_year:Union[str,int],
+                                   forces:Union[str,List[str]]="all",
+                                   include_outcomes_data:bool=False,
+                                   include_stop_search_data:bool=False,
+                                   data_folder:str="data",
+                                   pack:bool=True,
+                                   max_workers:int=4,
+                                   max_attempts:int=3,
+                                   progress:Optional[Callable[[int,int,str,Optional[BaseException]],None]]=None,
+                                   kinds:Optional[List[str]]=None)->Dict[str,Dict[str,Any]]:
+        """
+        Download one period for several forces into `<data_folder>/<force_id>` each.
+
+        With `pack=True` every force is ticked in a single archive request, the archive is
+        downloaded once and split into the per-force folders. Forces the packed archive
+        held no file for, or could not be extracted from it, then get their own archive,
+        as does every force if the packed request fails (or `pack=False`). These are
+        fetched by a pool of at most `max_workers` threads. Failures do not stop the other
+        forces.
+
+        params
+        forces : A list of force names, or "all".
+        pack : Request one archive for all forces instead of one per force.
+        max_workers : Forces downloaded at once when not packed.
+        progress : Optional. Called as `progress(done, total, force_id, error)` as each force finishes.
+        kinds : Optional. Only extract these datasets ("street", "outcomes", "stop-and-search").
+
+        Returns a report keyed by force ID: `{"status", "folder", "files", "error"}`, where
+        status is "ok", "empty" (the force's own archive held no file) or "failed". Only
+        forces with files are recorded in their folder's manifest.
+        A summary line per force is printed at the end.
+        """
+        options = self.resolve_forces(forces)
+        force_ids = [x.get("force_id") for x in options]
+        months = self._months_between(f"{start_month} {start_year}", f"{end_month} {end_year}")
+        requested_kinds = self._requested_kinds(include_outcomes_data, include_stop_search_data, kinds)
+        report = {}
+
+        def record(force_id:str, entries:Optional[List[Dict[str,Any]]], error:Optional[BaseException]):
+            folder = Path(data_folder).joinpath(force_id)
+            if error is not None:
+                report[force_id] = {"status" : "failed", "folder" : None, "files" : [], "error" : error}
+            elif not entries:
+                # Nothing on disk to record; the months stay missing for a later sync
+                report[force_id] = {"status" : "empty", "folder" : None, "files" : [], "error" : None}
+            else:
+                self._update_folder_manifest(folder, force_id, entries, months, requested_kinds)
+                report[force_id] = {"status" : "ok", "folder" : folder.absolute(),
+                                    "files" : entries, "error" : None}
+            if progress is not None:
+                progress(len(report), len(force_ids), force_id, error)
+
+        if pack and len(options) > 1:
+            try:
+                download_url = self._get_download_url_with_retries(start_month, start_year, end_month, end_year,
+                                                                   force_ids,
+                                                                   include_outcomes_data, include_stop_search_data,
+                                                                   max_attempts=max_attempts)
+                with ExtractZipFile(url=download_url,
+                                    extract_to_folder=Path(data_folder),
+                                    transport=self._transport) as archive:
+                    for force_id in force_ids:
+                        try:
+                            entries = archive.extract(forces=[force_id], kinds=kinds,
+                                                      destination=Path(data_folder).joinpath(force_id))
+                        except Exception as e:
+                            print(f"Extracting {force_id} from the packed archive failed ({e})")
+                            continue
+                        # Forces the packed archive left out get their own request below
+                        if entries:
+                            record(force_id, entries, None)
+            except Exception as e:
+                print(f"The packed archive request failed ({e}); downloading forces one by one")
+
+        pending = [x for x in options if x.get("force_id") not in report]
+
+        def download(option:Dict[str,Any])->List[Dict[str,Any]]:
+            download_url = self._get_download_url_with_retries(start_month, start_year, end_month, end_year,
+                                                               option.get("force_id"),
+                                                               include_outcomes_data, include_stop_search_data,
+                                                               max_attempts=max_attempts)
+            with ExtractZipFile(url=download_url,
+                                extract_to_folder=Path(data_folder).joinpath(option.get("force_id")),
+                                transport=self._transport) as archive:
+                return archive.extract(kinds=kinds)
+
+        for option, entries, error in map_concurrently(download, pending, max_workers=max_workers):
+            record(option.get("force_id"), entries, error)
+
+        report = {x : report[x] for x in force_ids}
+        self.manifest = [y for x in report.values() for y in x["files"]]
+        for force_id, status in report.items():
+            detail = f"{len(status['files'])} files" if status["error"] is None else str(status["error"])
+            print(f"{force_id:<32} {status['status']:<7} {detail}")
+        return report
     
 class Boundaries(CustomDownload):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._boundaries_url = f"{self._data_url}/boundaries"
-        self._boundaries_soup=Soup(self._boundaries_url).make_soup()
-        print("Boundaries Data:\n\t",self._boundaries_soup.find("div",{"id":"downloads"}).find("p").text)
+
+    @property
+    def _boundaries_soup(self):
+        return self._page_soup(self._boundaries_url)
+
+    @property
+    def DESCRIPTION(self)->str:
+        return self._boundaries_soup.find("div",{"id":"downloads"}).find("p").text
     
     @property
     def FORCE_BOUNDARIES_URL(self)->Optional[List[Dict[str,Any]]]:
@@ -214,14 +795,64 @@ class Boundaries(CustomDownload):
     @property
     def LATEST_NEIGHBORHOOD_BOUNDARY_URLS(self):
         return self.NEIGHBORHOOD_BOUNDARIES_URLS[list(self.NEIGHBORHOOD_BOUNDARIES_URLS.keys())[0]]
+
+    def download_neighborhood_boundaries(self,
+                                         release:Optional[str]=None,
+                                         download_folder:Optional[Union[str,Path]]=None,
+                                         refresh:bool=False)->Path:
+        """
+        Download a neighbourhood boundary KML archive, keeping it for later runs.
+
+        params
+        release : Optional. A key of `NEIGHBORHOOD_BOUNDARIES_URLS`; the latest by default.
+        download_folder : Optional. Where archives are kept; `<cache dir>/boundaries` by default.
+        refresh : Download again even if the archive is already there.
+        """
+        url = self.NEIGHBORHOOD_BOUNDARIES_URLS[release] if release else self.LATEST_NEIGHBORHOOD_BOUNDARY_URLS
+        folder = Path(download_folder) if download_folder else DEFAULT_CACHE_DIR.joinpath("boundaries")
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder.joinpath(Path(url.split("?")[0]).name or "neighbourhoods.zip")
+        if path.exists() and not refresh:
+            return path
+        response = self._transport.get(url, stream=True)
+        try:
+            response.raise_for_status()
+            partial = path.with_suffix(path.suffix + ".part")
+            with open(partial, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+            partial.replace(path)
+        finally:
+            response.close()
+        return path
+
+    def get_neighborhood_locator(self,
+                                 release:Optional[str]=None,
+                                 forces:Optional[List[str]]=None,
+                                 download_folder:Optional[Union[str,Path]]=None)->NeighborhoodLocator:
+        """
+        Build an offline `NeighborhoodLocator` covering every force from the KML archive
+        (downloaded once, see `download_neighborhood_boundaries`).
+
+        params
+        release : Optional. A key of `NEIGHBORHOOD_BOUNDARIES_URLS`; the latest by default.
+        forces : Optional. Only load these force IDs.
+        """
+        path = self.download_neighborhood_boundaries(release=release, download_folder=download_folder)
+        return NeighborhoodLocator.from_kml_archive(path, forces=forces)
     
 class OpenData(CustomDownload):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._open_data_url = f"{self._data_url}/open-data"
-        self._open_data_soup = Soup(self._open_data_url).make_soup()
-        
-        print("Open Data:\n\t",self._open_data_soup.find("div",{"id":"downloads"}).find("p").text)
+
+    @property
+    def _open_data_soup(self):
+        return self._page_soup(self._open_data_url)
+
+    @property
+    def DESCRIPTION(self)->str:
+        return self._open_data_soup.find("div",{"id":"downloads"}).find("p").text
     
     @property
     def OPEN_DATA_URLS(self)->Dict[str,Any]:
@@ -231,13 +862,19 @@ class StatisticalData(CustomDownload):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._stats_data_url = f"{self._data_url}/statistical-data"
-        self._stats_data_soup = Soup(self._stats_data_url).make_soup()
-        
-        print("Statistical Data:\n\t",self._stats_data_soup.find("div",{"id":"downloads"}).find("p").text)
+
+    @property
+    def _stats_data_soup(self):
+        return self._page_soup(self._stats_data_url)
+
+    @property
+    def DESCRIPTION(self)->str:
+        return self._stats_data_soup.find("div",{"id":"downloads"}).find("p").text
         
     @property
     def STATISTICAL_DATA_URLS(self)->Optional[List[Dict[str,Any]]]:
-        df=pd.read_html(self._stats_data_url)[0]
+        # Read from the page already fetched instead of downloading it again
+        df=pd.read_html(io.StringIO(str(self._stats_data_soup)))[0]
 
         urls=[x.attrs.get("href") for x in self._stats_data_soup.find("div",{"id":"downloads"}).find_all("a", href=True)]
 
@@ -0,0 +1,224 @@
+import re
+from pathlib import Path
+import pandas as pd
+from pandas.api.types import union_categoricals
+from typing import Optional, Dict, Any, Iterable, Iterator, Union, IO
+
+
+ARCHIVE_SCHEMAS = {
+    "street" : {
+        "Crime ID" : "string",
+        "Month" : "category",
+        "Reported by" : "category",
+        "Falls within" : "category",
+        "Longitude" : "float64",
+        "Latitude" : "float64",
+        "Location" : "category",
+        "LSOA code" : "category",
+        "LSOA name" : "category",
+        # Open category set: older files use names since retired, e.g. "Violent crime"
+        "Crime type" : "category",
+        "Last outcome category" : "category",
+        "Context" : "string",
+    },
+    "outcomes" : {
+        "Crime ID" : "string",
+        "Month" : "category",
+        "Reported by" : "category",
+        "Falls within" : "category",
+        "Longitude" : "float64",
+        "Latitude" : "float64",
+        "Location" : "category",
+        "LSOA code" : "category",
+        "LSOA name" : "category",
+        "Outcome type" : "category",
+    },
+    "stop-and-search" : {
+        "Type" : "category",
+        "Date" : "string",
+        "Part of a policing operation" : "boolean",
+        "Policing operation" : "category",
+        "Latitude" : "float64",
+        "Longitude" : "float64",
+        "Gender" : "category",
+        "Age range" : "category",
+        "Self-defined ethnicity" : "category",
+        "Officer-defined ethnicity" : "category",
+        "Legislation" : "category",
+        "Object of search" : "category",
+        "Outcome" : "category",
+        "Outcome linked to object of search" : "boolean",
+        "Removal of more than just outer clothing" : "boolean",
+    },
+}
+
+_KIND_PATTERN = re.compile(r"-(street|outcomes|stop-and-search)\.csv$", re.IGNORECASE)
+
+
+def archive_kind(path:Union[str,Path])->Optional[str]:
+    """
+    Dataset kind of an archive CSV from its file name: "street", "outcomes" or
+    "stop-and-search", or None for other files.
+    """
+    match = _KIND_PATTERN.search(str(path))
+    return match.group(1).lower() if match else None
+
+
+def snake_case(column:str)->str:
+    """"Last outcome category" -> "last_outcome_category"."""
+    return re.sub(r"[^0-9a-z]+", "_", column.lower()).strip("_")
+
+
+def read_archive_csv(source:Union[str,Path,IO],
+                     kind:Optional[str]=None,
+                     columns:Optional[Iterable[str]]=None,
+                     chunksize:Optional[int]=None,
+                     categorical:bool=True,
+                     rename:bool=False,
+                     **kwargs)->Union[pd.DataFrame,Iterator[pd.DataFrame]]:
+    """
+    Read a data.police.uk archive CSV with explicit column types.
+
+    Coordinates are parsed as floats, the stop-and-search flags as nullable booleans and
+    the stop-and-search `Date` as a timestamp. Repetitive text columns (`Crime type`,
+    `Falls within`, `LSOA code`, ...) are read as categoricals, which cuts memory use
+    several times over compared to plain strings.
+
+    Args:
+        source (str, Path or file-like): The CSV file, or an open member of the archive.
+        kind (str, optional): "street", "outcomes" or "stop-and-search". Guessed from the
+            file name when not given.
+        columns (iterable of str, optional): Only read these columns (original header names).
+        chunksize (int, optional): Return an iterator of frames of this many rows instead of
+            one frame, so files larger than memory can be processed.
+        categorical (bool, optional): Read text columns as categoricals. Defaults to True.
+        rename (bool, optional): Rename columns to snake_case. Defaults to False.
+        **kwargs: Passed on to `pandas.read_csv`.
+
+    Returns:
+        DataFrame or iterator of DataFrames.
+
+    Raises:
+        ValueError: If the kind is unknown and cannot be guessed from the file name.
+    """
+    kind = kind or archive_kind(getattr(source, "name", source))
+    if kind not in ARCHIVE_SCHEMAS:
+        raise ValueError(f"Unknown archive CSV kind {kind!r}; choose from {list(ARCHIVE_SCHEMAS)}")
+    schema = ARCHIVE_SCHEMAS[kind]
+    columns = list(columns) if columns is not None else None
+    dtypes = {}
+    for name, dtype in schema.items():
+        if columns is not None and name not in columns:
+            continue
+        if not categorical and (dtype == "category" or isinstance(dtype, pd.CategoricalDtype)):
+            dtype = "string"
+        dtypes[name] = dtype
+    # Read as text and converted per frame: the offsets need `utc=True`
+    parse_dates = [x for x in ("Date",) if x in dtypes and kind == "stop-and-search"]
+    reader = pd.read_csv(source,
+                         usecols=columns,
+                         dtype=dtypes,
+                         chunksize=chunksize,
+                         **kwargs)
+
+    def finish(frame:pd.DataFrame)->pd.DataFrame:
+        for name in parse_dates:
+            frame[name] = pd.to_datetime(frame[name], utc=True, errors="coerce")
+        if rename:
+            frame = frame.rename(columns=snake_case)
+        return frame
+
+    if chunksize is None:
+        return finish(reader)
+    return (finish(frame) for frame in reader)
+
+
+def concat_frames(frames:Iterable[pd.DataFrame])->pd.DataFrame:
+    """
+    Concatenate frames read by `read_archive_csv`, unioning categorical columns so they
+    stay categorical (plain `pd.concat` falls back to object when categories differ).
+    """
+    frames = [x for x in frames if x is not None]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    categorical = [name for name, dtype in frames[0].dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    combined = {}
+    for name in categorical:
+        if all(name in x.columns and isinstance(x[name].dtype, pd.CategoricalDtype) for x in frames):
+            combined[name] = union_categoricals([x[name] for x in frames], ignore_order=True)
+    frame = pd.concat([x.drop(columns=list(combined)) for x in frames], ignore_index=True)
+    for name, values in combined.items():
+        frame[name] = values
+    return frame[frames[0].columns]
+
+
+def iter_archive_frames(paths:Iterable[Union[str,Path,Dict[str,Any]]],
+                        kind:Optional[str]=None,
+                        columns:Optional[Iterable[str]]=None,
+                        chunksize:Optional[int]=None,
+                        **kwargs)->Iterator[pd.DataFrame]:
+    """
+    Read several archive CSVs one after another, yielding one frame per file or per chunk.
+
+    Args:
+        paths (iterable): File paths, or manifest entries from `ExtractZipFile.extract`.
+        kind (str, optional): Only read files of this kind; other files are skipped.
+        columns, chunksize, **kwargs: See `read_archive_csv`.
+
+    Yields:
+        DataFrame: The next file or chunk.
+    """
+    columns = list(columns) if columns is not None else None
+    for path in paths:
+        if isinstance(path, dict):
+            path = path.get("path")
+        if path is None:
+            continue
+        file_kind = archive_kind(path)
+        if file_kind is None or (kind is not None and file_kind != kind):
+            continue
+        result = read_archive_csv(path, kind=file_kind, columns=columns, chunksize=chunksize, **kwargs)
+        if chunksize is None:
+            yield result
+        else:
+            yield from result
+
+
+def load_archive_folder(folder:Union[str,Path],
+                        kind:str="street",
+                        forces:Optional[Iterable[str]]=None,
+                        months:Optional[Iterable[str]]=None,
+                        columns:Optional[Iterable[str]]=None,
+                        chunksize:Optional[int]=None,
+                        **kwargs)->Union[pd.DataFrame,Iterator[pd.DataFrame]]:
+    """
+    Load the archive CSVs of one kind found under `folder` (the `YYYY-MM/YYYY-MM-<force>-<kind>.csv`
+    layout written by `CustomDownload.get_crimes_data_for_period`).
+
+    Args:
+        folder (str or Path): Folder the archive was extracted to.
+        kind (str, optional): "street" (default), "outcomes" or "stop-and-search".
+        forces (iterable of str, optional): Only these force IDs.
+        months (iterable of str, optional): Only these months ("YYYY-MM").
+        columns, **kwargs: See `read_archive_csv`.
+        chunksize (int, optional): Return an iterator of frames instead of one frame.
+
+    Returns:
+        DataFrame or iterator of DataFrames.
+    """
+    forces = set(forces) if forces is not None else None
+    months = set(months) if months is not None else None
+    paths = []
+    for path in sorted(Path(folder).rglob(f"*-{kind}.csv")):
+        month, force = path.name[:7], path.name[8:-len(f"-{kind}.csv")]
+        if forces is not None and force not in forces:
+            continue
+        if months is not None and month not in months:
+            continue
+        paths.append(path)
+    frames = iter_archive_frames(paths, kind=kind, columns=columns, chunksize=chunksize, **kwargs)
+    if chunksize is not None:
+        return frames
+    return concat_frames(frames)
@@ -0,0 +1,227 @@
+import sqlite3, threading, hashlib, json, os, time, zlib
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("DATAPOPY_CACHE_DIR") or Path.home().joinpath(".cache", "datapopy"))
+
+
+class ResponseCache:
+    """
+    A persistent, size-capped cache of raw API response bodies.
+
+    Entries are stored compressed in a SQLite database and keyed on the request URL plus
+    its normalized query parameters. Each entry records the data version it was fetched
+    under (the API's `/crime-last-updated` date); looking it up under a different version
+    drops it, so a new monthly release invalidates everything fetched before it. When the
+    stored bodies exceed `max_size_bytes` the least recently used entries are evicted.
+
+    The cache is safe to share between threads and between processes.
+
+    Args:
+        directory (str or Path, optional): Folder holding the database. Defaults to
+            `$DATAPOPY_CACHE_DIR` or `~/.cache/datapopy`.
+        max_size_bytes (int, optional): Cap on the total compressed size. Defaults to 1 GiB.
+        file_name (str, optional): Database file name. Defaults to "responses.sqlite3".
+
+    Attributes:
+        hits (int): Lookups answered from the cache by this instance.
+        misses (int): Lookups that were not.
+    """
+    def __init__(self,
+                 directory:Optional[Union[str,Path]]=None,
+                 max_size_bytes:int=1 << 30,
+                 file_name:str="responses.sqlite3"):
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory.joinpath(file_name)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._connection as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT,
+                    version TEXT,
+                    body BLOB,
+                    size INTEGER,
+                    created REAL,
+                    last_access REAL
+                )"""
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+
+    @staticmethod
+    def normalize_params(params:Optional[Dict[str,Any]])->Dict[str,str]:
+        """
+        Normalize query parameters so equivalent requests share a key:
+        keys are sorted, numbers are rendered consistently and list values are
+        joined the way the API expects polygons (`lat,lng:lat,lng`).
+        """
+        normalized = {}
+        for key, value in sorted((params or {}).items()):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ":".join(str(x).replace(" ", "") for x in value)
+            elif isinstance(value, float):
+                value = repr(value)
+            normalized[str(key)] = str(value).strip()
+        return normalized
+
+    @classmethod
+    def make_key(cls, url:str, params:Optional[Dict[str,Any]]=None)->str:
+        payload = json.dumps([url.rstrip("/"), cls.normalize_params(params)], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key:str, version:Optional[str]=None)->Optional[bytes]:
+        """
+        Return the cached body for `key`, or None if it is missing or was stored under a
+        different `version`.
+        """
+        with self._lock, self._connection as con:
+            row = con.execute("SELECT body, version FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, stored_version = row
+            if stored_version != (version or ""):
+                con.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            con.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return zlib.decompress(body)
+
+    def set(self, key:str, body:bytes, version:Optional[str]=None, url:Optional[str]=None)->None:
+        """Store `body` under `key` and evict least recently used entries beyond the size cap."""
+        compressed = zlib.compress(body)
+        now = time.time()
+        with self._lock, self._connection as con:
+            con.execute(
+                "INSERT OR REPLACE INTO responses (key, url, version, body, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, version or "", compressed, len(compressed), now, now)
+            )
+            self._evict(con)
+
+    def _evict(self, con:sqlite3.Connection)->None:
+        total = con.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+        excess = total - self.max_size_bytes
+        freed = 0
+        stale = []
+        for key, size in con.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        con.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def invalidate(self, version:Optional[str]=None)->int:
+        """
+        Drop entries stored under any version other than `version`, or every entry when
+        `version` is None. Returns the number of entries removed.
+        """
+        with self._lock, self._connection as con:
+            if version is None:
+                cursor = con.execute("DELETE FROM responses")
+            else:
+                cursor = con.execute("DELETE FROM responses WHERE version != ?", (version,))
+            return cursor.rowcount
+
+    def clear(self)->None:
+        self.invalidate()
+
+    def stats(self)->Dict[str,Any]:
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "path" : str(self.path),
+            "entries" : entries,
+            "size_bytes" : size,
+            "max_size_bytes" : self.max_size_bytes,
+            "hits" : self.hits,
+            "misses" : self.misses,
+        }
+
+    def close(self)->None:
+        with self._lock:
+            self._connection.close()
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A thread-safe in-memory cache whose entries expire after a time-to-live.
+
+    `get_or_set` loads a missing key only once even when many threads ask for it at the
+    same time; the others wait and share the result. Cached values are shared between
+    callers and should be treated as read-only.
+
+    Args:
+        ttl (float, optional): Default lifetime of an entry in seconds. Defaults to 6 hours.
+    """
+    def __init__(self, ttl:float=6 * 3600):
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get(self, key:Any, default:Any=None)->Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key:Any, value:Any, ttl:Optional[float]=None)->None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+
+    def get_or_set(self, key:Any, loader, ttl:Optional[float]=None)->Any:
+        """
+        Return the cached value for `key`, calling `loader()` to fill it if needed.
+        A None result is returned but not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl)
+            return value
+
+    def invalidate(self, key:Any=_MISSING)->None:
+        """Drop `key`, or every entry when no key is given."""
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def clear(self)->None:
+        self.invalidate()
+
+
+# Reference datasets (forces, crime categories, neighbourhood lists, ...) shared by every client in the process
+REFERENCE_CACHE = TTLCache()
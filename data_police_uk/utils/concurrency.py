@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Tuple, Any, Optional
+
+
+def map_concurrently(func:Callable,
+                     items:Iterable[Any],
+                     max_workers:int=8,
+                     progress:Optional[Callable[[int,int,Any,Optional[BaseException]],None]]=None,
+                     ) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Call `func(item)` for every item on a thread pool and yield results as they complete.
+
+    Failures do not stop the batch: each result is yielded as an `(item, result, error)`
+    tuple where exactly one of `result`/`error` is meaningful. Requests made by `func`
+    still go through the shared transport, so its rate limiter bounds the overall pace.
+
+    Args:
+        func (callable): Function applied to each item.
+        items (iterable): Items to process.
+        max_workers (int, optional): Number of worker threads. Defaults to 8.
+        progress (callable, optional): Called as `progress(done, total, item, error)`
+            after each item finishes.
+
+    Yields:
+        tuple: `(item, result, error)` in completion order.
+    """
+    items = list(items)
+    total = len(items)
+    if not total:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, total))
+    futures = {executor.submit(func, item) : item for item in items}
+    try:
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            if progress is not None:
+                progress(done, total, item, error)
+            yield item, result, error
+    finally:
+        # Stop queued work if the caller abandons the generator early
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -4,7 +4,7 @@ import pandas as pd
 import json
 import io
 import os
-from response import Response
+from .response import Response
 import re
 import urllib.parse as urlparser
 
@@ -23,18 +23,20 @@ class Dataset:
             **kwargs: A dictionary of keyword arguments.  The following keys are supported:
                 - doc_url (str): The URL of the documentation.
                 - file_path (str): The path to a file.
+                - transport (Transport): Optional custom transport. Defaults to the shared pooled transport.
 
         """
         self.doc_url = kwargs.get("doc_url")
         self.file_path = kwargs.get("file_path")
+        self._transport = kwargs.get("transport")
         self._supported_extensions = ["csv", "ods", "xlsx", "xls", "json", "pdf",
                                      "text/csv", "geojson"]
     
     def _response(self, **kwargs):
         if self.doc_url:
-            return Response(self.doc_url).assert_response()
+            return Response(self.doc_url, transport=self._transport).assert_response()
         else:
-            return Response(**kwargs).assert_response()
+            return Response(transport=self._transport, **kwargs).assert_response()
     
     def _guess_extension(self):
     
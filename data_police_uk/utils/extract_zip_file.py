@@ -1,8 +1,11 @@
 
-import zipfile, tempfile
-from response import Response
-from typing import Union, Optional,Tuple
+import zipfile, tempfile, hashlib, time, re, shutil, threading, fnmatch, os
+import requests
 from pathlib import Path
+from .response import Transport, get_transport
+from .retry import RequestFailed, HTTPStatusError
+from .concurrency import map_concurrently
+from typing import Union, Optional, Tuple, Callable, Iterable, Iterator, List, Dict, Any
 
 class ExtractZipFile:
     """
@@ -12,6 +15,17 @@ class ExtractZipFile:
         url (str): The URL of the zip file to be extracted.
         extract_to_folder (str): The path to the folder where the zip file 
                                should be extracted.  The folder should exist.
+        transport (Transport, optional): Custom transport used for the download.
+                               Defaults to the shared pooled transport.
+        progress (callable, optional): Called as `progress(downloaded_bytes, total_bytes)`
+                               while the archive downloads; `total_bytes` is None when unknown.
+        expected_size (int, optional): Size the archive must have once downloaded.
+        sha256 (str, optional): Hex digest the archive must match once downloaded.
+        chunk_size (int, optional): Bytes written to disk at a time. Defaults to 1 MiB.
+        max_resumes (int, optional): How many times an interrupted download is resumed
+                               with an HTTP Range request before giving up. Defaults to 5.
+        archive_path (str or Path, optional): An archive already on disk to use instead of
+                               downloading `url`.
 
     Attributes:
         url (str): The URL of the zip file.
@@ -21,27 +35,64 @@ class ExtractZipFile:
                           might be updated in a more complete implementation.
 
     Note:
-        This class currently only initializes attributes.  The actual extraction 
-        logic is missing and needs to be implemented.  The `_file_name` attribute 
-        suggests future functionality to handle file_name determination.
+        A downloaded archive lives in a temporary directory until `cleanup()` is called
+        (or the object is used as a context manager), so several selections can be
+        extracted or read from one download.
     """
-    def __init__(self, url:str, extract_to_folder:Union[str|Path]):
+    def __init__(self, url:str, extract_to_folder:Union[str|Path], transport:Optional[Transport]=None,
+                 progress:Optional[Callable[[int,Optional[int]],None]]=None,
+                 expected_size:Optional[int]=None,
+                 sha256:Optional[str]=None,
+                 chunk_size:int=1 << 20,
+                 max_resumes:int=5,
+                 archive_path:Optional[Union[str,Path]]=None):
         self.url = url
+        self._transport = transport
+        self.progress = progress
+        self.expected_size = expected_size
+        self.sha256 = sha256.lower() if sha256 else None
+        self.chunk_size = chunk_size
+        self.max_resumes = max_resumes
         self.extract_to_folder = Path(extract_to_folder) if isinstance(extract_to_folder, str) else extract_to_folder
-        self._file_name = "randomFileName"
+        self._file_name = (Path(url.split("?")[0]).name if url else "") or "archive.zip"
+        self._archive_path = Path(archive_path) if archive_path else None
+        self._made_temp_dir = None
+        self.manifest = []
         
     @property
     def _temp_dir(self):
-        """Creates and returns a temporary directory.
+        """Creates (once) and returns a temporary directory.
 
-        This property creates a temporary directory using `tempfile.mkdtemp()` and 
-        returns its path.  
+        This property creates a temporary directory using `tempfile.mkdtemp()` on first
+        access and returns the same path afterwards; `cleanup()` removes it.
 
         Returns:
-            str: The path to the newly created temporary directory.
+            str: The path to the temporary directory.
         """
-        temp_dir = tempfile.mkdtemp()
-        return Path(temp_dir)
+        if self._made_temp_dir is None:
+            self._made_temp_dir = Path(tempfile.mkdtemp())
+        return self._made_temp_dir
+
+    @property
+    def archive_path(self)->Path:
+        """Path of the archive on disk, downloading it on first access."""
+        if self._archive_path is None:
+            self._archive_path = self.download(self._temp_file_path)
+        return self._archive_path
+
+    def cleanup(self)->None:
+        """Removes the temporary directory holding a downloaded archive."""
+        if self._made_temp_dir is not None:
+            shutil.rmtree(self._made_temp_dir, ignore_errors=True)
+            if self._archive_path is not None and self._made_temp_dir in self._archive_path.parents:
+                self._archive_path = None
+            self._made_temp_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
     
     @property
     def _temp_file_path(self):
@@ -58,44 +109,273 @@ class ExtractZipFile:
         #return os.path.join(self._temp_dir, self._file_name)
         return self._temp_dir.joinpath(self._file_name)
     
-    @property
-    def _get_zip_file(self)->Optional[str]:
-        """
-        Retrieves the content of a zip file from a URL.
+    @staticmethod
+    def _total_size(response:requests.Response, offset:int)->Optional[int]:
+        """Full size of the file from `Content-Range` (206) or `Content-Length` (200)."""
+        content_range = response.headers.get("Content-Range")
+        if content_range:
+            match = re.search(r"/(\d+)\s*$", content_range)
+            if match:
+                return int(match.group(1))
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit():
+            return int(length) + (offset if response.status_code == 206 else 0)
+        return None
+
+    def download(self, destination:Union[str,Path])->Path:
+        """Streams the archive to `destination` in chunks, resuming after interruptions.
+
+        Data is written to `<destination>.part` and only renamed once complete and verified,
+        so memory use does not depend on the archive size. A connection dropped mid-download
+        is resumed with an HTTP `Range` request; if the server ignores the range the download
+        starts over. A `.part` file already next to `destination` is resumed the same way, so
+        pass a stable `destination` to pick up a download an earlier run left unfinished (the
+        `archive_path` property downloads into a fresh temporary directory, which never has one).
 
-        This property method fetches the content of a zip file located at the URL 
-        specified by the `self.url` attribute.  It uses a Response object (presumably 
-        from a library like `requests`) to make the request and asserts that the response 
-        is successful before returning the content.
+        The archive is requested with `Accept-Encoding: identity`, so the bytes written, the
+        `Range` offsets and `Content-Length` all count the same, undecoded, file.
+
+        Args:
+            destination (str or Path): Where the archive is saved.
 
         Returns:
-            bytes: The raw content of the zip file as bytes.  Returns None if there is an error during the request or assertion.
+            Path: The downloaded file.
 
         Raises:
-            AssertionError: If the HTTP request does not return a successful status code.  (The specific exception raised depends on the `assertResponse()` method used).
+            RequestFailed: If the server refuses the download or it keeps failing after
+                `max_resumes` resumptions.
+            ValueError: If the size or checksum does not match.
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        partial = destination.with_name(destination.name + ".part")
+        transport = self._transport or get_transport()
+        digest = hashlib.sha256()
+        offset = 0
+        if partial.exists():
+            with open(partial, "rb") as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(chunk)
+                    offset += len(chunk)
+        total = None
+        resumes = 0
+        while True:
+            # No transfer compression: offsets must count bytes of the archive itself
+            headers = {"Accept-Encoding" : "identity"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            try:
+                response = transport.get(self.url, headers=headers, stream=True)
+            except requests.RequestException as e:
+                raise RequestFailed(f"Failed to download {self.url}: {e}", url=self.url) from e
+            try:
+                if response.status_code == 416 and offset:
+                    # The partial file already holds the whole archive
+                    total = offset
+                    break
+                if response.status_code not in (200, 206):
+                    raise HTTPStatusError(f"{response.status_code} {response.reason} for url: {self.url}",
+                                          url=self.url, response=response)
+                if response.status_code == 200 and offset:
+                    print("The server does not support resuming; restarting the download")
+                    offset, digest = 0, hashlib.sha256()
+                total = self._total_size(response, offset)
+                with open(partial, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if not chunk:
+                            continue
+                        f.write(chunk)
+                        digest.update(chunk)
+                        offset += len(chunk)
+                        if self.progress is not None:
+                            self.progress(offset, total)
+                if total is None or offset >= total:
+                    break
+                raise requests.exceptions.ChunkedEncodingError(f"Connection closed at {offset} of {total} bytes")
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                resumes += 1
+                if resumes > self.max_resumes:
+                    raise RequestFailed(f"Download of {self.url} failed after {resumes} attempts: {e}",
+                                        url=self.url) from e
+                print(f"Download interrupted at {offset} bytes ({e}); resuming")
+                time.sleep(min(30, 2 ** (resumes - 1)))
+            finally:
+                response.close()
 
-        Notes:
-            This is a private method (indicated by the leading underscore), suggesting it's intended for internal use within the class.  The specifics of `Response` and `assertResponse` depend on the external libraries in use.
+        expected_size = self.expected_size or total
+        if expected_size is not None and offset != expected_size:
+            partial.unlink()
+            raise ValueError(f"Downloaded {offset} bytes from {self.url}, expected {expected_size}")
+        if self.sha256 and digest.hexdigest() != self.sha256:
+            partial.unlink()
+            raise ValueError(f"Checksum mismatch for {self.url}: got {digest.hexdigest()}, expected {self.sha256}")
+        partial.replace(destination)
+        return destination
+
+    # Archive members are named "<YYYY-MM>/<YYYY-MM>-<force>-<dataset>.csv"
+    _member_pattern = re.compile(r"(?:^|/)(?P<month>\d{4}-\d{2})-(?P<force>.+)-(?P<kind>street|outcomes|stop-and-search)\.csv$")
+
+    @classmethod
+    def parse_member_name(cls, name:str)->Dict[str,Optional[str]]:
+        """Splits an archive member name into its month, force and dataset kind.
+
+        Args:
+            name (str): Member name, e.g. "2024-01/2024-01-leicestershire-street.csv".
+
+        Returns:
+            dict: `{"month", "force", "kind"}`; the values are None for other files.
+        """
+        match = cls._member_pattern.search(name)
+        if not match:
+            return {"month" : None, "force" : None, "kind" : None}
+        return match.groupdict()
+
+    def select_members(self,
+                       pattern:Optional[str]=None,
+                       forces:Optional[Iterable[str]]=None,
+                       months:Optional[Iterable[str]]=None,
+                       kinds:Optional[Iterable[str]]=None)->List[zipfile.ZipInfo]:
+        """Lists the archive members matching every given filter.
+
+        Args:
+            pattern (str, optional): Glob matched against the member's file name,
+                e.g. "*-street.csv".
+            forces (iterable of str, optional): Force IDs to keep.
+            months (iterable of str, optional): Months ("YYYY-MM") to keep.
+            kinds (iterable of str, optional): Datasets to keep: "street", "outcomes"
+                and/or "stop-and-search".
+
+        Returns:
+            list: The matching `zipfile.ZipInfo` entries.
         """
-        response = None
+        forces = set(forces) if forces is not None else None
+        months = set(months) if months is not None else None
+        kinds = set(kinds) if kinds is not None else None
+        with zipfile.ZipFile(self.archive_path) as archive:
+            members = [x for x in archive.infolist() if not x.is_dir()]
+        selected = []
+        for member in members:
+            if pattern and not fnmatch.fnmatch(Path(member.filename).name, pattern):
+                continue
+            parsed = self.parse_member_name(member.filename)
+            if forces is not None and parsed["force"] not in forces:
+                continue
+            if months is not None and parsed["month"] not in months:
+                continue
+            if kinds is not None and parsed["kind"] not in kinds:
+                continue
+            selected.append(member)
+        return selected
+
+    def _manifest_entry(self, member:zipfile.ZipInfo, path:Optional[Path]=None)->Dict[str,Any]:
+        entry = {"member" : member.filename, "path" : path, "size" : member.file_size}
+        entry.update(self.parse_member_name(member.filename))
+        return entry
+
+    @staticmethod
+    def _member_path(member:zipfile.ZipInfo, destination:Path)->Path:
+        """Where `member` is extracted under `destination`, ignoring absolute and `..` parts."""
+        parts = [x for x in member.filename.replace("\\", "/").split("/") if x not in ("", ".", "..")]
+        return destination.joinpath(*parts)
+
+    def extract(self,
+                pattern:Optional[str]=None,
+                forces:Optional[Iterable[str]]=None,
+                months:Optional[Iterable[str]]=None,
+                kinds:Optional[Iterable[str]]=None,
+                max_workers:Optional[int]=None,
+                destination:Optional[Union[str,Path]]=None)->List[Dict[str,Any]]:
+        """Extracts the selected members to `extract_to_folder` in parallel.
+
+        Each worker thread reads the archive through its own handle; decompression
+        releases the GIL, so members are inflated on several cores at once.
+
+        Args:
+            pattern, forces, months, kinds: Member filters, see `select_members`.
+            max_workers (int, optional): Number of worker threads. Defaults to the CPU count.
+            destination (str or Path, optional): Extract here instead of `extract_to_folder`,
+                e.g. to split a multi-force archive into one folder per force.
+
+        Returns:
+            list: Manifest of every extracted file, one dict per member with its
+                `member` name, extracted `path`, uncompressed `size`, `month`, `force`
+                and `kind`. Also kept as `self.manifest`.
+        """
+        members = self.select_members(pattern, forces, months, kinds)
+        destination = Path(destination) if destination is not None else self.extract_to_folder
+        destination.mkdir(parents=True, exist_ok=True)
+        paths = {member.filename : self._member_path(member, destination) for member in members}
+        # Created up front: workers racing to create the same month folder would collide
+        for folder in sorted(set(x.parent for x in paths.values())):
+            folder.mkdir(parents=True, exist_ok=True)
+        local = threading.local()
+        handles = []
+        lock = threading.Lock()
+
+        def extract_member(member):
+            archive = getattr(local, "archive", None)
+            if archive is None:
+                archive = local.archive = zipfile.ZipFile(self.archive_path)
+                with lock:
+                    handles.append(archive)
+            path = paths[member.filename]
+            with archive.open(member) as source, open(path, "wb") as target:
+                shutil.copyfileobj(source, target, self.chunk_size)
+            return path
+
+        manifest = []
         try:
-            response = Response(self.url).assert_response()
-        except Exception as e:
-            print(f"Failed to get response from url: {self.url}", e)
-            response = None
-            return
-        
-        response_content = response.content if response.content else None
+            for member, path, error in map_concurrently(extract_member, members,
+                                                        max_workers=max_workers or os.cpu_count() or 4):
+                if error is not None:
+                    raise error
+                manifest.append(self._manifest_entry(member, path))
+        finally:
+            for archive in handles:
+                archive.close()
+        manifest.sort(key=lambda x: x["member"])
+        self.manifest = manifest
+        return manifest
+
+    def iter_csv_members(self,
+                         pattern:Optional[str]=None,
+                         forces:Optional[Iterable[str]]=None,
+                         months:Optional[Iterable[str]]=None,
+                         kinds:Optional[Iterable[str]]=None,
+                         typed:bool=False,
+                         **read_csv_kwargs)->Iterator[Tuple[Dict[str,Any],Any]]:
+        """Reads CSV members straight out of the archive, without extracting them to disk.
+
+        Args:
+            pattern, forces, months, kinds: Member filters, see `select_members`.
+            typed (bool, optional): Read street, outcomes and stop-and-search members with
+                the archive schema of `utils.archive_csv.read_archive_csv` (explicit dtypes,
+                categorical text columns). Defaults to False.
+            **read_csv_kwargs: Passed on to `pandas.read_csv`. With `chunksize`, the
+                DataFrame is replaced by an iterator of chunks that must be consumed before
+                the next member is read.
+
+        Yields:
+            tuple: `(manifest_entry, DataFrame)` for each selected CSV member.
+        """
+        import pandas as pd
+        from .archive_csv import read_archive_csv
+        members = [x for x in self.select_members(pattern, forces, months, kinds)
+                   if x.filename.lower().endswith(".csv")]
+        with zipfile.ZipFile(self.archive_path) as archive:
+            for member in members:
+                entry = self._manifest_entry(member)
+                with archive.open(member) as f:
+                    if typed and entry["kind"] is not None:
+                        yield entry, read_archive_csv(f, kind=entry["kind"], **read_csv_kwargs)
+                    else:
+                        yield entry, pd.read_csv(f, **read_csv_kwargs)
 
-        if not response_content:
-            raise ValueError("Response content is empty")
-        return response_content
-    
     def _write_zip_file_to_temp_dir(self)->Tuple[Path, Path, zipfile.ZipFile]:
         """Writes the internal zip file data to a temporary directory.
 
-        Creates a temporary directory, writes the zip file data (held internally 
-        by the object) to a file within that directory, and then opens the 
+        Creates a temporary directory, streams the zip file into it with
+        `download` (without holding it in memory), and then opens the
         created zip file using the zipfile library.
 
         Returns:
@@ -113,14 +393,11 @@ class ExtractZipFile:
         """
         #temp_dir = self._temp_dir
         #temp_file_path = os.path.join(temp_dir, self._file_name)
-        temp_file_path  = self._temp_file_path
-        #temp_file_path_parent = temp_file_path.parent
-
         try:
-            with open(temp_file_path, "wb") as f:
-                f.write(self._get_zip_file)
+            temp_file_path = self.archive_path
         except Exception as e:
-            print(f"Failed to write zip file at {temp_file_path}", e)
+            print(f"Failed to write zip file at {self._temp_file_path}", e)
+            raise
              
         
         return temp_file_path.parent, temp_file_path, zipfile.ZipFile(temp_file_path)
@@ -133,7 +410,7 @@ class ExtractZipFile:
         This property method extracts the contents of the zip file associated with the object 
         to a designated folder. It first writes the zip file to a temporary directory, 
         extracts its contents, and then cleans up the temporary files and directory.  The 
-        path to the extracted file is returned.
+        path to the first extracted file is returned; `self.manifest` lists all of them.
 
         Returns:
             str: The absolute path to the extracted file within the specified folder.  Returns None if extraction fails.
@@ -141,22 +418,15 @@ class ExtractZipFile:
         Raises:
             Exception: If any error occurs during file extraction or cleanup.  (Consider more specific exceptions if appropriate).
         """
-        temp_dir, temp_file_path, file = self._write_zip_file_to_temp_dir()
-        print(f"Temporary Directory: {temp_dir}")
-        
-        with file as f:
-            #print(f"File Names: {f.namelist()}")
-            file_name = f.namelist()[0]
-            f.extractall(self.extract_to_folder)
-        #file.extractall(extract_to_folder)
-        #os.remove(temp_file_path)
-        #os.rmdir(temp_dir)
         try:
-            print("Trying to remove the temporary zipfile and folder")
-            temp_file_path.unlink()
-            temp_dir.unlink()
-        except Exception as e:
-            print("Failed to remove the temporary content", e)
+            manifest = self.extract()
+            print(f"Temporary Directory: {self._made_temp_dir}")
+        finally:
+            print("Removing the temporary zipfile and folder")
+            self.cleanup()
+        if not manifest:
+            return None
+        file_name = manifest[0]["member"]
 
         zip_file_path = self.extract_to_folder.joinpath(file_name)#os.path.abspath(os.path.join(self.extract_to_folder, file_name))
         print(f"The file was successfully extracted to {zip_file_path}")
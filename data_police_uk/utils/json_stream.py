@@ -0,0 +1,99 @@
+import codecs, json
+from typing import Any, Iterable, Iterator, Optional
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks:Iterable[bytes],
+                    encoding:str="utf-8",
+                    decoder:Optional[json.JSONDecoder]=None)->Iterator[Any]:
+    """
+    Incrementally decode a JSON document whose top level is an array, yielding its
+    elements one at a time as soon as they are complete.
+
+    Only the undecoded tail of the body is kept in memory, so a large response never has
+    to be held as a whole. A document that is not an array is decoded in full: a non-empty
+    value is yielded as a single item, `null` yields nothing.
+
+    Args:
+        chunks (iterable of bytes): The body, e.g. `response.iter_content(chunk_size)`.
+        encoding (str, optional): Text encoding of the body. Defaults to "utf-8".
+        decoder (json.JSONDecoder, optional): Decoder to use. Defaults to a plain `JSONDecoder`.
+
+    Yields:
+        Any: Each decoded element of the array.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    decoder = decoder or json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer, pos, finished = "", 0, False
+
+    def fill()->bool:
+        nonlocal buffer, pos, finished
+        if finished:
+            return False
+        for chunk in chunks:
+            if chunk:
+                buffer, pos = buffer[pos:] + text.decode(chunk), 0
+                return True
+        buffer, pos = buffer[pos:] + text.decode(b"", final=True), 0
+        finished = True
+        return False
+
+    def skip_whitespace()->bool:
+        """Advance past whitespace; False once the body is exhausted."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return True
+            if not fill() and pos >= len(buffer):
+                return False
+
+    if not skip_whitespace():
+        return
+    if buffer[pos] != "[":
+        while fill():
+            pass
+        value = decoder.decode(buffer[pos:])
+        if isinstance(value, list):
+            yield from value
+        elif value is not None:
+            yield value
+        return
+    pos += 1
+
+    expect_value = True
+    while True:
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+        char = buffer[pos]
+        if char == "]":
+            return
+        if char == ",":
+            if expect_value:
+                raise json.JSONDecodeError("Expecting value", buffer, pos)
+            pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The element is split across chunks; read more and try again
+            if fill():
+                continue
+            raise
+        # A number cut at a chunk boundary ("-500." or "12") may continue in the next chunk
+        if (not finished and not isinstance(value, (dict, list, str))
+                and (end == len(buffer) or buffer[end] not in _WHITESPACE + ",]")):
+            fill()
+            continue
+        pos = end
+        expect_value = False
+        yield value
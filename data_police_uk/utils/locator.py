@@ -0,0 +1,207 @@
+import io, zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import numpy as np
+import shapely
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Union
+
+
+def parse_kml_coordinates(text:str)->np.ndarray:
+    """
+    Parse a KML `<coordinates>` string ("lng,lat[,alt] lng,lat[,alt] ...") into an
+    `(n, 2)` float64 array of `(lng, lat)`.
+
+    Args:
+        text (str): Content of the `<coordinates>` element.
+
+    Returns:
+        numpy.ndarray: The vertices, without altitude.
+    """
+    tuples = text.split()
+    if not tuples:
+        return np.empty((0, 2), dtype=np.float64)
+    width = tuples[0].count(",") + 1
+    values = np.array(",".join(tuples).split(","), dtype=np.float64)
+    return values.reshape(-1, width)[:, :2]
+
+
+def parse_kml_polygons(kml:Union[str,bytes])->Optional[shapely.geometry.base.BaseGeometry]:
+    """
+    Read every `<Polygon>` of a KML document, including holes, into one geometry.
+
+    Args:
+        kml (str or bytes): The KML document.
+
+    Returns:
+        shapely geometry: A Polygon, a MultiPolygon when the document holds several, or
+            None when it holds none.
+    """
+    root = ET.fromstring(kml)
+    polygons = []
+    for element in root.iter():
+        if not element.tag.endswith("Polygon"):
+            continue
+        shell, holes = None, []
+        for ring in element.iter():
+            if ring.tag.endswith("outerBoundaryIs") or ring.tag.endswith("innerBoundaryIs"):
+                coordinates = next((x for x in ring.iter() if x.tag.endswith("coordinates")), None)
+                if coordinates is None or not coordinates.text:
+                    continue
+                vertices = parse_kml_coordinates(coordinates.text)
+                if len(vertices) < 3:
+                    continue
+                if ring.tag.endswith("outerBoundaryIs"):
+                    shell = vertices
+                else:
+                    holes.append(vertices)
+        if shell is not None:
+            polygons.append(shapely.geometry.Polygon(shell, holes))
+    if not polygons:
+        return None
+    return polygons[0] if len(polygons) == 1 else shapely.geometry.MultiPolygon(polygons)
+
+
+class NeighborhoodLocator:
+    """
+    Offline point-in-polygon lookup of the force and neighbourhood covering a coordinate.
+
+    Neighbourhood boundaries are loaded once into a shapely `STRtree`; `locate` then
+    resolves whole coordinate batches with a single vectorized tree query instead of one
+    `/locate-neighbourhood` request per point. Points on a shared border are assigned to
+    one of the touching neighbourhoods.
+
+    Args:
+        force_ids (iterable of str): Force of each boundary.
+        neighborhood_ids (iterable of str): Neighbourhood of each boundary.
+        geometries (iterable of shapely geometries): Boundaries in WGS84 longitude/latitude.
+    """
+    def __init__(self,
+                 force_ids:Iterable[str],
+                 neighborhood_ids:Iterable[str],
+                 geometries:Iterable[Any]):
+        self.force_ids = np.asarray(list(force_ids), dtype=object)
+        self.neighborhood_ids = np.asarray(list(neighborhood_ids), dtype=object)
+        self.geometries = np.asarray(list(geometries), dtype=object)
+        if not (len(self.force_ids) == len(self.neighborhood_ids) == len(self.geometries)):
+            raise ValueError("force_ids, neighborhood_ids and geometries must have the same length")
+        keep = np.array([g is not None and not g.is_empty for g in self.geometries], dtype=bool)
+        self.force_ids = self.force_ids[keep]
+        self.neighborhood_ids = self.neighborhood_ids[keep]
+        self.geometries = self.geometries[keep]
+        self._tree = shapely.STRtree(self.geometries)
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} neighbourhoods, {len(set(self.force_ids))} forces)"
+
+    @classmethod
+    def from_geodataframe(cls, gdf, force_id:Optional[str]=None,
+                          neighborhood_column:str="neighborhood_id",
+                          force_column:str="force_id")->"NeighborhoodLocator":
+        """
+        Build a locator from a boundary GeoDataFrame such as `Neighborhoods.POLICE_FORCE_BOUNDARY`.
+
+        Args:
+            gdf (geopandas.GeoDataFrame): Boundaries; reprojected to EPSG:4326 if needed.
+            force_id (str, optional): Force of every row, when the frame has no `force_column`.
+            neighborhood_column (str, optional): Column holding neighbourhood IDs.
+            force_column (str, optional): Column holding force IDs.
+        """
+        if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs("EPSG:4326")
+        if force_column in gdf.columns:
+            forces = gdf[force_column].tolist()
+        else:
+            forces = [force_id] * len(gdf)
+        return cls(forces, gdf[neighborhood_column].tolist(), gdf.geometry.values)
+
+    @classmethod
+    def from_kml_archive(cls,
+                         path:Union[str,Path],
+                         forces:Optional[Iterable[str]]=None)->"NeighborhoodLocator":
+        """
+        Build a locator from the neighbourhood boundary archive published at
+        data.police.uk/data/boundaries (see `Boundaries.NEIGHBORHOOD_BOUNDARIES_URLS`).
+
+        The archive holds one KML file per neighbourhood under a folder per force
+        (`<force>/<neighbourhood>.kml`). Both the zip file and an extracted copy are accepted.
+
+        Args:
+            path (str or Path): The zip archive or the folder it was extracted to.
+            forces (iterable of str, optional): Only load these force IDs.
+        """
+        path = Path(path)
+        wanted = set(forces) if forces is not None else None
+        force_ids, neighborhood_ids, geometries = [], [], []
+
+        def add(member:Path, read):
+            if member.suffix.lower() != ".kml":
+                return
+            force_id = member.parent.name
+            if wanted is not None and force_id not in wanted:
+                return
+            geometry = parse_kml_polygons(read())
+            if geometry is not None:
+                force_ids.append(force_id)
+                neighborhood_ids.append(member.stem)
+                geometries.append(geometry)
+
+        if path.is_dir():
+            for member in sorted(path.rglob("*.kml")):
+                add(member, member.read_bytes)
+        else:
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        add(Path(info.filename), lambda: archive.read(info))
+        return cls(force_ids, neighborhood_ids, geometries)
+
+    def locate(self,
+               lats:Union[float,Iterable[float]],
+               lngs:Union[float,Iterable[float]])->Tuple[np.ndarray,np.ndarray]:
+        """
+        Resolve the force and neighbourhood of each coordinate.
+
+        Args:
+            lats (array-like): Latitudes.
+            lngs (array-like): Longitudes.
+
+        Returns:
+            tuple: `(force_ids, neighborhood_ids)` object arrays aligned with the input,
+                holding None where no boundary covers the point.
+        """
+        lats = np.atleast_1d(np.asarray(lats, dtype=np.float64))
+        lngs = np.atleast_1d(np.asarray(lngs, dtype=np.float64))
+        if lats.shape != lngs.shape:
+            raise ValueError("lats and lngs must have the same shape")
+        forces = np.full(len(lats), None, dtype=object)
+        neighborhoods = np.full(len(lats), None, dtype=object)
+        valid = ~(np.isnan(lats) | np.isnan(lngs))
+        if not valid.any() or not len(self):
+            return forces, neighborhoods
+        positions = np.flatnonzero(valid)
+        point_index, tree_index = self._tree.query(shapely.points(lngs[valid], lats[valid]), predicate="intersects")
+        # Keep the first match of points on a shared border
+        point_index, first = np.unique(point_index, return_index=True)
+        tree_index = tree_index[first]
+        forces[positions[point_index]] = self.force_ids[tree_index]
+        neighborhoods[positions[point_index]] = self.neighborhood_ids[tree_index]
+        return forces, neighborhoods
+
+    def locate_point(self, lat:Union[str,float], lng:Union[str,float])->Optional[Dict[str,str]]:
+        """
+        Single-point lookup shaped like the API's `/locate-neighbourhood` answer:
+        `{"force": ..., "neighbourhood": ...}`, or None outside every boundary.
+        """
+        forces, neighborhoods = self.locate([float(lat)], [float(lng)])
+        if forces[0] is None:
+            return None
+        return {"force" : forces[0], "neighbourhood" : neighborhoods[0]}
+
+    def to_geodataframe(self):
+        """The loaded boundaries as a GeoDataFrame in EPSG:4326."""
+        import geopandas as gpd
+        return gpd.GeoDataFrame({"force_id" : self.force_ids, "neighborhood_id" : self.neighborhood_ids},
+                                geometry=list(self.geometries), crs="EPSG:4326")
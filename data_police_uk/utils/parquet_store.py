@@ -0,0 +1,184 @@
+import shutil
+from pathlib import Path
+from .archive_csv import ARCHIVE_SCHEMAS, archive_kind, read_archive_csv, snake_case
+from .concurrency import map_concurrently
+from typing import Optional, List, Dict, Any, Iterable, Union, Callable
+
+
+class ArchiveParquetStore:
+    """
+    A local Parquet copy of extracted data.police.uk archives, partitioned by force and month.
+
+    Each archive CSV is converted once into
+    `<root>/<kind>/force=<force_id>/month=<YYYY-MM>/part-0.parquet`, with the archive
+    schema of `utils.archive_csv`, compression and column statistics. Reads then touch
+    only the requested columns and partitions. Requires pyarrow.
+
+    Args:
+        root (str or Path): Folder holding the store; created on first write.
+        compression (str, optional): Parquet codec. Defaults to "zstd".
+        row_group_size (int, optional): Rows per row group. Defaults to 128 * 1024.
+    """
+    PARTITIONS = ("force", "month")
+
+    def __init__(self,
+                 root:Union[str,Path],
+                 compression:str="zstd",
+                 row_group_size:int=128 * 1024):
+        self.root = Path(root)
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.root)!r})"
+
+    def partition_path(self, kind:str, force:str, month:str)->Path:
+        """Folder of one force/month partition."""
+        return self.root / kind / f"force={force}" / f"month={month}"
+
+    def partitions(self, kind:str="street")->List[Dict[str,str]]:
+        """The `{"force", "month"}` partitions already written for `kind`, sorted."""
+        result = []
+        for path in sorted((self.root / kind).glob("force=*/month=*/*.parquet")):
+            result.append({"force" : path.parent.parent.name.split("=", 1)[1],
+                           "month" : path.parent.name.split("=", 1)[1]})
+        return result
+
+    def write_csv(self, path:Union[str,Path], overwrite:bool=False)->Optional[Dict[str,Any]]:
+        """
+        Convert one archive CSV (`YYYY-MM-<force>-<kind>.csv`) into its partition.
+
+        Args:
+            path (str or Path): The CSV file.
+            overwrite (bool, optional): Replace an existing partition. Defaults to False.
+
+        Returns:
+            dict: `{"path", "kind", "force", "month", "rows", "skipped"}`, or None when the
+                file name is not an archive CSV.
+        """
+        import pyarrow.parquet as pq
+        path = Path(path)
+        kind = archive_kind(path)
+        if kind is None:
+            return None
+        month, force = path.name[:7], path.name[8:-len(f"-{kind}.csv")]
+        destination = self.partition_path(kind, force, month) / "part-0.parquet"
+        result = {"path" : destination, "kind" : kind, "force" : force, "month" : month, "rows" : None, "skipped" : False}
+        if destination.exists() and not overwrite:
+            result["skipped"] = True
+            return result
+        frame = read_archive_csv(path, kind=kind, rename=True)
+        # The month is carried by the partition path
+        frame = frame.drop(columns=[x for x in self.PARTITIONS if x in frame.columns])
+        table = self._unified_table(frame)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed so an interrupted conversion never leaves a half file
+        partial = destination.with_suffix(".parquet.part")
+        pq.write_table(table, partial,
+                       compression=self.compression,
+                       row_group_size=self.row_group_size,
+                       write_statistics=True)
+        partial.replace(destination)
+        result["rows"] = table.num_rows
+        return result
+
+    @staticmethod
+    def _unified_table(frame):
+        """
+        `frame` as a pyarrow Table whose categorical columns are all
+        `dictionary<int32, string>`. pandas picks int8 or int16 codes by cardinality, and
+        a dataset whose partitions disagree on the index width cannot be read back.
+        """
+        import pyarrow as pa
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        # The archive categoricals are all text; an empty one would otherwise be null-typed
+        fields = [pa.field(x.name, pa.dictionary(pa.int32(), pa.string()), nullable=x.nullable)
+                  if pa.types.is_dictionary(x.type) else x for x in table.schema]
+        return table.cast(pa.schema(fields, metadata=table.schema.metadata))
+
+    def write_folder(self,
+                     folder:Union[str,Path],
+                     kinds:Optional[Iterable[str]]=None,
+                     overwrite:bool=False,
+                     max_workers:Optional[int]=4,
+                     progress:Optional[Callable[[int,int,Path,Optional[Exception]],None]]=None)->List[Dict[str,Any]]:
+        """
+        Convert every archive CSV found under `folder`, several files at a time.
+
+        Partitions that already exist are skipped unless `overwrite` is True, so the
+        conversion can be re-run after new months are extracted.
+
+        Args:
+            folder (str or Path): Folder an archive was extracted to.
+            kinds (iterable of str, optional): Only these kinds; all by default.
+            overwrite (bool, optional): Replace existing partitions. Defaults to False.
+            max_workers (int, optional): Files converted concurrently. Defaults to 4.
+            progress (callable, optional): Called as `progress(done, total, path, error)`.
+
+        Returns:
+            list: One result dict per file (see `write_csv`), with an `"error"` key set
+                when the conversion failed.
+        """
+        kinds = set(kinds) if kinds is not None else set(ARCHIVE_SCHEMAS)
+        paths = [x for x in sorted(Path(folder).rglob("*.csv")) if archive_kind(x) in kinds]
+        results = []
+        done = 0
+        for path, result, error in map_concurrently(lambda x: self.write_csv(x, overwrite=overwrite),
+                                                    paths, max_workers=max_workers):
+            done += 1
+            if error is not None:
+                result = {"path" : None, "source" : path, "rows" : None, "skipped" : False}
+            else:
+                result["source"] = path
+            result["error"] = error
+            results.append(result)
+            if progress is not None:
+                progress(done, len(paths), path, error)
+        return sorted(results, key=lambda x: str(x["source"]))
+
+    def dataset(self, kind:str="street"):
+        """The `kind` partitions as a `pyarrow.dataset.Dataset` (hive partitioning)."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        partitioning = ds.partitioning(pa.schema([(x, pa.string()) for x in self.PARTITIONS]), flavor="hive")
+        return ds.dataset(self.root / kind, format="parquet", partitioning=partitioning)
+
+    def read(self,
+             kind:str="street",
+             columns:Optional[Iterable[str]]=None,
+             forces:Optional[Iterable[str]]=None,
+             months:Optional[Iterable[str]]=None,
+             filter=None,
+             as_pandas:bool=True):
+        """
+        Read from the store, touching only the requested columns and partitions.
+
+        Args:
+            kind (str, optional): "street" (default), "outcomes" or "stop-and-search".
+            columns (iterable of str, optional): Columns to read, in snake_case
+                (`crime_type`, `lsoa_code`, ...); `force` and `month` are also available.
+            forces (iterable of str, optional): Only these force IDs.
+            months (iterable of str, optional): Only these months ("YYYY-MM").
+            filter (pyarrow.dataset.Expression, optional): Extra row filter, evaluated
+                against the row group statistics before any data is read.
+            as_pandas (bool, optional): Return a DataFrame (default) instead of a pyarrow Table.
+
+        Returns:
+            pandas.DataFrame or pyarrow.Table
+        """
+        import pyarrow.dataset as ds
+        if not (self.root / kind).exists():
+            raise FileNotFoundError(f"No {kind} partitions in {self.root}")
+        expression = filter
+        for name, values in (("force", forces), ("month", months)):
+            if values is None:
+                continue
+            condition = ds.field(name).isin([str(x) for x in values])
+            expression = condition if expression is None else expression & condition
+        columns = [snake_case(x) if x not in self.PARTITIONS else x for x in columns] if columns is not None else None
+        table = self.dataset(kind).to_table(columns=columns, filter=expression)
+        return table.to_pandas() if as_pandas else table
+
+    def remove(self, kind:Optional[str]=None):
+        """Delete the partitions of `kind`, or the whole store."""
+        shutil.rmtree(self.root / kind if kind else self.root, ignore_errors=True)
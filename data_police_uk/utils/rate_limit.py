@@ -0,0 +1,98 @@
+import threading, time, asyncio
+from typing import Dict, Any, Optional
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket.
+
+    data.police.uk allows 15 requests per second with a burst of 30; requests above
+    that budget are answered with HTTP 429. The bucket starts full and refills at
+    `rate` tokens per second up to `burst`. A caller that finds the bucket empty
+    reserves the next free slot and sleeps until it is due, so concurrent callers are
+    served in arrival order and throughput converges on `rate` without overshooting.
+
+    The same instance can be shared between threads (`acquire`) and asyncio tasks
+    (`acquire_async`); both draw from one budget.
+
+    Args:
+        rate (float, optional): Tokens added per second. Defaults to 15.
+        burst (int, optional): Bucket capacity. Defaults to 30.
+
+    Attributes:
+        acquired (int): Number of tokens handed out.
+        waited (int): Number of acquisitions that had to wait.
+        total_wait (float): Seconds callers spent waiting in total.
+        max_wait (float): Longest single wait in seconds.
+    """
+    def __init__(self, rate:float=15, burst:int=30):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self)->float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            if wait:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self)->float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self)->float:
+        """
+        Await until a request may be sent without blocking the event loop.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self)->Dict[str,Any]:
+        """Return a snapshot of the waiting statistics."""
+        with self._lock:
+            return {
+                "rate" : self.rate,
+                "burst" : self.burst,
+                "acquired" : self.acquired,
+                "waited" : self.waited,
+                "total_wait" : self.total_wait,
+                "mean_wait" : self.total_wait / self.acquired if self.acquired else 0.0,
+                "max_wait" : self.max_wait,
+            }
+
+    def reset_stats(self)->None:
+        with self._lock:
+            self.acquired = 0
+            self.waited = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
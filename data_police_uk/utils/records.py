@@ -0,0 +1,232 @@
+import numpy as np
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+
+def flatten_record(record:Dict[str,Any], prefix:str="", sep:str="_")->Dict[str,Any]:
+    """
+    Flatten nested dictionaries, joining keys with `sep`:
+    {"location": {"street": {"name": "x"}}} -> {"location_street_name": "x"}.
+    """
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{sep}{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, name, sep))
+        else:
+            flat[name] = value
+    return flat
+
+
+class CategoricalColumn:
+    """
+    A dictionary-encoded string column: integer `codes` into a `categories` array, with -1 for missing values.
+    """
+    def __init__(self, codes:np.ndarray, categories:np.ndarray):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values:Iterable[Any])->"CategoricalColumn":
+        lookup = {}
+        codes = np.fromiter((-1 if v is None else lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int32)
+        categories = np.empty(len(lookup), dtype=object)
+        for value, code in lookup.items():
+            categories[code] = value
+        return cls(codes, categories)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def to_numpy(self)->np.ndarray:
+        values = np.empty(len(self.codes), dtype=object)
+        present = self.codes >= 0
+        values[present] = self.categories[self.codes[present]]
+        return values
+
+    @property
+    def nbytes(self)->int:
+        return self.codes.nbytes + sum(len(str(x)) for x in self.categories)
+
+
+class ColumnarRecords:
+    """
+    Column-oriented container for a list of API records.
+
+    Nested records are flattened (`location.street.name` becomes `location_street_name`)
+    and every column is stored as one NumPy array: coordinates and IDs as numbers,
+    repetitive strings as dictionary-encoded `CategoricalColumn`s and free text as
+    object arrays. Subclasses declare the schema of a specific endpoint; columns not in
+    the schema are typed by inspection.
+
+    Converting to pandas (`to_pandas`) or Arrow (`to_arrow`) reuses the arrays and codes
+    without re-parsing the records.
+
+    Args:
+        columns (dict): Column name to NumPy array or `CategoricalColumn`.
+        length (int): Number of records.
+    """
+    FLOAT_COLUMNS:Tuple[str,...] = ()
+    INT_COLUMNS:Tuple[str,...] = ()
+    CATEGORICAL_COLUMNS:Tuple[str,...] = ()
+    DATETIME_COLUMNS:Tuple[str,...] = ()
+    LATITUDE_COLUMN:Optional[str] = None
+    LONGITUDE_COLUMN:Optional[str] = None
+    # Columns without a declared type are dictionary-encoded when at most this share of values is unique
+    categorical_threshold = 0.5
+
+    def __init__(self, columns:Dict[str,Any], length:int):
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_records(cls, records:Optional[Iterable[Dict[str,Any]]])->"ColumnarRecords":
+        """Build the container from decoded JSON records (a list or any iterable of dicts)."""
+        values = {}
+        length = 0
+        for record in records or []:
+            for name, value in flatten_record(record).items():
+                column = values.get(name)
+                if column is None:
+                    column = values[name] = [None] * length
+                column.append(value)
+            length += 1
+            for column in values.values():
+                if len(column) < length:
+                    column.append(None)
+        # A nested object that is sometimes null (e.g. `outcome_status`) leaves an all-null parent column
+        for name in [x for x in values if any(y.startswith(f"{x}_") for y in values)]:
+            if all(v is None for v in values[name]):
+                del values[name]
+        return cls({name : cls._convert(name, column) for name, column in values.items()}, length)
+
+    @classmethod
+    def _convert(cls, name:str, values:List[Any]):
+        if name in cls.FLOAT_COLUMNS:
+            return cls._to_float(values)
+        if name in cls.INT_COLUMNS:
+            if any(v is None or v == "" for v in values):
+                return cls._to_float(values)
+            return np.fromiter((int(v) for v in values), dtype=np.int64, count=len(values))
+        if name in cls.DATETIME_COLUMNS:
+            return np.array([np.datetime64("NaT") if not v else np.datetime64(str(v)[:19]) for v in values],
+                            dtype="datetime64[s]")
+        if name in cls.CATEGORICAL_COLUMNS:
+            return CategoricalColumn.from_values(values)
+        present = [v for v in values if v is not None]
+        if present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+            return cls._to_float(values)
+        if len(set(map(str, present))) <= cls.categorical_threshold * max(len(values), 1):
+            return CategoricalColumn.from_values(values)
+        return np.array(values, dtype=object)
+
+    @staticmethod
+    def _to_float(values:List[Any])->np.ndarray:
+        return np.fromiter((np.nan if v is None or v == "" else float(v) for v in values),
+                           dtype=np.float64, count=len(values))
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._length} records, {len(self._columns)} columns)"
+
+    @property
+    def columns(self)->List[str]:
+        return list(self._columns)
+
+    def __getitem__(self, name:str)->np.ndarray:
+        """Decoded values of a column as a NumPy array."""
+        column = self._columns[name]
+        return column.to_numpy() if isinstance(column, CategoricalColumn) else column
+
+    def get(self, name:str, default:Any=None)->Any:
+        return self[name] if name in self._columns else default
+
+    @property
+    def nbytes(self)->int:
+        """Approximate memory held by the column data."""
+        return sum(x.nbytes for x in self._columns.values())
+
+    def to_pandas(self):
+        """Convert to a pandas DataFrame; categorical columns become `pd.Categorical`."""
+        import pandas as pd
+        data = {}
+        for name, column in self._columns.items():
+            if isinstance(column, CategoricalColumn):
+                data[name] = pd.Categorical.from_codes(column.codes, categories=pd.Index(column.categories, dtype=object))
+            else:
+                data[name] = column
+        return pd.DataFrame(data, index=pd.RangeIndex(self._length))
+
+    def points(self, lat:Optional[str]=None, lng:Optional[str]=None)->np.ndarray:
+        """
+        Point geometries built in one vectorized `shapely.points` call from the coordinate
+        columns; records without coordinates get None.
+        """
+        import shapely
+        lat, lng = lat or self.LATITUDE_COLUMN, lng or self.LONGITUDE_COLUMN
+        geometry = np.full(self._length, None, dtype=object)
+        if lat not in self._columns or lng not in self._columns:
+            return geometry
+        lats, lngs = self[lat].astype(np.float64), self[lng].astype(np.float64)
+        valid = ~(np.isnan(lats) | np.isnan(lngs))
+        geometry[valid] = shapely.points(lngs[valid], lats[valid])
+        return geometry
+
+    def to_geopandas(self, lat:Optional[str]=None, lng:Optional[str]=None, crs:str="EPSG:4326"):
+        """
+        Convert to a GeoDataFrame of points in WGS84 (`EPSG:4326`), the coordinate system
+        the API reports. `lat`/`lng` default to the record type's coordinate columns.
+        """
+        import geopandas as gpd
+        return gpd.GeoDataFrame(self.to_pandas(), geometry=self.points(lat, lng), crs=crs)
+
+    def to_arrow(self):
+        """Convert to a pyarrow Table; categorical columns become dictionary arrays. Requires pyarrow."""
+        import pyarrow as pa
+        arrays = []
+        for column in self._columns.values():
+            if isinstance(column, CategoricalColumn):
+                indices = pa.array(column.codes, mask=column.codes < 0)
+                dictionary = pa.array(column.categories.tolist()) if len(column.categories) else pa.array([], type=pa.string())
+                arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+            elif column.dtype == object:
+                arrays.append(pa.array([None if v is None else str(v) for v in column], type=pa.string()))
+            else:
+                arrays.append(pa.array(column))
+        return pa.Table.from_arrays(arrays, names=self.columns)
+
+    def to_records(self)->List[Dict[str,Any]]:
+        """Flattened records, one dict per row."""
+        decoded = {name : self[name] for name in self._columns}
+        return [{name : values[i] for name, values in decoded.items()} for i in range(self._length)]
+
+
+class CrimeRecords(ColumnarRecords):
+    """Street-level crimes (`/crimes-street/...`)."""
+    LATITUDE_COLUMN, LONGITUDE_COLUMN = "location_latitude", "location_longitude"
+    FLOAT_COLUMNS = ("location_latitude", "location_longitude")
+    INT_COLUMNS = ("id", "location_street_id")
+    CATEGORICAL_COLUMNS = ("category", "location_type", "location_subtype", "context", "month",
+                           "location_street_name", "outcome_status_category", "outcome_status_date")
+
+
+class OutcomeRecords(ColumnarRecords):
+    """Street-level outcomes (`/outcomes-at-location`)."""
+    LATITUDE_COLUMN, LONGITUDE_COLUMN = "crime_location_latitude", "crime_location_longitude"
+    FLOAT_COLUMNS = ("crime_location_latitude", "crime_location_longitude")
+    INT_COLUMNS = ("crime_id", "crime_location_street_id")
+    CATEGORICAL_COLUMNS = ("category_code", "category_name", "date", "crime_category", "crime_location_type",
+                           "crime_location_subtype", "crime_context", "crime_month", "crime_location_street_name")
+
+
+class StopSearchRecords(ColumnarRecords):
+    """Stop and searches (`/stops-street`, `/stops-force`, `/stops-no-location`, ...)."""
+    LATITUDE_COLUMN, LONGITUDE_COLUMN = "location_latitude", "location_longitude"
+    FLOAT_COLUMNS = ("location_latitude", "location_longitude")
+    DATETIME_COLUMNS = ("datetime",)
+    CATEGORICAL_COLUMNS = ("type", "involved_person", "operation", "operation_name", "gender", "age_range",
+                           "self_defined_ethnicity", "officer_defined_ethnicity", "legislation",
+                           "object_of_search", "outcome", "outcome_linked_to_object_of_search",
+                           "removal_of_more_than_outer_clothing", "outcome_object_id", "outcome_object_name",
+                           "location_street_id", "location_street_name")
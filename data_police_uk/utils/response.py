@@ -1,6 +1,194 @@
-
-import requests
+import requests, threading, os, time
+from requests.adapters import HTTPAdapter
+from pathlib import Path
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, RequestFailed, HTTPStatusError, RetriesExhausted, DeadlineExceeded
 from urllib.parse import urlsplit, urlunsplit
+from typing import Optional, Dict, Any, Union, Tuple
+
+
+class Transport:
+    """
+    A pooled, keep-alive HTTP transport.
+
+    Wraps a single `requests.Session` so that every request made through it reuses
+    open TCP/TLS connections instead of performing a fresh handshake per call.
+
+    Args:
+        pool_connections (int, optional): Number of host pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept alive per host.
+            Should be at least the number of threads sharing the transport. Defaults to 32.
+        timeout (float or tuple, optional): Default `(connect, read)` timeout in seconds. Defaults to (10, 60).
+        headers (dict, optional): Extra headers sent with every request.
+        session (requests.Session, optional): A pre-configured session to use instead of a new one.
+        rate_limiter (RateLimiter or bool, optional): Token bucket every request waits on.
+            True (default) creates one matching the data.police.uk budget of 15 req/s with a
+            burst of 30; pass False to disable, or a `RateLimiter` to share one between transports.
+        retry (RetryPolicy, optional): Default retry policy for GET requests. Defaults to `RetryPolicy()`.
+    """
+    def __init__(self,
+                 pool_connections:int=10,
+                 pool_maxsize:int=32,
+                 timeout:Union[float,Tuple[float,float]]=(10, 60),
+                 headers:Optional[Dict[str,str]]=None,
+                 session:Optional[requests.Session]=None,
+                 rate_limiter:Union[RateLimiter,bool]=True,
+                 retry:Optional[RetryPolicy]=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        if rate_limiter is True:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter or None
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.session = session if session is not None else self._make_session()
+        self.session.headers.update({
+            "Accept-Encoding" : "gzip, deflate",
+            "Connection" : "keep-alive",
+        })
+        if headers:
+            self.session.headers.update(headers)
+
+    def _make_session(self)->requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(self,
+            url:str,
+            retry:Optional[RetryPolicy]=None,
+            deadline:Optional[float]=None,
+            **kwargs)->requests.Response:
+        """
+        Send a GET request through the pooled session, retrying transient failures.
+
+        Connection errors, timeouts and statuses in the policy's `status_forcelist` are
+        retried with backoff. Other responses, successful or not, are returned as-is.
+
+        Args:
+            url (str): The URL to request.
+            retry (RetryPolicy, optional): Overrides the transport's retry policy for this call.
+            deadline (float, optional): Total seconds allowed for all attempts and backoff sleeps.
+            **kwargs: Passed on to `requests.Session.get`; `timeout` falls back to the
+                transport default and is shortened to fit the deadline.
+
+        Returns:
+            requests.Response: The response. The time spent waiting on the rate limiter is
+                recorded as `rate_limit_wait` and the number of attempts as `attempts`.
+
+        Raises:
+            RetriesExhausted: If every attempt failed with a retryable error.
+            DeadlineExceeded: If the deadline ran out first.
+        """
+        policy = retry if retry is not None else self.retry
+        timeout = kwargs.pop("timeout", self.timeout)
+        started = time.monotonic()
+        waited = 0.0
+        attempt = 0
+        while True:
+            if deadline is not None:
+                remaining = deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"Deadline of {deadline}s exceeded for {url}", url=url)
+                kwargs["timeout"] = self._fit_timeout(timeout, remaining)
+            else:
+                kwargs["timeout"] = timeout
+
+            waited += self.rate_limiter.acquire() if self.rate_limiter else 0.0
+            response, error = None, None
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                error = e
+
+            if response is not None and not policy.is_retryable_status(response.status_code):
+                response.rate_limit_wait = waited
+                response.attempts = attempt + 1
+                return response
+
+            reason = str(error) if error is not None else f"HTTP {response.status_code}"
+            if attempt >= policy.max_retries:
+                raise RetriesExhausted(f"Giving up on {url} after {attempt + 1} attempts: {reason}",
+                                       url=url, attempts=attempt + 1, response=response)
+            delay = policy.get_backoff(attempt, response)
+            if deadline is not None and time.monotonic() - started + delay >= deadline:
+                raise DeadlineExceeded(f"Deadline of {deadline}s exceeded for {url}: {reason}",
+                                       url=url, response=response)
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def post(self, url:str, **kwargs)->requests.Response:
+        """
+        Send a POST request through the pooled session.
+
+        POSTs are not idempotent, so they are never retried; they still wait on the rate
+        limiter and use the default timeout.
+
+        Args:
+            url (str): The URL to post to.
+            **kwargs: Passed on to `requests.Session.post` (`data`, `headers`, ...).
+
+        Returns:
+            requests.Response: The response, whatever its status.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        waited = self.rate_limiter.acquire() if self.rate_limiter else 0.0
+        response = self.session.post(url, **kwargs)
+        response.rate_limit_wait = waited
+        response.attempts = 1
+        return response
+
+    @staticmethod
+    def _fit_timeout(timeout:Union[None,float,Tuple[float,float]], remaining:float)->Union[float,Tuple[float,float]]:
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(min(x, remaining) if x is not None else remaining for x in timeout)
+        return min(timeout, remaining)
+
+    @property
+    def rate_limit_stats(self)->Optional[Dict[str,Any]]:
+        """Waiting statistics of the rate limiter, or None when rate limiting is disabled."""
+        return self.rate_limiter.stats() if self.rate_limiter else None
+
+    def close(self):
+        self.session.close()
+
+
+_default_transport = None
+_default_transport_pid = None
+_default_transport_lock = threading.Lock()
+
+
+def get_transport()->Transport:
+    """
+    Return the process-wide default transport, creating it on first use.
+
+    A new transport is created after a fork so that child processes never share
+    sockets with their parent.
+    """
+    global _default_transport, _default_transport_pid
+    with _default_transport_lock:
+        if _default_transport is None or _default_transport_pid != os.getpid():
+            _default_transport = Transport()
+            _default_transport_pid = os.getpid()
+        return _default_transport
+
+
+def set_transport(transport:Optional[Transport])->None:
+    """
+    Replace the process-wide default transport.
+    Passing None resets it so a fresh default is created on next use.
+    """
+    global _default_transport, _default_transport_pid
+    with _default_transport_lock:
+        _default_transport = transport
+        _default_transport_pid = os.getpid() if transport is not None else None
 
 
 class Response:
@@ -9,17 +197,30 @@ class Response:
         self.params=kwargs.get("params")
         self.headers=kwargs.get("headers")
         self.auth=kwargs.get("auth")
-        
+        self.timeout=kwargs.get("timeout")
+        self.retry=kwargs.get("retry")
+        self.deadline=kwargs.get("deadline")
+        self.stream=kwargs.get("stream", False)
+        self.transport=kwargs.get("transport") or get_transport()
+
     def assert_response(self):
         #print(f"Getting the response from {self.url}")
-        response = requests.get(url=self.url,
-                               params=self.params,
-                               headers=self.headers,
-                               auth=self.auth)
-        assert response.status_code == 200, response.raise_for_status()
+        kwargs = dict(params=self.params,
+                      headers=self.headers,
+                      auth=self.auth,
+                      retry=self.retry,
+                      deadline=self.deadline,
+                      stream=self.stream)
+        if self.timeout is not None:
+            kwargs.update({"timeout" : self.timeout})
+        response = self.transport.get(self.url, **kwargs)
+        if response.status_code != 200:
+            response.close()
+            raise HTTPStatusError(f"{response.status_code} {response.reason} for url: {response.url}",
+                                  url=self.url, response=response)
         #print("The response was obtained")
         return response
-    
+
     def get_base_url(self):
         split_url = urlsplit(self.url)
         return "://".join([split_url.scheme, split_url.netloc])
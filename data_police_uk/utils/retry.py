@@ -0,0 +1,97 @@
+import random, time, datetime
+from email.utils import parsedate_to_datetime
+import requests
+from typing import Optional, Iterable
+
+
+class RequestFailed(requests.RequestException):
+    """Base class for requests that could not be completed."""
+    def __init__(self, message:str, url:Optional[str]=None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.url = url
+
+
+class HTTPStatusError(RequestFailed, requests.HTTPError):
+    """The server answered with a non-success status code."""
+    @property
+    def status_code(self)->Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+
+class RetriesExhausted(RequestFailed):
+    """Every attempt failed with a retryable error."""
+    def __init__(self, message:str, url:Optional[str]=None, attempts:int=0, **kwargs):
+        super().__init__(message, url=url, **kwargs)
+        self.attempts = attempts
+
+    @property
+    def status_code(self)->Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+
+class DeadlineExceeded(RequestFailed):
+    """The per-call deadline ran out before a response was obtained."""
+    pass
+
+
+class RetryPolicy:
+    """
+    Retry settings for idempotent requests.
+
+    Failed attempts are retried with exponential backoff and full jitter: the n-th retry
+    sleeps a random time between 0 and `min(max_backoff, backoff_factor * 2**n)` seconds.
+    When the server sends a `Retry-After` header that delay is used instead.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+        backoff_factor (float, optional): Base delay in seconds. Defaults to 0.5.
+        max_backoff (float, optional): Upper bound of a single backoff in seconds. Defaults to 30.
+        status_forcelist (iterable of int, optional): Status codes that are retried.
+            Defaults to 429, 500, 502, 503 and 504.
+        jitter (bool, optional): Randomise backoff delays. Defaults to True.
+        respect_retry_after (bool, optional): Honour `Retry-After` headers. Defaults to True.
+    """
+    def __init__(self,
+                 max_retries:int=3,
+                 backoff_factor:float=0.5,
+                 max_backoff:float=30,
+                 status_forcelist:Iterable[int]=(429, 500, 502, 503, 504),
+                 jitter:bool=True,
+                 respect_retry_after:bool=True):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_forcelist = frozenset(status_forcelist)
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable_status(self, status_code:int)->bool:
+        return status_code in self.status_forcelist
+
+    @staticmethod
+    def parse_retry_after(value:Optional[str])->Optional[float]:
+        """Parse a `Retry-After` header given either in seconds or as an HTTP date."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def get_backoff(self, attempt:int, response:Optional[requests.Response]=None)->float:
+        """Seconds to sleep before retry number `attempt` (starting at 0)."""
+        if self.respect_retry_after and response is not None:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
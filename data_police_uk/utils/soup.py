@@ -1,7 +1,7 @@
 
 from bs4 import BeautifulSoup as bs
 import os
-from response import Response
+from .response import Response
 from nltk.stem.snowball import SnowballStemmer
 stemmer = SnowballStemmer("english")
 import re
@@ -24,6 +24,7 @@ class Soup:
         url (str): The URL of the webpage to parse.
         **kwargs: Keyword arguments passed to the underlying `Response` object.  
         These might include things like headers, timeout values, etc., depending on the implementation of `Response`.
+        Pass `transport` to fetch through a custom `Transport` instead of the shared pooled one.
 
     """
     def __init__(self, url, **kwargs):
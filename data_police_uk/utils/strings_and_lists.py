@@ -2,16 +2,10 @@ from difflib import SequenceMatcher
 from nltk.stem.snowball import SnowballStemmer
 import itertools
 import numpy as np, re
-import sys
 
 from pathlib import Path
 try:
-    parent_dir = Path(__file__).resolve().parent.parent
-    parent_dir_str = str(parent_dir)
-    if parent_dir_str not in sys.path:
-        sys.path.insert(0, parent_dir_str)
-    
-    from utils.log_helper import BasicLogger
+    from .log_helper import BasicLogger
     #from verbose_printer import _print
     
 except ImportError as e:
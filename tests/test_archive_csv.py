@@ -0,0 +1,71 @@
+import io
+
+import pandas as pd
+
+from data_police_uk.utils.archive_csv import (archive_kind, concat_frames, read_archive_csv,
+                                              snake_case)
+
+
+STREET_HEADER = ("Crime ID,Month,Reported by,Falls within,Longitude,Latitude,Location,"
+                 "LSOA code,LSOA name,Crime type,Last outcome category,Context\n")
+
+
+def street_csv(*crime_types):
+    rows = [f"id{i},2024-01,Force,Force,-1.1,52.6,On or near X,E0100000{i},Area {i},{crime_type},,\n"
+            for i, crime_type in enumerate(crime_types)]
+    return io.StringIO(STREET_HEADER + "".join(rows))
+
+
+def test_archive_kind_from_file_name():
+    assert archive_kind("2024-01/2024-01-leicestershire-street.csv") == "street"
+    assert archive_kind("2024-01-city-of-london-stop-and-search.csv") == "stop-and-search"
+    assert archive_kind("2024-01-met-outcomes.csv") == "outcomes"
+    assert archive_kind("README.txt") is None
+
+
+def test_snake_case():
+    assert snake_case("Last outcome category") == "last_outcome_category"
+    assert snake_case("LSOA code") == "lsoa_code"
+
+
+def test_typed_columns():
+    frame = read_archive_csv(street_csv("Burglary", "Drugs"), kind="street")
+    assert isinstance(frame["Crime type"].dtype, pd.CategoricalDtype)
+    assert frame["Longitude"].dtype == "float64"
+    assert frame["Crime ID"].dtype == "string"
+
+
+def test_unknown_crime_types_are_kept():
+    frame = read_archive_csv(street_csv("Violent crime", "Public disorder and weapons", "Burglary"),
+                             kind="street")
+    assert frame["Crime type"].isna().sum() == 0
+    assert list(frame["Crime type"]) == ["Violent crime", "Public disorder and weapons", "Burglary"]
+
+
+def test_stop_and_search_dates_and_flags():
+    source = io.StringIO(
+        "Type,Date,Part of a policing operation,Latitude,Longitude,Outcome linked to object of search\n"
+        "Person search,2024-01-05T10:00:00+00:00,False,52.6,-1.1,True\n"
+        "Person search,2024-01-06T11:00:00+01:00,,52.6,-1.1,\n"
+    )
+    frame = read_archive_csv(source, kind="stop-and-search", rename=True)
+    assert str(frame["date"].dt.tz) == "UTC"
+    assert frame["date"].iloc[1] == pd.Timestamp("2024-01-06T10:00:00Z")
+    assert frame["part_of_a_policing_operation"].dtype == "boolean"
+    assert frame["part_of_a_policing_operation"].isna().iloc[1]
+
+
+def test_chunks_and_columns():
+    chunks = list(read_archive_csv(street_csv("Burglary", "Drugs", "Robbery"), kind="street",
+                                   columns=["Crime type", "LSOA code"], chunksize=2))
+    assert [len(x) for x in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["LSOA code", "Crime type"]
+
+
+def test_concat_frames_unions_categories():
+    first = read_archive_csv(street_csv("Burglary"), kind="street")
+    second = read_archive_csv(street_csv("Violent crime"), kind="street")
+    frame = concat_frames([first, second])
+    assert isinstance(frame["Crime type"].dtype, pd.CategoricalDtype)
+    assert set(frame["Crime type"].cat.categories) == {"Burglary", "Violent crime"}
+    assert list(frame.columns) == list(first.columns)
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from data_police_uk.async_datapopy import AsyncDataPoliceUK
+
+
+class FakeClient:
+    _transport = None
+
+    def __init__(self):
+        self.threads = []
+
+    def get_value(self, x):
+        self.threads.append(threading.get_ident())
+        return x * 2
+
+    def iter_values(self, n):
+        for i in range(n):
+            self.threads.append(threading.get_ident())
+            yield i
+
+    def iter_wrapped(self, n):
+        # Not a generator function itself, like the `iter_*_for_months` helpers
+        return self.iter_values(n)
+
+    @property
+    def NAME(self):
+        return "fake"
+
+
+class AsyncFake(AsyncDataPoliceUK):
+    _client_class = FakeClient
+
+
+def run(coroutine_function):
+    return asyncio.run(coroutine_function())
+
+
+def test_generator_methods_are_pulled_off_the_event_loop():
+    async def main():
+        async with AsyncFake() as client:
+            loop_thread = threading.get_ident()
+            items = [x async for x in client.iter_values(3)]
+            wrapped = [x async for x in client.iter_wrapped(2)]
+            return loop_thread, items, wrapped, (await client.get_client()).threads
+
+    loop_thread, items, wrapped, threads = run(main)
+    assert items == [0, 1, 2]
+    assert wrapped == [0, 1]
+    assert len(threads) == 5
+    assert loop_thread not in threads
+
+
+def test_awaiting_a_generator_method_gives_an_async_iterator():
+    async def main():
+        async with AsyncFake() as client:
+            iterator = await client.iter_values(2)
+            return [x async for x in iterator]
+
+    assert run(main) == [0, 1]
+
+
+def test_plain_methods_properties_and_map():
+    async def main():
+        async with AsyncFake(max_concurrency=4) as client:
+            value = await client.get_value(2)
+            name = await client.NAME
+            mapped = await client.map("get_value", [1, 2, 3])
+            gathered = await client.gather(client.get_value(5), client.get_value(6))
+            return value, name, mapped, gathered
+
+    assert run(main) == (4, "fake", [2, 4, 6], [10, 12])
+
+
+def test_iterating_a_plain_method_raises():
+    async def main():
+        async with AsyncFake() as client:
+            async for _ in client.get_value(1):
+                pass
+
+    with pytest.raises(TypeError):
+        run(main)
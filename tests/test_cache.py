@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+
+import pytest
+
+from data_police_uk.utils.cache import REFERENCE_CACHE, ResponseCache, TTLCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_and_stats(cache):
+    key = ResponseCache.make_key("https://data.police.uk/api/crimes-street/all-crime", {"date": "2024-01"})
+    assert cache.get(key, version="2024-03-01") is None
+    cache.set(key, b'[{"id": 1}]', version="2024-03-01")
+    assert cache.get(key, version="2024-03-01") == b'[{"id": 1}]'
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_equivalent_requests_share_a_key():
+    url = "https://data.police.uk/api/crimes-street/all-crime"
+    assert (ResponseCache.make_key(url, {"lng": -1.13, "lat": 52.63, "date": None})
+            == ResponseCache.make_key(url + "/", {"lat": 52.63, "lng": -1.13}))
+    assert (ResponseCache.make_key(url, {"poly": ["52.2, 0.5", "52.3,0.6"]})
+            == ResponseCache.make_key(url, {"poly": "52.2,0.5:52.3,0.6"}))
+    assert ResponseCache.make_key(url, {"date": "2024-01"}) != ResponseCache.make_key(url, {"date": "2024-02"})
+
+
+def test_new_release_drops_the_entry(cache):
+    cache.set("key", b"old", version="2024-02-01")
+    assert cache.get("key", version="2024-03-01") is None
+    assert cache.get("key", version="2024-02-01") is None
+
+
+def test_invalidate_keeps_the_current_version(cache):
+    cache.set("old", b"1", version="2024-02-01")
+    cache.set("new", b"2", version="2024-03-01")
+    assert cache.invalidate("2024-03-01") == 1
+    assert cache.get("new", version="2024-03-01") == b"2"
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path, max_size_bytes=2500)
+    try:
+        for key in ("a", "b"):
+            cache.set(key, os.urandom(1000))
+        cache.get("a")
+        cache.set("c", os.urandom(1000))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+    finally:
+        cache.close()
+
+
+def test_shared_between_instances(tmp_path):
+    first, second = ResponseCache(tmp_path), ResponseCache(tmp_path)
+    try:
+        first.set("key", b"body")
+        assert second.get("key") == b"body"
+    finally:
+        first.close()
+        second.close()
+
+
+def test_ttl_entries_expire():
+    cache = TTLCache(ttl=60)
+    cache.set("forces", ["leicestershire"])
+    cache.set("short", 1, ttl=-1)
+    assert cache.get("forces") == ["leicestershire"]
+    assert cache.get("short", "gone") == "gone"
+
+
+def test_get_or_set_loads_once_across_threads():
+    cache = TTLCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    threads = [threading.Thread(target=cache.get_or_set, args=("key", loader)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert cache.get("key") == "value"
+
+
+def test_get_or_set_does_not_cache_none():
+    cache = TTLCache()
+    calls = []
+    for _ in range(2):
+        cache.get_or_set("key", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_invalidate_one_key_or_all():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert (cache.get("a"), cache.get("b")) == (None, 2)
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_reference_cache_is_process_wide():
+    from data_police_uk import datapopy
+    assert datapopy.REFERENCE_CACHE is REFERENCE_CACHE
@@ -0,0 +1,54 @@
+import threading
+import time
+
+from data_police_uk.utils.concurrency import map_concurrently
+
+
+def test_results_and_errors_are_paired_with_items():
+    def func(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return x * 10
+
+    results = {item: (result, error) for item, result, error in map_concurrently(func, range(5), max_workers=3)}
+    assert {x: results[x][0] for x in (0, 1, 2, 4)} == {0: 0, 1: 10, 2: 20, 4: 40}
+    assert isinstance(results[3][1], ValueError)
+    assert results[3][0] is None
+
+
+def test_runs_concurrently_up_to_max_workers():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def func(x):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    list(map_concurrently(func, range(8), max_workers=4))
+    assert peak[0] == 4
+
+
+def test_progress_and_empty_input():
+    calls = []
+    list(map_concurrently(lambda x: x, "abc", progress=lambda *args: calls.append(args)))
+    assert [x[0] for x in calls] == [1, 2, 3]
+    assert all(x[1] == 3 and x[3] is None for x in calls)
+    assert list(map_concurrently(lambda x: x, [])) == []
+
+
+def test_abandoning_the_generator_cancels_queued_work():
+    started = []
+
+    def func(x):
+        started.append(x)
+        time.sleep(0.02)
+        return x
+
+    results = map_concurrently(func, range(50), max_workers=2)
+    next(results)
+    results.close()
+    assert len(started) < 50
@@ -0,0 +1,61 @@
+import zipfile
+
+import pytest
+
+from data_police_uk.utils.extract_zip_file import ExtractZipFile
+
+MONTHS = [f"2024-{x:02d}" for x in range(1, 13)]
+FORCES = [f"force-{x:02d}" for x in range(40)]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for month in MONTHS:
+            for force in FORCES:
+                for kind in ("street", "outcomes"):
+                    archive.writestr(f"{month}/{month}-{force}-{kind}.csv", f"Crime ID,Month\nx,{month}\n")
+        archive.writestr("README.txt", "not a csv")
+    return path
+
+
+def test_parse_member_name():
+    assert ExtractZipFile.parse_member_name("2024-01/2024-01-city-of-london-stop-and-search.csv") == {
+        "month": "2024-01", "force": "city-of-london", "kind": "stop-and-search"}
+    assert ExtractZipFile.parse_member_name("README.txt") == {"month": None, "force": None, "kind": None}
+
+
+def test_select_members(archive_path):
+    zip_file = ExtractZipFile("", "unused", archive_path=archive_path)
+    assert len(zip_file.select_members()) == 12 * 40 * 2 + 1
+    assert len(zip_file.select_members(forces=["force-01"], months=["2024-03"])) == 2
+    assert len(zip_file.select_members(pattern="*-street.csv", months=MONTHS[:2])) == 80
+
+
+def test_parallel_extraction_into_shared_month_folders(tmp_path, archive_path):
+    # Many workers writing into each new month folder at once
+    for attempt in range(5):
+        destination = tmp_path / f"out{attempt}"
+        zip_file = ExtractZipFile("", destination, archive_path=archive_path)
+        manifest = zip_file.extract(kinds=["street", "outcomes"], max_workers=16)
+        assert len(manifest) == 12 * 40 * 2
+        assert all(x["path"].read_text().endswith(f"{x['month']}\n") for x in manifest)
+        assert sorted(x.name for x in destination.iterdir()) == MONTHS
+
+
+def test_extract_to_another_destination(tmp_path, archive_path):
+    zip_file = ExtractZipFile("", tmp_path / "unused", archive_path=archive_path)
+    manifest = zip_file.extract(forces=["force-07"], kinds=["street"], destination=tmp_path / "force-07",
+                                max_workers=4)
+    assert [x["path"].relative_to(tmp_path).as_posix() for x in manifest][:2] == [
+        "force-07/2024-01/2024-01-force-07-street.csv", "force-07/2024-02/2024-02-force-07-street.csv"]
+    assert zip_file.manifest == manifest
+
+
+def test_unsafe_member_names_stay_inside_the_destination(tmp_path):
+    path = tmp_path / "unsafe.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("../../2024-01/2024-01-x-street.csv", "a\n")
+    manifest = ExtractZipFile("", tmp_path / "out", archive_path=path).extract()
+    assert manifest[0]["path"] == tmp_path / "out" / "2024-01" / "2024-01-x-street.csv"
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from data_police_uk.utils.json_stream import iter_json_array
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+DOCUMENT = [
+    {"category": "burglary", "location": {"latitude": "52.6", "street": {"name": "On or near Café Street"}}},
+    -500.25,
+    12,
+    "text with ] and , inside",
+    None,
+    True,
+    [1, [2, 3]],
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+def test_elements_survive_any_chunk_boundary(size):
+    body = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+    assert list(iter_json_array(chunked(body, size))) == DOCUMENT
+
+
+def test_elements_are_yielded_before_the_body_ends():
+    def chunks():
+        yield b'[{"id": 1}, '
+        yield b'{"id": 2}'
+        raise AssertionError("read past the first element")
+
+    assert next(iter_json_array(chunks())) == {"id": 1}
+
+
+def test_empty_array_and_empty_body():
+    assert list(iter_json_array([b"  [ ] "])) == []
+    assert list(iter_json_array([b""])) == []
+
+
+def test_non_array_documents():
+    assert list(iter_json_array([b'{"error"', b': "x"}'])) == [{"error": "x"}]
+    assert list(iter_json_array([b"null"])) == []
+
+
+@pytest.mark.parametrize("body", [b"[1, 2", b"[1 2]", b"[1,, 2]", b'[{"a": ]'])
+def test_invalid_json_raises(body):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(chunked(body, 2)))
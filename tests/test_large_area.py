@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import requests
+import shapely
+
+from data_police_uk.datapopy import CrimesData
+from data_police_uk.utils.retry import HTTPStatusError, RequestFailed, RetryPolicy
+
+URL = "https://data.police.uk/api/crimes-street/all-crime"
+AREA = [[52.5, -1.3], [52.5, -1.0], [52.7, -1.0], [52.7, -1.3]]
+
+
+def unavailable(url):
+    response = requests.Response()
+    response.status_code = 503
+    return HTTPStatusError(f"503 for url: {url}", url=url, response=response)
+
+
+def polygon_from_param(poly):
+    return shapely.geometry.Polygon([tuple(map(float, x.split(",")))[::-1] for x in poly.split(":")])
+
+
+class FakeCrimes(CrimesData):
+    """Answers custom-area requests from a fixed set of points, with the API's 10,000 cap."""
+    def __init__(self, points=None, down=False, **kwargs):
+        super().__init__(retry=RetryPolicy(max_retries=0, backoff_factor=0), **kwargs)
+        self.points = points if points is not None else np.empty((0, 2))
+        self.down = down
+        self.calls = 0
+
+    def get_response(self, url, raise_errors=None, params=None, **kwargs):
+        self.calls += 1
+        if self.down:
+            raise unavailable(url)
+        minx, miny, maxx, maxy = polygon_from_param(params["poly"]).bounds
+        lng, lat = self.points[:, 0], self.points[:, 1]
+        # Half-open boxes so points on a shared edge are counted once
+        inside = np.flatnonzero((lng >= minx) & (lng < maxx) & (lat >= miny) & (lat < maxy))
+        if len(inside) > 10_000:
+            raise unavailable(url)
+        return [{"id": int(x)} for x in inside] or None
+
+
+def uniform_points(count):
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.uniform(-1.3, -1.0, count), rng.uniform(52.5, 52.7, count)])
+
+
+def test_dense_area_is_split_until_every_piece_fits():
+    client = FakeCrimes(uniform_points(50_000))
+    crimes = client._get_crimes_for_large_area(URL, AREA, "2024-01")
+    assert len(crimes) == 50_000
+
+
+def test_outage_stops_after_one_probe():
+    client = FakeCrimes(down=True)
+    with pytest.raises(RequestFailed, match="unavailable"):
+        client._get_crimes_for_large_area(URL, AREA, "2024-01")
+    # The area and the probe, each confirmed once
+    assert client.calls == 4
+
+
+def test_outage_without_raise_errors_returns_none():
+    client = FakeCrimes(down=True, raise_errors=False)
+    assert client._get_crimes_for_large_area(URL, AREA, "2024-01") is None
@@ -0,0 +1,71 @@
+import zipfile
+
+import numpy as np
+import pytest
+import shapely
+
+from data_police_uk.utils.locator import NeighborhoodLocator, parse_kml_coordinates, parse_kml_polygons
+
+
+def square_kml(x0, y0, size=1.0, hole=None):
+    def ring(x, y, s):
+        return " ".join(f"{a},{b},0" for a, b in ((x, y), (x + s, y), (x + s, y + s), (x, y + s), (x, y)))
+
+    inner = (f"<innerBoundaryIs><LinearRing><coordinates>{ring(*hole)}</coordinates></LinearRing></innerBoundaryIs>"
+             if hole else "")
+    return ('<?xml version="1.0" encoding="UTF-8"?><kml xmlns="http://www.opengis.net/kml/2.2"><Placemark>'
+            f"<Polygon><outerBoundaryIs><LinearRing><coordinates>{ring(x0, y0, size)}</coordinates>"
+            f"</LinearRing></outerBoundaryIs>{inner}</Polygon></Placemark></kml>")
+
+
+def test_parse_kml_coordinates_drops_altitude():
+    vertices = parse_kml_coordinates("-1.1,52.6,0 -1.2,52.7,0\n-1.3,52.8,0")
+    assert vertices.tolist() == [[-1.1, 52.6], [-1.2, 52.7], [-1.3, 52.8]]
+    assert parse_kml_coordinates("  ").shape == (0, 2)
+
+
+def test_parse_kml_polygons_keeps_holes():
+    polygon = parse_kml_polygons(square_kml(0, 0, 4, hole=(1, 1, 2)))
+    assert polygon.area == pytest.approx(12)
+    assert parse_kml_polygons("<kml/>") is None
+
+
+@pytest.fixture
+def locator():
+    squares = [shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1), shapely.box(5, 5, 6, 6)]
+    return NeighborhoodLocator(["a", "a", "b"], ["a1", "a2", "b1"], squares)
+
+
+def test_locate_batches(locator):
+    forces, neighborhoods = locator.locate([0.5, 0.5, 5.5, 10, np.nan], [0.5, 1.5, 5.5, 10, 0])
+    assert forces.tolist() == ["a", "a", "b", None, None]
+    assert neighborhoods.tolist() == ["a1", "a2", "b1", None, None]
+
+
+def test_shared_border_gets_one_neighbourhood(locator):
+    _, neighborhoods = locator.locate([0.5], [1.0])
+    assert neighborhoods[0] in ("a1", "a2")
+
+
+def test_locate_point_and_validation(locator):
+    assert locator.locate_point("5.5", "5.5") == {"force": "b", "neighbourhood": "b1"}
+    assert locator.locate_point(20, 20) is None
+    with pytest.raises(ValueError):
+        locator.locate([1, 2], [1])
+    with pytest.raises(ValueError):
+        NeighborhoodLocator(["a"], [], [])
+
+
+def test_from_kml_archive_zip_and_folder(tmp_path):
+    archive = tmp_path / "boundaries.zip"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("leicestershire/NC01.kml", square_kml(-1.2, 52.6, 0.1))
+        z.writestr("leicestershire/NC02.kml", square_kml(-1.1, 52.6, 0.1))
+        z.writestr("metropolitan/E05.kml", square_kml(-0.1, 51.5, 0.1))
+    locator = NeighborhoodLocator.from_kml_archive(archive, forces=["leicestershire"])
+    assert len(locator) == 2
+    assert locator.locate_point(52.65, -1.05) == {"force": "leicestershire", "neighbourhood": "NC02"}
+
+    folder = tmp_path / "extracted"
+    zipfile.ZipFile(archive).extractall(folder)
+    assert len(NeighborhoodLocator.from_kml_archive(folder)) == 3
@@ -0,0 +1,56 @@
+import pytest
+
+from data_police_uk.utils.parquet_store import ArchiveParquetStore
+
+pytest.importorskip("pyarrow")
+
+HEADER = ("Crime ID,Month,Reported by,Falls within,Longitude,Latitude,Location,"
+          "LSOA code,LSOA name,Crime type,Last outcome category,Context\n")
+
+
+def write_street_csv(folder, month, force, lsoa_count, outcome="Under investigation"):
+    path = folder / month / f"{month}-{force}-street.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [f"id{i},{month},Force,Force,-1.1,52.6,On or near X,E{i:08d},Area {i},Burglary,{outcome},\n"
+            for i in range(lsoa_count)]
+    path.write_text(HEADER + "".join(rows))
+    return path
+
+
+def test_partitions_of_different_cardinality_read_back(tmp_path):
+    archive = tmp_path / "archive"
+    # 10 codes fit int8 dictionary indices, 300 need int16; the int8 partition sorts
+    # first, so the dataset schema is taken from it
+    write_street_csv(archive, "2024-01", "a-small", 10)
+    write_street_csv(archive, "2024-01", "b-large", 300)
+    write_street_csv(archive, "2024-02", "a-small", 5, outcome="")
+    store = ArchiveParquetStore(tmp_path / "store")
+    results = store.write_folder(archive)
+    assert [x["error"] for x in results] == [None, None, None]
+
+    frame = store.read(columns=["lsoa_code", "last_outcome_category", "force", "month"])
+    assert len(frame) == 315
+    assert frame["lsoa_code"].nunique() == 300
+    assert frame.groupby("force").size().to_dict() == {"a-small": 15, "b-large": 300}
+
+
+def test_partition_filters_and_skip(tmp_path):
+    archive = tmp_path / "archive"
+    write_street_csv(archive, "2024-01", "a", 3)
+    write_street_csv(archive, "2024-02", "a", 4)
+    write_street_csv(archive, "2024-02", "b", 5)
+    store = ArchiveParquetStore(tmp_path / "store")
+    store.write_folder(archive)
+
+    assert store.partitions() == [{"force": "a", "month": "2024-01"},
+                                  {"force": "a", "month": "2024-02"},
+                                  {"force": "b", "month": "2024-02"}]
+    frame = store.read(columns=["Crime type"], forces=["a"], months=["2024-02"])
+    assert len(frame) == 4
+    assert list(frame.columns) == ["crime_type"]
+    assert all(x["skipped"] for x in store.write_folder(archive))
+
+
+def test_read_missing_kind(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ArchiveParquetStore(tmp_path).read(kind="outcomes")
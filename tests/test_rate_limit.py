@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from data_police_uk.utils.rate_limit import RateLimiter
+
+
+def test_burst_is_served_without_waiting():
+    limiter = RateLimiter(rate=10, burst=5)
+    assert [limiter.acquire() for _ in range(5)] == [0.0] * 5
+    assert limiter.stats()["waited"] == 0
+
+
+def test_waits_once_the_bucket_is_empty():
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+    for _ in range(7):
+        limiter.acquire()
+    # 5 tokens beyond the burst at 50 per second
+    assert time.monotonic() - start >= 0.09
+    stats = limiter.stats()
+    assert stats["acquired"] == 7
+    assert stats["waited"] == 5
+    # Sequential callers each wait one refill interval
+    assert stats["max_wait"] == pytest.approx(0.02, abs=0.01)
+
+
+def test_threads_share_one_budget():
+    limiter = RateLimiter(rate=100, burst=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert limiter.acquired == 20
+    assert time.monotonic() - start >= 0.18
+
+
+def test_acquire_async():
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def main():
+        return await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+    waits = asyncio.run(main())
+    assert waits[0] == 0.0
+    assert sorted(waits)[-1] == pytest.approx(0.02, abs=0.005)
+
+
+def test_reset_stats_and_validation():
+    limiter = RateLimiter(rate=1000, burst=1)
+    limiter.acquire()
+    limiter.acquire()
+    limiter.reset_stats()
+    assert limiter.stats()["acquired"] == 0
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(burst=0)
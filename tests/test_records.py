@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_police_uk.utils.records import (CategoricalColumn, CrimeRecords, StopSearchRecords,
+                                          flatten_record)
+
+
+CRIMES = [
+    {"category": "burglary", "id": 1, "month": "2024-01", "context": "",
+     "location": {"latitude": "52.63", "longitude": "-1.13", "street": {"id": 11, "name": "On or near A"}},
+     "outcome_status": {"category": "Under investigation", "date": "2024-01"}},
+    {"category": "drugs", "id": 2, "month": "2024-01", "context": "",
+     "location": {"latitude": "52.64", "longitude": "-1.14", "street": {"id": 12, "name": "On or near B"}},
+     "outcome_status": None},
+    {"category": "burglary", "id": 3, "month": "2024-01", "context": "",
+     "location": None,
+     "outcome_status": None},
+]
+
+
+def test_flatten_record():
+    assert flatten_record({"a": {"b": {"c": 1}}, "d": 2}) == {"a_b_c": 1, "d": 2}
+
+
+def test_categorical_column_round_trip():
+    column = CategoricalColumn.from_values(["x", None, "y", "x"])
+    assert column.codes.tolist() == [0, -1, 1, 0]
+    assert column.to_numpy().tolist() == ["x", None, "y", "x"]
+
+
+def test_crime_records_are_typed():
+    records = CrimeRecords.from_records(CRIMES)
+    assert len(records) == 3
+    assert records["id"].dtype == np.int64
+    assert records["location_latitude"].dtype == np.float64
+    assert np.isnan(records["location_latitude"][2])
+    assert records["outcome_status_category"].tolist() == ["Under investigation", None, None]
+    # The sometimes-null parents are dropped in favour of their children
+    assert "outcome_status" not in records.columns
+    assert "location" not in records.columns
+
+
+def test_to_pandas_and_to_records():
+    records = CrimeRecords.from_records(CRIMES)
+    frame = records.to_pandas()
+    assert isinstance(frame["category"].dtype, pd.CategoricalDtype)
+    assert frame["category"].tolist() == ["burglary", "drugs", "burglary"]
+    assert records.to_records()[1]["location_street_name"] == "On or near B"
+
+
+def test_stop_search_datetimes_and_empty_input():
+    records = StopSearchRecords.from_records([{"datetime": "2024-01-05T10:30:00+00:00", "type": "Person search"},
+                                              {"datetime": None, "type": "Person search"}])
+    assert records["datetime"].dtype == np.dtype("datetime64[s]")
+    assert np.isnat(records["datetime"][1])
+    assert len(StopSearchRecords.from_records(None)) == 0
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = CrimeRecords.from_records(CRIMES).to_arrow()
+    assert table.num_rows == 3
+    assert pa.types.is_dictionary(table.schema.field("category").type)
+    assert table.column("outcome_status_category").null_count == 2
+
+
+def test_points_skip_missing_coordinates():
+    points = CrimeRecords.from_records(CRIMES).points()
+    assert (points[0].x, points[0].y) == (-1.13, 52.63)
+    assert points[2] is None
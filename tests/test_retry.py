@@ -0,0 +1,65 @@
+import datetime
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from data_police_uk.utils.retry import (DeadlineExceeded, HTTPStatusError, RequestFailed,
+                                        RetriesExhausted, RetryPolicy)
+
+
+def response(status_code=503, headers=None):
+    result = requests.Response()
+    result.status_code = status_code
+    result.headers.update(headers or {})
+    return result
+
+
+def test_retry_after_seconds_takes_precedence():
+    policy = RetryPolicy(backoff_factor=100)
+    assert policy.get_backoff(3, response(headers={"Retry-After": "7"})) == 7.0
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+    delay = RetryPolicy.parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 28 <= delay <= 30
+
+
+def test_retry_after_in_the_past_or_invalid():
+    assert RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert RetryPolicy.parse_retry_after("soon") is None
+    assert RetryPolicy.parse_retry_after(None) is None
+
+
+def test_retry_after_can_be_ignored():
+    policy = RetryPolicy(backoff_factor=1, jitter=False, respect_retry_after=False)
+    assert policy.get_backoff(2, response(headers={"Retry-After": "120"})) == 4
+
+
+def test_exponential_backoff_is_capped():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    assert [policy.get_backoff(x) for x in range(5)] == [0.5, 1, 2, 3, 3]
+
+
+def test_full_jitter_stays_in_range():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=8)
+    assert all(0 <= policy.get_backoff(3) <= 8 for _ in range(100))
+
+
+def test_retryable_status_codes():
+    policy = RetryPolicy()
+    assert policy.is_retryable_status(429)
+    assert policy.is_retryable_status(503)
+    assert not policy.is_retryable_status(404)
+    assert RetryPolicy(status_forcelist=[404]).is_retryable_status(404)
+
+
+def test_error_hierarchy():
+    error = RetriesExhausted("gave up", url="http://x", attempts=4, response=response(429))
+    assert isinstance(error, RequestFailed)
+    assert isinstance(error, requests.RequestException)
+    assert (error.url, error.attempts, error.status_code) == ("http://x", 4, 429)
+    assert HTTPStatusError("not found", response=response(404)).status_code == 404
+    assert issubclass(HTTPStatusError, requests.HTTPError)
+    assert issubclass(DeadlineExceeded, RequestFailed)
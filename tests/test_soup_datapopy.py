@@ -0,0 +1,115 @@
+import datetime
+import json
+import zipfile
+
+import pytest
+
+import data_police_uk.soup_datapopy as soup_datapopy
+from data_police_uk.soup_datapopy import CustomDownload
+from data_police_uk.utils.cache import REFERENCE_CACHE
+from data_police_uk.utils.extract_zip_file import ExtractZipFile
+
+DATA_URL = "https://data.police.uk/data"
+
+
+def form_options(months):
+    texts = {x: datetime.datetime.strptime(x, "%Y-%m").strftime("%B %Y") for x in months}
+    return {"url": DATA_URL, "from_dates": texts, "to_dates": texts,
+            "forces": [{"force_name": name, "force_id": name.lower(), "option_id": f"id_forces_{i}"}
+                       for i, name in enumerate(["Alpha", "Bravo", "Charlie"])]}
+
+
+class Archives:
+    """Zip files served in place of real downloads, keyed by download URL."""
+    def __init__(self, folder):
+        self.folder = folder
+        self.paths = {}
+        self.requested = []
+
+    def add(self, url, members):
+        path = self.folder / f"{len(self.paths)}.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            for member in members:
+                archive.writestr(member, "Crime ID,Month\nx,1\n")
+        self.paths[url] = path
+
+    def url_for(self, *args, **kwargs):
+        forces = args[4]
+        self.requested.append(forces)
+        return "packed" if isinstance(forces, list) else forces
+
+
+@pytest.fixture
+def downloader(tmp_path, monkeypatch):
+    archives = Archives(tmp_path)
+
+    class FakeZip(ExtractZipFile):
+        def __init__(self, url, extract_to_folder, transport=None, **kwargs):
+            super().__init__(url, extract_to_folder, transport=transport, archive_path=archives.paths[url])
+
+    monkeypatch.setattr(soup_datapopy, "ExtractZipFile", FakeZip)
+    downloader = CustomDownload()
+    downloader.get_download_url = archives.url_for
+    downloader.archives = archives
+    downloader.release = lambda months: REFERENCE_CACHE.set(
+        ("form-options", DATA_URL), CustomDownload._index_form_options(form_options(months)))
+    downloader.release(["2024-01", "2024-02"])
+    yield downloader
+    REFERENCE_CACHE.invalidate(("form-options", DATA_URL))
+
+
+def manifest(folder):
+    with open(folder / "manifest.json") as f:
+        return json.load(f)
+
+
+def test_manifest_records_only_kinds_with_files(downloader, tmp_path):
+    folder = tmp_path / "data" / "alpha"
+    files = [{"month": "2024-01", "kind": "street", "path": folder / "2024-01" / "2024-01-alpha-street.csv"}]
+    result = downloader._update_folder_manifest(folder, "alpha", files, ["2024-01", "2024-02"],
+                                                ["street", "stop-and-search"])
+    assert list(result["months"]) == ["2024-01"]
+    assert result["months"]["2024-01"]["kinds"] == ["street"]
+    assert result["unpublished"]["2024-01"]["kinds"] == ["stop-and-search"]
+    assert result["unpublished"]["2024-02"]["kinds"] == ["stop-and-search", "street"]
+    assert result["unpublished"]["2024-02"]["release"] == "2024-02"
+    assert manifest(folder) == json.loads(json.dumps(result, default=str))
+
+
+def test_unpublished_months_wait_for_a_new_release(downloader, tmp_path):
+    data = tmp_path / "data"
+    downloader.archives.add("alpha", ["2024-01/2024-01-alpha-street.csv", "2024-02/2024-02-alpha-street.csv"])
+    summary = downloader.sync_crimes_data("alpha", include_stop_search_data=True, data_folder=str(data))
+    assert summary["downloaded"] == ["2024-01", "2024-02"]
+
+    # Alpha never publishes stop and searches: nothing to fetch until the next release
+    assert downloader.get_missing_months("alpha", include_stop_search_data=True, data_folder=str(data)) == []
+    assert downloader.sync_crimes_data("alpha", include_stop_search_data=True,
+                                       data_folder=str(data))["downloaded"] == []
+    assert downloader.archives.requested == ["alpha"]
+
+    # A kind that was never requested is still missing
+    assert downloader.get_missing_months("alpha", include_outcomes_data=True,
+                                         data_folder=str(data)) == ["2024-01", "2024-02"]
+
+    # A new release re-checks the unpublished months along with the new one
+    downloader.release(["2024-01", "2024-02", "2024-03"])
+    assert downloader.get_missing_months("alpha", include_stop_search_data=True,
+                                         data_folder=str(data)) == ["2024-01", "2024-02", "2024-03"]
+
+
+def test_packed_download_retries_forces_left_out(downloader, tmp_path):
+    data = tmp_path / "data"
+    archives = downloader.archives
+    archives.add("packed", ["2024-01/2024-01-alpha-street.csv", "2024-02/2024-02-alpha-street.csv",
+                            "2024-01/2024-01-charlie-street.csv"])
+    archives.add("bravo", [])
+    archives.add("charlie", ["2024-01/2024-01-charlie-street.csv"])
+    report = downloader.get_crimes_data_for_forces("January", "2024", "February", "2024", forces="all",
+                                                   data_folder=str(data))
+    assert {x: y["status"] for x, y in report.items()} == {"alpha": "ok", "bravo": "empty", "charlie": "ok"}
+    assert archives.requested == [["alpha", "bravo", "charlie"], "bravo"]
+    # An empty result leaves no manifest behind
+    assert not (data / "bravo" / "manifest.json").exists()
+    assert list(manifest(data / "charlie")["months"]) == ["2024-01"]
+    assert downloader.get_missing_months("bravo", data_folder=str(data)) == ["2024-01", "2024-02"]